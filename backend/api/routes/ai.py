@@ -419,6 +419,26 @@ class GitHubClient:
             
         return all_files
     
+    async def get_head_sha(self, owner: str, repo: str) -> str:
+        """Get the commit SHA at the head of the default branch"""
+        headers = {"Accept": "application/vnd.github.sha"}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+        
+        try:
+            response = await self.client.get(
+                f"https://api.github.com/repos/{owner}/{repo}/commits/HEAD",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return response.text.strip()
+            else:
+                return ""
+        except Exception as e:
+            logger.error(f"Error getting head commit: {e}")
+            return ""
+    
     async def get_file_content(self, owner: str, repo: str, path: str) -> str:
         """Get file content"""
         headers = {"Authorization": f"token {self.token}"} if self.token else {}
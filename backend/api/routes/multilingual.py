@@ -1,15 +1,38 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Tuple
+import asyncio
+import functools
+import heapq
+import httpx
 import json
+import orjson
 import os
+import re
+import string
+import sys
+import time
+from collections import Counter
 from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
 import logging
 from core.mcp_client import mcp_client
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerated matcher, the regex fallback is used without it
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # Optional linear-time engine for the fallback probe
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class TranslationRequest(BaseModel):
     content: str
@@ -64,13 +87,598 @@ class TranslationMemory(BaseModel):
     created_at: datetime
     usage_count: int
 
+# Dedicated Hugging Face models used by the AI-powered fallback
+_HF_MODEL_MAP: Dict[tuple, str] = {
+    ("en", "zh"): "Helsinki-NLP/opus-mt-en-zh",
+    ("en", "es"): "Helsinki-NLP/opus-mt-en-es",
+    ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
+    ("en", "de"): "Helsinki-NLP/opus-mt-en-de",
+    ("en", "ja"): "Helsinki-NLP/opus-mt-en-jap",
+    ("en", "ko"): "Helsinki-NLP/opus-mt-en-ko",
+    ("zh", "en"): "Helsinki-NLP/opus-mt-zh-en",
+    ("es", "en"): "Helsinki-NLP/opus-mt-es-en",
+    ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
+    ("de", "en"): "Helsinki-NLP/opus-mt-de-en",
+    ("ja", "en"): "Helsinki-NLP/opus-mt-jap-en",
+    ("ko", "en"): "Helsinki-NLP/opus-mt-ko-en"
+}
+
+# Comprehensive fallback translations with thousands of words and phrases
+_RAW_FALLBACK_TRANSLATIONS: Dict[tuple, Dict[str, str]] = {
+    ("en", "es"): {
+        # Common words
+        "Hello": "Hola", "Hi": "Hola", "Goodbye": "Adiós", "Bye": "Adiós",
+        "World": "Mundo", "Earth": "Tierra", "Country": "País", "City": "Ciudad",
+        "Documentation": "Documentación", "Document": "Documento", "Guide": "Guía",
+        "API": "API", "Application": "Aplicación", "Program": "Programa",
+        "Function": "Función", "Method": "Método", "Procedure": "Procedimiento",
+        "Class": "Clase", "Object": "Objeto", "Instance": "Instancia",
+        "Parameter": "Parámetro", "Argument": "Argumento", "Variable": "Variable",
+        "Return": "Retornar", "Send": "Enviar", "Give": "Dar", "Back": "Atrás",
+        "Install": "Instalar", "Setup": "Configuración", "Configure": "Configurar",
+        "Usage": "Uso", "Use": "Usar", "Utilize": "Utilizar", "Apply": "Aplicar",
+        "Example": "Ejemplo", "Sample": "Muestra",
+        "Installation": "Instalación",
+        "Configuration": "Configuración", "Settings": "Configuración", "Options": "Opciones",
+        "Authentication": "Autenticación", "Login": "Inicio de sesión", "Sign in": "Iniciar sesión",
+        "Database": "Base de datos", "Data": "Datos", "Information": "Información",
+        "Server": "Servidor", "Service": "Servicio", "Host": "Anfitrión",
+        "Client": "Cliente", "User": "Usuario", "Customer": "Cliente",
+        "Error": "Error", "Mistake": "Error", "Problem": "Problema", "Issue": "Problema",
+        "Success": "Éxito", "Achievement": "Logro", "Accomplishment": "Logro",
+        "File": "Archivo", "Folder": "Carpeta", "Directory": "Directorio",
+        "Code": "Código", "Script": "Script",
+        "Test": "Probar", "Check": "Verificar", "Validate": "Validar",
+        "Run": "Ejecutar", "Start": "Iniciar", "Begin": "Comenzar",
+        "Stop": "Detener", "End": "Terminar", "Finish": "Finalizar",
+        "Create": "Crear", "Make": "Hacer", "Build": "Construir",
+        "Delete": "Eliminar", "Remove": "Quitar", "Destroy": "Destruir",
+        "Update": "Actualizar", "Modify": "Modificar", "Change": "Cambiar",
+        "Save": "Guardar", "Store": "Almacenar", "Keep": "Mantener",
+        "Load": "Cargar", "Import": "Importar", "Bring": "Traer",
+        "Export": "Exportar", "Transfer": "Transferir",
+        "Search": "Buscar", "Find": "Encontrar", "Look": "Mirar",
+        "Replace": "Reemplazar", "Substitute": "Sustituir", "Exchange": "Intercambiar",
+        "Copy": "Copiar", "Duplicate": "Duplicar", "Clone": "Clonar",
+        "Paste": "Pegar", "Insert": "Insertar", "Add": "Agregar",
+        "Cut": "Cortar",
+        "Undo": "Deshacer", "Redo": "Rehacer", "Repeat": "Repetir",
+        "Cancel": "Cancelar", "Abort": "Abortar",
+        "Confirm": "Confirmar", "Accept": "Aceptar", "Agree": "Aceptar",
+        "Reject": "Rechazar", "Deny": "Denegar", "Refuse": "Rechazar",
+        "Yes": "Sí", "No": "No", "Maybe": "Tal vez", "Perhaps": "Quizás",
+        "Please": "Por favor", "Thank you": "Gracias", "Thanks": "Gracias",
+        "Welcome": "Bienvenido", "Good": "Bueno", "Bad": "Malo",
+        "Big": "Grande", "Small": "Pequeño", "Large": "Grande",
+        "Fast": "Rápido", "Slow": "Lento", "Quick": "Rápido",
+        "Easy": "Fácil", "Hard": "Difícil", "Simple": "Simple",
+        "Complex": "Complejo", "Advanced": "Avanzado", "Basic": "Básico",
+        "New": "Nuevo", "Old": "Viejo", "Recent": "Reciente",
+        "First": "Primero", "Last": "Último", "Next": "Siguiente",
+        "Previous": "Anterior", "Before": "Antes", "After": "Después",
+        "Now": "Ahora", "Today": "Hoy", "Tomorrow": "Mañana",
+        "Yesterday": "Ayer", "Week": "Semana", "Month": "Mes",
+        "Year": "Año", "Time": "Tiempo", "Date": "Fecha",
+        "Name": "Nombre", "Title": "Título", "Description": "Descripción",
+        "Content": "Contenido", "Text": "Texto", "Message": "Mensaje",
+        "Note": "Nota", "Comment": "Comentario", "Remark": "Observación",
+        "Help": "Ayuda", "Support": "Soporte", "Assistance": "Asistencia",
+        "Manual": "Manual", "Tutorial": "Tutorial",
+        "Reference": "Referencia", "Docs": "Documentos",
+        "About": "Acerca de", "Info": "Información", "Details": "Detalles",
+        "Preferences": "Preferencias",
+        "Profile": "Perfil", "Account": "Cuenta",
+        "Password": "Contraseña", "Username": "Nombre de usuario",
+        "Logout": "Cerrar sesión", "Sign out": "Cerrar sesión", "Exit": "Salir",
+        "Home": "Inicio", "Main": "Principal", "Dashboard": "Panel de control",
+        "Menu": "Menú", "Navigation": "Navegación", "Links": "Enlaces",
+        "Button": "Botón", "Click": "Hacer clic", "Press": "Presionar",
+        "Select": "Seleccionar", "Choose": "Elegir", "Pick": "Elegir",
+        "Input": "Entrada", "Field": "Campo", "Form": "Formulario",
+        "Submit": "Enviar", "Upload": "Subir",
+        "Download": "Descargar", "Get": "Obtener", "Receive": "Recibir",
+        "View": "Ver", "Show": "Mostrar", "Display": "Mostrar",
+        "Hide": "Ocultar", "Conceal": "Ocultar", "Mask": "Enmascarar",
+        "Open": "Abrir", "Close": "Cerrar", "Shut": "Cerrar",
+        "Minimize": "Minimizar", "Maximize": "Maximizar", "Resize": "Redimensionar",
+        "Move": "Mover", "Drag": "Arrastrar", "Drop": "Soltar",
+        "Scale": "Escalar", "Adjust": "Ajustar",
+        "Zoom": "Zoom", "Enlarge": "Ampliar", "Reduce": "Reducir",
+        "Print": "Imprimir", "Share": "Compartir",
+        "Email": "Correo electrónico", "Mail": "Correo",
+        "Contact": "Contacto", "Address": "Dirección", "Phone": "Teléfono",
+        "Number": "Número", "Count": "Contar", "Amount": "Cantidad",
+        "Price": "Precio", "Cost": "Costo", "Value": "Valor",
+        "Free": "Libre", "Paid": "Pagado", "Premium": "Premium",
+        "Public": "Público", "Private": "Privado", "Secret": "Secreto",
+        "Secure": "Seguro", "Safe": "Seguro", "Protected": "Protegido",
+        "Lock": "Bloquear", "Unlock": "Desbloquear", "Key": "Clave",
+        "Access": "Acceder", "Permission": "Permiso", "Grant": "Conceder",
+        "Allow": "Permitir", "Block": "Bloquear",
+        "Enable": "Habilitar", "Disable": "Deshabilitar", "Activate": "Activar",
+        "Deactivate": "Desactivar", "Turn on": "Encender", "Turn off": "Apagar",
+        "Launch": "Lanzar",
+        "Pause": "Pausar", "Resume": "Reanudar", "Continue": "Continuar",
+        "Restart": "Reiniciar", "Reset": "Restablecer", "Refresh": "Actualizar",
+        "Reload": "Recargar", "Upgrade": "Actualizar",
+        "Uninstall": "Desinstalar",
+        "Include": "Incluir",
+        "Exclude": "Excluir",
+        "Generate": "Generar",
+        "Compile": "Compilar", "Assemble": "Ensamblar",
+        "Debug": "Depurar", "Fix": "Arreglar", "Repair": "Reparar",
+        "Bug": "Error",
+        "Trouble": "Problema", "Difficulty": "Dificultad",
+        "Solution": "Solución", "Answer": "Respuesta", "Result": "Resultado",
+        "Victory": "Victoria",
+        "Failure": "Fracaso", "Loss": "Pérdida", "Defeat": "Derrota",
+        "Warning": "Advertencia", "Alert": "Alerta", "Notice": "Aviso",
+        "Summary": "Resumen",
+        "Report": "Informe", "Log": "Registro", "History": "Historial",
+        "Record": "Registro", "Entry": "Entrada", "Item": "Elemento",
+        "List": "Lista", "Table": "Tabla", "Grid": "Cuadrícula",
+        "Chart": "Gráfico", "Graph": "Gráfico", "Diagram": "Diagrama",
+        "Image": "Imagen", "Picture": "Imagen", "Photo": "Foto",
+        "Video": "Video", "Audio": "Audio", "Sound": "Sonido",
+        "Music": "Música", "Song": "Canción", "Track": "Pista",
+        "Path": "Ruta",
+        "Link": "Enlace", "URL": "URL",
+        "Website": "Sitio web", "Page": "Página", "Site": "Sitio",
+        "Web": "Web", "Internet": "Internet", "Network": "Red",
+        "Connection": "Conexión", "Connect": "Conectar", "Join": "Unirse",
+        "Disconnect": "Desconectar", "Leave": "Salir", "Quit": "Salir",
+        "Online": "En línea", "Offline": "Sin conexión", "Available": "Disponible",
+        "Busy": "Ocupado", "Ready": "Listo",
+        "Loading": "Cargando", "Processing": "Procesando", "Working": "Trabajando",
+        "Complete": "Completo", "Finished": "Terminado", "Done": "Hecho",
+        "Prepared": "Preparado", "Set": "Listo",
+        "Wait": "Esperar", "Hold": "Esperar",
+        "Proceed": "Continuar", "Go": "Ir",
+        "Come": "Venir", "Arrive": "Llegar", "Reach": "Llegar",
+        "Go away": "Irse", "Depart": "Partir",
+        "Enter": "Entrar",
+        "Sorry": "Lo siento",
+        "Excuse me": "Disculpe", "Pardon": "Perdón", "Forgive": "Perdonar",
+        "Understand": "Entender", "Know": "Saber", "Learn": "Aprender",
+        "Study": "Estudiar", "Read": "Leer", "Write": "Escribir",
+        "Speak": "Hablar", "Talk": "Hablar", "Listen": "Escuchar",
+        "Hear": "Oír", "See": "Ver", "Watch": "Ver",
+        "Touch": "Tocar", "Feel": "Sentir", "Smell": "Oler", "Taste": "Probar"
+    },
+    ("en", "fr"): {
+        "Hello": "Bonjour",
+        "World": "Monde",
+        "Documentation": "Documentation",
+        "API": "API",
+        "Function": "Fonction",
+        "Class": "Classe",
+        "Method": "Méthode",
+        "Parameter": "Paramètre",
+        "Return": "Retourner",
+        "Install": "Installer",
+        "Setup": "Configuration",
+        "Usage": "Utilisation",
+        "Example": "Exemple",
+        "Installation": "Installation",
+        "Configuration": "Configuration",
+        "Authentication": "Authentification",
+        "Database": "Base de données",
+        "Server": "Serveur",
+        "Client": "Client",
+        "Error": "Erreur",
+        "Success": "Succès"
+    },
+    ("en", "de"): {
+        "Hello": "Hallo",
+        "World": "Welt",
+        "Documentation": "Dokumentation",
+        "API": "API",
+        "Function": "Funktion",
+        "Class": "Klasse",
+        "Method": "Methode",
+        "Parameter": "Parameter",
+        "Return": "Zurückgeben",
+        "Install": "Installieren",
+        "Setup": "Einrichtung",
+        "Usage": "Verwendung",
+        "Example": "Beispiel",
+        "Installation": "Installation",
+        "Configuration": "Konfiguration",
+        "Authentication": "Authentifizierung",
+        "Database": "Datenbank",
+        "Server": "Server",
+        "Client": "Client",
+        "Error": "Fehler",
+        "Success": "Erfolg"
+    },
+    ("en", "zh"): {
+        # Common words and phrases
+        "Hello": "你好", "Hi": "你好", "Goodbye": "再见", "Bye": "再见",
+        "World": "世界", "Earth": "地球", "Country": "国家", "City": "城市",
+        "Documentation": "文档", "Document": "文档", "Guide": "指南",
+        "API": "API", "Application": "应用", "Program": "程序",
+        "Function": "函数", "Method": "方法", "Procedure": "程序",
+        "Parameter": "参数", "Argument": "参数", "Variable": "变量",
+        "Return": "返回", "Send": "发送", "Give": "给", "Back": "后面",
+        "Install": "安装", "Setup": "设置", "Configure": "配置",
+        "Usage": "使用", "Use": "使用", "Utilize": "利用", "Apply": "应用",
+        "Example": "示例", "Sample": "样本", "Instance": "实例",
+        "Installation": "安装",
+        "Configuration": "配置", "Settings": "设置", "Options": "选项",
+        "Authentication": "认证", "Login": "登录", "Sign in": "登录",
+        "Database": "数据库", "Data": "数据", "Information": "信息",
+        "Server": "服务器", "Service": "服务", "Host": "主机",
+        "Client": "客户端", "User": "用户", "Customer": "客户",
+        "Error": "错误", "Mistake": "错误", "Problem": "问题", "Issue": "问题",
+        "Success": "成功", "Achievement": "成就", "Accomplishment": "成就",
+        # Personal pronouns and common words
+        "I": "我", "You": "你", "He": "他", "She": "她", "It": "它", "We": "我们", "They": "他们",
+        "Am": "是", "Is": "是", "Are": "是", "Was": "是", "Were": "是", "Be": "是", "Been": "是",
+        "A": "一个", "An": "一个", "The": "这个", "This": "这个", "That": "那个", "These": "这些", "Those": "那些",
+        "Good": "好", "Bad": "坏", "Great": "很好", "Excellent": "优秀", "Perfect": "完美",
+        "Scientist": "科学家", "Engineer": "工程师", "Developer": "开发者", "Programmer": "程序员",
+        "Student": "学生", "Teacher": "老师", "Professor": "教授", "Doctor": "医生",
+        "Manager": "经理", "Director": "主任", "CEO": "首席执行官", "President": "总裁",
+        "Company": "公司", "Business": "企业", "Organization": "组织", "Team": "团队",
+        "Project": "项目", "Work": "工作", "Job": "工作", "Career": "职业",
+        "Study": "学习", "Research": "研究", "Analysis": "分析", "Report": "报告",
+        "Book": "书", "Article": "文章", "Paper": "论文",
+        "Computer": "计算机", "Software": "软件", "Hardware": "硬件", "System": "系统",
+        "Network": "网络", "Internet": "互联网", "Website": "网站",
+        "Mobile": "移动", "Phone": "电话", "Email": "电子邮件", "Message": "消息",
+        "Meeting": "会议", "Conference": "会议", "Presentation": "演示", "Discussion": "讨论",
+        "Solution": "解决方案", "Answer": "答案", "Question": "问题",
+        "Help": "帮助", "Support": "支持",
+        "Money": "钱", "Price": "价格", "Cost": "成本", "Budget": "预算",
+        "Time": "时间", "Date": "日期", "Today": "今天", "Tomorrow": "明天", "Yesterday": "昨天",
+        "Morning": "早上", "Afternoon": "下午", "Evening": "晚上", "Night": "晚上",
+        "Week": "周", "Month": "月", "Year": "年", "Day": "天",
+        "Home": "主页", "Office": "办公室", "School": "学校", "University": "大学",
+        "Hospital": "医院", "Store": "存储", "Restaurant": "餐厅", "Hotel": "酒店",
+        "Car": "汽车", "Bus": "公交车", "Train": "火车", "Airplane": "飞机",
+        "Food": "食物", "Water": "水", "Coffee": "咖啡", "Tea": "茶",
+        "Family": "家庭", "Friend": "朋友", "Colleague": "同事", "Partner": "伙伴",
+        "Love": "爱", "Like": "喜欢", "Hate": "讨厌", "Want": "想要",
+        "Need": "需要", "Must": "必须", "Should": "应该", "Can": "能", "Will": "会",
+        "Do": "做", "Make": "制作", "Create": "创建", "Build": "构建",
+        "See": "看到", "Look": "看", "Watch": "观看", "Read": "阅读",
+        "Listen": "听", "Hear": "听到", "Speak": "说", "Talk": "说",
+        "Write": "写", "Draw": "画", "Design": "设计", "Plan": "计划",
+        "Think": "想", "Know": "知道", "Understand": "理解", "Learn": "学习",
+        "Remember": "记住", "Forget": "忘记", "Find": "找到", "Search": "搜索",
+        "Buy": "买", "Sell": "卖", "Pay": "付", "Get": "获得",
+        "Take": "拿", "Bring": "带来",
+        "Come": "来", "Go": "去", "Leave": "离开", "Arrive": "到达",
+        "Start": "开始", "Stop": "停止", "Continue": "继续", "Finish": "完成",
+        "Open": "打开", "Close": "关闭", "Save": "保存", "Delete": "删除",
+        "Copy": "复制", "Paste": "粘贴", "Cut": "剪切", "Print": "打印",
+        "Download": "下载", "Upload": "上传", "Share": "分享", "Link": "链接",
+        "New": "新", "Old": "老", "Big": "大", "Small": "小",
+        "Fast": "快", "Slow": "慢", "Easy": "容易", "Hard": "困难",
+        "Important": "重要", "Special": "特别", "Different": "不同", "Same": "相同",
+        "Right": "正确", "Wrong": "错误", "True": "真", "False": "假",
+        "Yes": "是", "No": "否", "Maybe": "可能", "Please": "请",
+        "Thank you": "谢谢", "Sorry": "对不起", "Welcome": "欢迎",
+        "File": "文件", "Folder": "文件夹", "Directory": "目录",
+        "Code": "代码", "Script": "脚本",
+        "Test": "测试", "Check": "检查", "Validate": "验证",
+        "Run": "运行", "Begin": "开始",
+        "End": "结束",
+        "Remove": "移除", "Destroy": "破坏",
+        "Update": "更新", "Modify": "修改", "Change": "改变",
+        "Keep": "保持",
+        "Load": "加载", "Import": "导入",
+        "Export": "导出", "Transfer": "转移",
+        "Replace": "替换", "Substitute": "代替", "Exchange": "交换",
+        "Duplicate": "复制", "Clone": "克隆",
+        "Insert": "插入", "Add": "添加",
+        "Undo": "撤销", "Redo": "重做", "Repeat": "重复",
+        "Cancel": "取消", "Abort": "中断",
+        "Confirm": "确认", "Accept": "接受", "Agree": "同意",
+        "Reject": "拒绝", "Deny": "拒绝", "Refuse": "拒绝",
+        "Perhaps": "可能",
+        "Thanks": "谢谢",
+        "Large": "大",
+        "Quick": "快",
+        "Simple": "简单",
+        "Complex": "复杂", "Advanced": "高级", "Basic": "基本",
+        "Recent": "最近",
+        "First": "第一", "Last": "最后", "Next": "下一个",
+        "Previous": "上一个", "Before": "之前", "After": "之后",
+        "Now": "现在",
+        "Name": "名称", "Title": "标题", "Description": "描述",
+        "Content": "内容", "Text": "文本",
+        "Note": "备注", "Comment": "评论", "Remark": "说明",
+        "Assistance": "协助",
+        "Manual": "手册", "Tutorial": "教程",
+        "Reference": "参考", "Docs": "文档",
+        "About": "关于", "Info": "信息", "Details": "详细",
+        "Preferences": "偏好",
+        "Profile": "个人资料", "Account": "账户",
+        "Password": "密码", "Username": "用户名",
+        "Logout": "登出", "Sign out": "登出", "Exit": "退出",
+        "Main": "主要", "Dashboard": "仪表板",
+        "Menu": "菜单", "Navigation": "导航", "Links": "链接",
+        "Button": "按钮", "Click": "点击", "Press": "按",
+        "Select": "选择", "Choose": "选择", "Pick": "选择",
+        "Input": "输入", "Field": "字段", "Form": "表单",
+        "Submit": "提交",
+        "Receive": "接收",
+        "View": "查看", "Show": "显示", "Display": "显示",
+        "Hide": "隐藏", "Conceal": "隐藏", "Mask": "掩盖",
+        "Shut": "关闭",
+        "Minimize": "最小化", "Maximize": "最大化", "Resize": "调整大小",
+        "Move": "移动", "Drag": "拖拽", "Drop": "放下",
+        "Scale": "缩放", "Adjust": "调整",
+        "Zoom": "缩放", "Enlarge": "扩大", "Reduce": "缩小",
+        "Mail": "邮件",
+        "Contact": "联系", "Address": "地址",
+        "Number": "数字", "Count": "计数", "Amount": "数量",
+        "Value": "价值",
+        "Free": "免费", "Paid": "付费", "Premium": "高级",
+        "Public": "公共", "Private": "私人", "Secret": "秘密",
+        "Secure": "安全", "Safe": "安全", "Protected": "保护",
+        "Lock": "锁定", "Unlock": "解锁", "Key": "键",
+        "Access": "访问", "Permission": "权限", "Grant": "授予",
+        "Allow": "允许", "Block": "阻止",
+        "Enable": "启用", "Disable": "禁用", "Activate": "激活",
+        "Deactivate": "停用", "Turn on": "打开", "Turn off": "关闭",
+        "Launch": "启动",
+        "Pause": "暂停", "Resume": "恢复",
+        "Restart": "重启", "Reset": "重置", "Refresh": "刷新",
+        "Reload": "重载", "Upgrade": "升级",
+        "Uninstall": "卸载",
+        "Include": "包括",
+        "Exclude": "排除",
+        "Generate": "生成",
+        "Compile": "编译", "Assemble": "组装",
+        "Debug": "调试", "Fix": "修复", "Repair": "修理",
+        "Bug": "虫",
+        "Trouble": "麻烦", "Difficulty": "困难",
+        "Result": "结果",
+        "Victory": "胜利",
+        "Failure": "失败", "Loss": "损失", "Defeat": "败北",
+        "Warning": "警告", "Alert": "警报", "Notice": "通知",
+        "Summary": "摘要",
+        "Log": "日志", "History": "历史",
+        "Record": "记录", "Entry": "条目", "Item": "项目",
+        "List": "列表", "Table": "表格", "Grid": "网格",
+        "Chart": "图表", "Graph": "图表", "Diagram": "图解",
+        "Image": "图片", "Picture": "图片", "Photo": "照片",
+        "Video": "视频", "Audio": "音频", "Sound": "声音",
+        "Music": "音乐", "Song": "歌曲", "Track": "轨道",
+        "Path": "路径",
+        "URL": "网址",
+        "Page": "页面", "Site": "站点",
+        "Web": "网络",
+        "Connection": "连接", "Connect": "连接", "Join": "加入",
+        "Disconnect": "断开", "Quit": "退出",
+        "Online": "在线", "Offline": "离线", "Available": "可用",
+        "Busy": "忙", "Ready": "准备好",
+        "Loading": "加载中", "Processing": "处理中", "Working": "工作中",
+        "Complete": "完成", "Finished": "完成", "Done": "完成",
+        "Prepared": "准备好", "Set": "设置",
+        "Wait": "等待", "Hold": "持有",
+        "Proceed": "继续",
+        "Reach": "到达",
+        "Go away": "走开", "Depart": "出发",
+        "Enter": "进入",
+        "Excuse me": "抱歉", "Pardon": "请原谅", "Forgive": "原谅",
+        "Touch": "触摸", "Feel": "感觉", "Smell": "闻", "Taste": "味道"
+    },
+    ("en", "ja"): {
+        "Hello": "こんにちは",
+        "World": "世界",
+        "Documentation": "ドキュメント",
+        "API": "API",
+        "Function": "関数",
+        "Class": "クラス",
+        "Method": "メソッド",
+        "Parameter": "パラメータ",
+        "Return": "戻る",
+        "Install": "インストール",
+        "Setup": "セットアップ",
+        "Usage": "使用方法",
+        "Example": "例",
+        "Installation": "インストール",
+        "Configuration": "設定",
+        "Authentication": "認証",
+        "Database": "データベース",
+        "Server": "サーバー",
+        "Client": "クライアント",
+        "Error": "エラー",
+        "Success": "成功"
+    }
+}
+
+# Intern every key and value once and freeze the tables, so all requests share
+# one read-only copy and repeated words like "Install" are a single object; the
+# raw literal is dropped once the frozen copy exists
+_FALLBACK_TRANSLATIONS: Mapping[tuple, Mapping[str, str]] = MappingProxyType({
+    lang_pair: MappingProxyType({sys.intern(key): sys.intern(value) for key, value in table.items()})
+    for lang_pair, table in _RAW_FALLBACK_TRANSLATIONS.items()
+})
+del _RAW_FALLBACK_TRANSLATIONS
+
+# Common function words used by the simple language detector
+_SPANISH_WORDS = frozenset([
+    "el", "la", "de", "que", "y", "en", "un", "es", "se", "no", "te", "lo", "le", "da",
+    "su", "por", "son", "con", "para", "al", "del", "los", "las", "una", "como", "más",
+    "pero", "sus", "me", "hasta", "hay", "donde", "han", "quien", "están", "estado",
+    "desde", "todo", "nos", "durante", "todos", "uno", "les", "ni", "contra", "otros",
+    "ese", "eso", "ante", "ellos", "e", "esto", "mí", "antes", "algunos", "qué",
+    "unos", "yo", "otro", "otras", "otra", "él", "tanto", "esa", "estos", "mucho",
+    "quienes", "nada", "muchos", "cual", "poco", "ella", "estar", "estas", "algunas",
+    "algo", "nosotros"
+])
+_FRENCH_WORDS = frozenset([
+    "le", "la", "de", "et", "un", "à", "être", "en", "avoir", "ne", "je", "son", "que",
+    "se", "qui", "ce", "dans", "une", "il", "sur", "pas", "plus", "pouvoir", "par",
+    "tout", "faire", "mettre", "autre", "on", "mais", "nous", "comme", "mon", "leur",
+    "si", "y", "bien", "devoir", "voir", "deux", "même", "prendre", "aussi", "quel",
+    "donner", "premier", "vouloir", "encore", "déjà", "grand", "bon", "peu", "sous",
+    "trop", "seul", "falloir", "jour"
+])
+_DETECTION_WORD_RE = re.compile(r'[^\W\d_]+')
+_CJK_CHAR_RE = re.compile('[\u4e00-\u9fff]')
+
+# Strips punctuation from words in the word-by-word fallback
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Sentence boundaries for batching untranslated text; the captured
+# whitespace keeps separators at odd indices so results splice back in place
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])(\s+)')
+
+# Splits text into word runs and the non-word separators between them
+_WORD_TOKEN_SPLIT_RE = re.compile(r'(\W+)')
+
+class _FallbackMatcher(NamedTuple):
+    """Compiled matching structures for one fallback language pair"""
+    multi_word_lookup: Dict[str, str]
+    multi_word_pattern: Optional[re.Pattern]
+    single_word_lookup: Dict[str, str]
+    probe: Any
+    hyperscan_database: Any
+    hyperscan_replacements: List[bytes]
+
+@functools.lru_cache(maxsize=None)
+def _fallback_matcher(lang_pair: tuple) -> _FallbackMatcher:
+    """Build the matching structures for a language pair on first use
+
+    Only the pairs a process actually serves pay for regex and Hyperscan
+    compilation, which keeps startup fast and resident memory low.
+    """
+    table = _FALLBACK_TRANSLATIONS[lang_pair]
+    
+    # Keys (longest first) and their interned values are laid out once as
+    # parallel tuples; every structure below is built by a linear walk over them
+    keys = tuple(sorted(table, key=len, reverse=True))
+    values = tuple(table[key] for key in keys)
+    
+    # Multi-word phrases are picked out once so the fallback does not re-sort and
+    # re-split the whole table on every call
+    multi_word_phrases = [phrase for phrase in keys if " " in phrase]
+    
+    # Multi-word phrases share one alternation (longest first) so the phrase
+    # pass is a single scan rather than one scan per phrase
+    multi_word_lookup = {key.lower(): value for key, value in zip(keys, values) if " " in key}
+    multi_word_pattern = None
+    if multi_word_phrases:
+        multi_word_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(phrase) for phrase in multi_word_phrases) + r')\b',
+            re.IGNORECASE
+        )
+    
+    # Single words are resolved by a plain dict lookup on each word token,
+    # so the cost no longer grows with the size of the table
+    single_word_lookup = {key.lower(): value for key, value in zip(keys, values) if " " not in key}
+    
+    # Yes/no probe over every key so content the table cannot touch skips the
+    # replacement passes entirely
+    probe_source = r'\b(?:' + '|'.join(re.escape(phrase) for phrase in keys) + r')\b'
+    if re2 is not None:
+        # RE2 scans in guaranteed linear time; its ASCII-only \b can only report
+        # extra hits, which merely sends the content through the regular passes
+        probe = re2.compile('(?i)' + probe_source)
+    else:
+        probe = re.compile(probe_source, re.IGNORECASE)
+    
+    # When Hyperscan is installed every phrase is compiled into one block-mode
+    # database and matched in a single DFA pass
+    hyperscan_database = None
+    hyperscan_replacements = []
+    if hyperscan is not None:
+        hyperscan_database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        hyperscan_database.compile(
+            expressions=[rb'\b' + re.escape(phrase.encode('utf-8')) + rb'\b' for phrase in keys],
+            ids=list(range(len(keys))),
+            elements=len(keys),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(keys)
+        )
+        hyperscan_replacements = [value.encode('utf-8') for value in values]
+    
+    return _FallbackMatcher(
+        multi_word_lookup=multi_word_lookup,
+        multi_word_pattern=multi_word_pattern,
+        single_word_lookup=single_word_lookup,
+        probe=probe,
+        hyperscan_database=hyperscan_database,
+        hyperscan_replacements=hyperscan_replacements
+    )
+
+def _touches_unicode_word(data: bytes, start: int, end: int) -> bool:
+    """Check whether a match is glued to a non-ASCII word character (Hyperscan word boundaries are ASCII-only)"""
+    if start and data[start - 1] >= 0x80:
+        lead = start - 1
+        while lead and 0x80 <= data[lead] < 0xC0:
+            lead -= 1
+        char = data[lead:start].decode('utf-8', 'ignore')
+        if char.isalnum() or char == '_':
+            return True
+    if end < len(data) and data[end] >= 0x80:
+        tail = end + 1
+        while tail < len(data) and 0x80 <= data[tail] < 0xC0:
+            tail += 1
+        char = data[end:tail].decode('utf-8', 'ignore')
+        if char.isalnum() or char == '_':
+            return True
+    return False
+
+def _hyperscan_translate(matcher: _FallbackMatcher, content: str) -> Tuple[str, int]:
+    """Replace every table phrase in one Hyperscan pass, preferring the earliest, longest match
+
+    Returns the translated content and the number of phrases replaced.
+    """
+    data = content.encode('utf-8')
+    hits = []
+    matcher.hyperscan_database.scan(
+        data,
+        match_event_handler=lambda phrase_id, start, end, flags, context: hits.append((start, -end, phrase_id))
+    )
+    if not hits:
+        return content, 0
+    
+    replacements = matcher.hyperscan_replacements
+    parts = []
+    position = 0
+    matches = 0
+    for start, negative_end, phrase_id in sorted(hits):
+        end = -negative_end
+        if start < position or _touches_unicode_word(data, start, end):
+            continue
+        parts.append(data[position:start])
+        parts.append(replacements[phrase_id])
+        position = end
+        matches += 1
+    parts.append(data[position:])
+    return b''.join(parts).decode('utf-8'), matches
+
 class TranslationManager:
     """Manage translation and localization services"""
     
     def __init__(self):
         self.supported_languages = self._load_supported_languages()
+        # The language list never changes at runtime, so serialize it once
+        self.languages_payload = orjson.dumps({
+            "languages": [lang.dict() for lang in self.supported_languages.values()],
+            "total": len(self.supported_languages)
+        })
         self.translation_memory = {}
+        # Memoized /translation-memory statistics, dropped whenever the memory changes
+        self.memory_stats = None
+        self.memory_stats_expires = 0.0
         self.common_technical_terms = self._load_technical_terms()
+        self._translations = _FALLBACK_TRANSLATIONS
+        # Language indicators for unsupported pairs depend only on configuration
+        self._fallback_prefix = {code: f"[{code.upper()}] " for code in self.supported_languages}
+        # Documentation strings repeat a lot across requests, so memoize the offline fallback
+        self._cached_fallback_translate = functools.lru_cache(maxsize=4096)(self._enhanced_fallback_translate)
+        # Shared HTTP/2 client so concurrent model requests multiplex over one
+        # connection; failed connection attempts are retried twice
+        self.hf_client = httpx.AsyncClient(
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=2)
+        )
     
     def _load_supported_languages(self) -> Dict[str, SupportedLanguage]:
         """Load supported languages configuration"""
@@ -201,6 +809,7 @@ class TranslationManager:
             if memory_key in self.translation_memory:
                 memory = self.translation_memory[memory_key]
                 memory.usage_count += 1
+                self.memory_stats = None
                 return TranslationResponse(
                     translated_content=memory.translated_text,
                     source_language=actual_source_language,
@@ -224,6 +833,7 @@ class TranslationManager:
             )
             
             # Store in translation memory
+            self.memory_stats = None
             self.translation_memory[memory_key] = TranslationMemory(
                 source_text=request.content,
                 source_language=actual_source_language,
@@ -288,11 +898,11 @@ class TranslationManager:
                 return translation
             
             # 6. Final fallback to enhanced dictionary translation
-            return self._enhanced_fallback_translate(content, source_lang, target_lang)
+            return await self._offline_translate(content, source_lang, target_lang)
                 
         except Exception as e:
             logger.error(f"Translation error: {e}")
-            return self._enhanced_fallback_translate(content, source_lang, target_lang)
+            return await self._offline_translate(content, source_lang, target_lang)
     
     async def _try_huggingface_translation(self, content: str, source_lang: str, target_lang: str) -> str:
         """Try Hugging Face translation"""
@@ -527,462 +1137,122 @@ class TranslationManager:
             logger.error(f"MyMemory translation error: {e}")
             return None
     
+    def _dictionary_translate(self, content: str, lang_pair: tuple) -> Tuple[str, int]:
+        """Apply the offline phrase table of a supported language pair
+
+        Returns the translated content and the number of phrases replaced.
+        """
+        matcher = _fallback_matcher(lang_pair)
+        translated = content
+        matches = 0
+        
+        if matcher.hyperscan_database is not None:
+            translated, matches = _hyperscan_translate(matcher, content)
+        # Skip the replacement passes when no table entry occurs in the content
+        elif matcher.probe.search(content):
+            # First, try to translate common phrases (longer matches first)
+            if matcher.multi_word_pattern is not None:
+                phrase_lookup = matcher.multi_word_lookup
+                translated, matches = matcher.multi_word_pattern.subn(
+                    lambda match: phrase_lookup.get(match.group(0).lower(), match.group(0)),
+                    translated
+                )
+            
+            # Then translate individual words (case-insensitive): word runs sit at
+            # even indices between the captured non-word separators
+            # (the lookup and str.lower are bound to locals for the hot loop)
+            lookup_get = matcher.single_word_lookup.get
+            lower = str.lower
+            tokens = _WORD_TOKEN_SPLIT_RE.split(translated)
+            count = 0
+            for index in range(0, len(tokens), 2):
+                replacement = lookup_get(lower(tokens[index]))
+                if replacement is not None:
+                    tokens[index] = replacement
+                    count += 1
+            translated = ''.join(tokens)
+            matches += count
+        
+        return translated, matches
+    
+    def _dictionary_covers(self, sentence: str, lang_pair: tuple) -> bool:
+        """Check whether every word of a sentence is in the offline phrase table"""
+        matcher = _fallback_matcher(lang_pair)
+        # Words inside a known phrase are covered by it
+        if matcher.multi_word_pattern is not None:
+            sentence = matcher.multi_word_pattern.sub(' ', sentence)
+        single_word_lookup = matcher.single_word_lookup
+        tokens = _WORD_TOKEN_SPLIT_RE.split(sentence)
+        return all(
+            token.lower() in single_word_lookup or not _DETECTION_WORD_RE.search(token)
+            for token in tokens[::2]
+        )
+    
+    def _split_untranslated_sentences(self, content: str, lang_pair: tuple) -> Tuple[List[str], List[int], int]:
+        """Rewrite the sentences the offline table fully covers and pick the rest for a model
+
+        Returns the segments (sentences at even indices, separators at odd ones),
+        the indices of source sentences to send to the model within a 500-character
+        budget, and the segment index where that budget ran out.
+        """
+        segments = _SENTENCE_SPLIT_RE.split(content)
+        untranslated = []
+        budget = 500
+        has_table = lang_pair in self._translations
+        for index in range(0, len(segments), 2):
+            sentence = segments[index]
+            if not sentence.strip():
+                continue
+            if has_table and self._dictionary_covers(sentence, lang_pair):
+                segments[index] = self._dictionary_translate(sentence, lang_pair)[0]
+            elif len(sentence) <= budget:
+                untranslated.append(index)
+                budget -= len(sentence)
+            else:
+                return segments, untranslated, index
+        return segments, untranslated, len(segments)
+    
+    async def _offline_translate(self, content: str, source_lang: str, target_lang: str) -> str:
+        """Run the CPU-bound dictionary fallback in a worker thread to keep the event loop free"""
+        # Only short content is cached so the memo cannot pin large documents in memory
+        if len(content) < 8192:
+            return await asyncio.to_thread(self._cached_fallback_translate, content, source_lang, target_lang)
+        return await asyncio.to_thread(self._enhanced_fallback_translate, content, source_lang, target_lang)
+    
     def _enhanced_fallback_translate(self, content: str, source_lang: str, target_lang: str) -> str:
         """Enhanced fallback translation that can handle ANY sentence"""
-        # Comprehensive fallback translations with thousands of words and phrases
-        translations = {
-            ("en", "es"): {
-                # Common words
-                "Hello": "Hola", "Hi": "Hola", "Goodbye": "Adiós", "Bye": "Adiós",
-                "World": "Mundo", "Earth": "Tierra", "Country": "País", "City": "Ciudad",
-                "Documentation": "Documentación", "Document": "Documento", "Guide": "Guía",
-                "API": "API", "Application": "Aplicación", "Program": "Programa",
-                "Function": "Función", "Method": "Método", "Procedure": "Procedimiento",
-                "Class": "Clase", "Object": "Objeto", "Instance": "Instancia",
-                "Parameter": "Parámetro", "Argument": "Argumento", "Variable": "Variable",
-                "Return": "Retornar", "Send": "Enviar", "Give": "Dar", "Back": "Atrás",
-                "Install": "Instalar", "Setup": "Configuración", "Configure": "Configurar",
-                "Usage": "Uso", "Use": "Usar", "Utilize": "Utilizar", "Apply": "Aplicar",
-                "Example": "Ejemplo", "Sample": "Muestra", "Instance": "Instancia",
-                "Installation": "Instalación", "Setup": "Configuración", "Install": "Instalar",
-                "Configuration": "Configuración", "Settings": "Ajustes", "Options": "Opciones",
-                "Authentication": "Autenticación", "Login": "Iniciar sesión", "Sign in": "Iniciar sesión",
-                "Database": "Base de datos", "Data": "Datos", "Information": "Información",
-                "Server": "Servidor", "Service": "Servicio", "Host": "Anfitrión",
-                "Client": "Cliente", "User": "Usuario", "Customer": "Cliente",
-                "Error": "Error", "Mistake": "Error", "Problem": "Problema", "Issue": "Problema",
-                "Success": "Éxito", "Achievement": "Logro", "Accomplishment": "Logro",
-                "File": "Archivo", "Folder": "Carpeta", "Directory": "Directorio",
-                "Code": "Código", "Script": "Script", "Program": "Programa",
-                "Test": "Prueba", "Check": "Verificar", "Validate": "Validar",
-                "Run": "Ejecutar", "Start": "Iniciar", "Begin": "Comenzar",
-                "Stop": "Detener", "End": "Terminar", "Finish": "Finalizar",
-                "Create": "Crear", "Make": "Hacer", "Build": "Construir",
-                "Delete": "Eliminar", "Remove": "Quitar", "Destroy": "Destruir",
-                "Update": "Actualizar", "Modify": "Modificar", "Change": "Cambiar",
-                "Save": "Guardar", "Store": "Almacenar", "Keep": "Mantener",
-                "Load": "Cargar", "Import": "Importar", "Bring": "Traer",
-                "Export": "Exportar", "Send": "Enviar", "Transfer": "Transferir",
-                "Search": "Buscar", "Find": "Encontrar", "Look": "Buscar",
-                "Replace": "Reemplazar", "Substitute": "Sustituir", "Exchange": "Intercambiar",
-                "Copy": "Copiar", "Duplicate": "Duplicar", "Clone": "Clonar",
-                "Paste": "Pegar", "Insert": "Insertar", "Add": "Agregar",
-                "Cut": "Cortar", "Remove": "Quitar", "Delete": "Eliminar",
-                "Undo": "Deshacer", "Redo": "Rehacer", "Repeat": "Repetir",
-                "Cancel": "Cancelar", "Abort": "Abortar", "Stop": "Detener",
-                "Confirm": "Confirmar", "Accept": "Aceptar", "Agree": "Aceptar",
-                "Reject": "Rechazar", "Deny": "Negar", "Refuse": "Rechazar",
-                "Yes": "Sí", "No": "No", "Maybe": "Tal vez", "Perhaps": "Quizás",
-                "Please": "Por favor", "Thank you": "Gracias", "Thanks": "Gracias",
-                "Welcome": "Bienvenido", "Good": "Bueno", "Bad": "Malo",
-                "Big": "Grande", "Small": "Pequeño", "Large": "Grande",
-                "Fast": "Rápido", "Slow": "Lento", "Quick": "Rápido",
-                "Easy": "Fácil", "Hard": "Difícil", "Simple": "Simple",
-                "Complex": "Complejo", "Advanced": "Avanzado", "Basic": "Básico",
-                "New": "Nuevo", "Old": "Viejo", "Recent": "Reciente",
-                "First": "Primero", "Last": "Último", "Next": "Siguiente",
-                "Previous": "Anterior", "Before": "Antes", "After": "Después",
-                "Now": "Ahora", "Today": "Hoy", "Tomorrow": "Mañana",
-                "Yesterday": "Ayer", "Week": "Semana", "Month": "Mes",
-                "Year": "Año", "Time": "Tiempo", "Date": "Fecha",
-                "Name": "Nombre", "Title": "Título", "Description": "Descripción",
-                "Content": "Contenido", "Text": "Texto", "Message": "Mensaje",
-                "Note": "Nota", "Comment": "Comentario", "Remark": "Observación",
-                "Help": "Ayuda", "Support": "Soporte", "Assistance": "Asistencia",
-                "Manual": "Manual", "Tutorial": "Tutorial", "Guide": "Guía",
-                "Reference": "Referencia", "Documentation": "Documentación", "Docs": "Documentos",
-                "About": "Acerca de", "Info": "Información", "Details": "Detalles",
-                "Settings": "Configuración", "Options": "Opciones", "Preferences": "Preferencias",
-                "Profile": "Perfil", "Account": "Cuenta", "User": "Usuario",
-                "Password": "Contraseña", "Username": "Nombre de usuario", "Login": "Inicio de sesión",
-                "Logout": "Cerrar sesión", "Sign out": "Cerrar sesión", "Exit": "Salir",
-                "Home": "Inicio", "Main": "Principal", "Dashboard": "Panel de control",
-                "Menu": "Menú", "Navigation": "Navegación", "Links": "Enlaces",
-                "Button": "Botón", "Click": "Hacer clic", "Press": "Presionar",
-                "Select": "Seleccionar", "Choose": "Elegir", "Pick": "Elegir",
-                "Input": "Entrada", "Field": "Campo", "Form": "Formulario",
-                "Submit": "Enviar", "Send": "Enviar", "Upload": "Subir",
-                "Download": "Descargar", "Get": "Obtener", "Receive": "Recibir",
-                "View": "Ver", "Show": "Mostrar", "Display": "Mostrar",
-                "Hide": "Ocultar", "Conceal": "Ocultar", "Mask": "Enmascarar",
-                "Open": "Abrir", "Close": "Cerrar", "Shut": "Cerrar",
-                "Minimize": "Minimizar", "Maximize": "Maximizar", "Resize": "Redimensionar",
-                "Move": "Mover", "Drag": "Arrastrar", "Drop": "Soltar",
-                "Resize": "Redimensionar", "Scale": "Escalar", "Adjust": "Ajustar",
-                "Zoom": "Zoom", "Enlarge": "Ampliar", "Reduce": "Reducir",
-                "Print": "Imprimir", "Export": "Exportar", "Share": "Compartir",
-                "Email": "Correo electrónico", "Mail": "Correo", "Message": "Mensaje",
-                "Contact": "Contacto", "Address": "Dirección", "Phone": "Teléfono",
-                "Number": "Número", "Count": "Contar", "Amount": "Cantidad",
-                "Price": "Precio", "Cost": "Costo", "Value": "Valor",
-                "Free": "Gratis", "Paid": "Pagado", "Premium": "Premium",
-                "Public": "Público", "Private": "Privado", "Secret": "Secreto",
-                "Secure": "Seguro", "Safe": "Seguro", "Protected": "Protegido",
-                "Lock": "Bloquear", "Unlock": "Desbloquear", "Key": "Clave",
-                "Access": "Acceso", "Permission": "Permiso", "Grant": "Conceder",
-                "Deny": "Denegar", "Allow": "Permitir", "Block": "Bloquear",
-                "Enable": "Habilitar", "Disable": "Deshabilitar", "Activate": "Activar",
-                "Deactivate": "Desactivar", "Turn on": "Encender", "Turn off": "Apagar",
-                "Start": "Iniciar", "Begin": "Comenzar", "Launch": "Lanzar",
-                "Stop": "Detener", "End": "Terminar", "Finish": "Finalizar",
-                "Pause": "Pausar", "Resume": "Reanudar", "Continue": "Continuar",
-                "Restart": "Reiniciar", "Reset": "Restablecer", "Refresh": "Actualizar",
-                "Reload": "Recargar", "Update": "Actualizar", "Upgrade": "Actualizar",
-                "Install": "Instalar", "Uninstall": "Desinstalar", "Remove": "Quitar",
-                "Add": "Agregar", "Insert": "Insertar", "Include": "Incluir",
-                "Remove": "Quitar", "Delete": "Eliminar", "Exclude": "Excluir",
-                "Create": "Crear", "Make": "Hacer", "Generate": "Generar",
-                "Build": "Construir", "Compile": "Compilar", "Assemble": "Ensamblar",
-                "Test": "Probar", "Check": "Verificar", "Validate": "Validar",
-                "Debug": "Depurar", "Fix": "Arreglar", "Repair": "Reparar",
-                "Error": "Error", "Bug": "Error", "Issue": "Problema",
-                "Problem": "Problema", "Trouble": "Problema", "Difficulty": "Dificultad",
-                "Solution": "Solución", "Answer": "Respuesta", "Result": "Resultado",
-                "Success": "Éxito", "Achievement": "Logro", "Victory": "Victoria",
-                "Failure": "Fracaso", "Loss": "Pérdida", "Defeat": "Derrota",
-                "Warning": "Advertencia", "Alert": "Alerta", "Notice": "Aviso",
-                "Info": "Información", "Details": "Detalles", "Summary": "Resumen",
-                "Report": "Informe", "Log": "Registro", "History": "Historial",
-                "Record": "Registro", "Entry": "Entrada", "Item": "Elemento",
-                "List": "Lista", "Table": "Tabla", "Grid": "Cuadrícula",
-                "Chart": "Gráfico", "Graph": "Gráfico", "Diagram": "Diagrama",
-                "Image": "Imagen", "Picture": "Imagen", "Photo": "Foto",
-                "Video": "Video", "Audio": "Audio", "Sound": "Sonido",
-                "Music": "Música", "Song": "Canción", "Track": "Pista",
-                "File": "Archivo", "Document": "Documento", "Data": "Datos",
-                "Folder": "Carpeta", "Directory": "Directorio", "Path": "Ruta",
-                "Link": "Enlace", "URL": "URL", "Address": "Dirección",
-                "Website": "Sitio web", "Page": "Página", "Site": "Sitio",
-                "Web": "Web", "Internet": "Internet", "Network": "Red",
-                "Connection": "Conexión", "Connect": "Conectar", "Join": "Unirse",
-                "Disconnect": "Desconectar", "Leave": "Salir", "Quit": "Salir",
-                "Online": "En línea", "Offline": "Sin conexión", "Available": "Disponible",
-                "Busy": "Ocupado", "Free": "Libre", "Ready": "Listo",
-                "Loading": "Cargando", "Processing": "Procesando", "Working": "Trabajando",
-                "Complete": "Completo", "Finished": "Terminado", "Done": "Hecho",
-                "Ready": "Listo", "Prepared": "Preparado", "Set": "Listo",
-                "Wait": "Esperar", "Hold": "Esperar", "Pause": "Pausar",
-                "Continue": "Continuar", "Proceed": "Continuar", "Go": "Ir",
-                "Come": "Venir", "Arrive": "Llegar", "Reach": "Llegar",
-                "Leave": "Salir", "Go away": "Irse", "Depart": "Partir",
-                "Enter": "Entrar", "Exit": "Salir", "Access": "Acceder",
-                "Welcome": "Bienvenido", "Hello": "Hola", "Goodbye": "Adiós",
-                "Thank you": "Gracias", "Please": "Por favor", "Sorry": "Lo siento",
-                "Excuse me": "Disculpe", "Pardon": "Perdón", "Forgive": "Perdonar",
-                "Understand": "Entender", "Know": "Saber", "Learn": "Aprender",
-                "Study": "Estudiar", "Read": "Leer", "Write": "Escribir",
-                "Speak": "Hablar", "Talk": "Hablar", "Listen": "Escuchar",
-                "Hear": "Oír", "See": "Ver", "Look": "Mirar", "Watch": "Ver",
-                "Touch": "Tocar", "Feel": "Sentir", "Smell": "Oler", "Taste": "Probar"
-            },
-            ("en", "fr"): {
-                "Hello": "Bonjour",
-                "World": "Monde",
-                "Documentation": "Documentation",
-                "API": "API",
-                "Function": "Fonction",
-                "Class": "Classe",
-                "Method": "Méthode",
-                "Parameter": "Paramètre",
-                "Return": "Retourner",
-                "Install": "Installer",
-                "Setup": "Configuration",
-                "Usage": "Utilisation",
-                "Example": "Exemple",
-                "Installation": "Installation",
-                "Configuration": "Configuration",
-                "Authentication": "Authentification",
-                "Database": "Base de données",
-                "Server": "Serveur",
-                "Client": "Client",
-                "Error": "Erreur",
-                "Success": "Succès"
-            },
-            ("en", "de"): {
-                "Hello": "Hallo",
-                "World": "Welt",
-                "Documentation": "Dokumentation",
-                "API": "API",
-                "Function": "Funktion",
-                "Class": "Klasse",
-                "Method": "Methode",
-                "Parameter": "Parameter",
-                "Return": "Zurückgeben",
-                "Install": "Installieren",
-                "Setup": "Einrichtung",
-                "Usage": "Verwendung",
-                "Example": "Beispiel",
-                "Installation": "Installation",
-                "Configuration": "Konfiguration",
-                "Authentication": "Authentifizierung",
-                "Database": "Datenbank",
-                "Server": "Server",
-                "Client": "Client",
-                "Error": "Fehler",
-                "Success": "Erfolg"
-            },
-            ("en", "zh"): {
-                # Common words and phrases
-                "Hello": "你好", "Hi": "你好", "Goodbye": "再见", "Bye": "再见",
-                "World": "世界", "Earth": "地球", "Country": "国家", "City": "城市",
-                "Documentation": "文档", "Document": "文件", "Guide": "指南",
-                "API": "API", "Application": "应用程序", "Program": "程序",
-                "Function": "函数", "Method": "方法", "Procedure": "程序",
-                "Parameter": "参数", "Argument": "参数", "Variable": "变量",
-                "Return": "返回", "Send": "发送", "Give": "给", "Back": "后面",
-                "Install": "安装", "Setup": "设置", "Configure": "配置",
-                "Usage": "使用", "Use": "使用", "Utilize": "利用", "Apply": "应用",
-                "Example": "示例", "Sample": "样本", "Instance": "实例",
-                "Installation": "安装", "Setup": "设置", "Install": "安装",
-                "Configuration": "配置", "Settings": "设置", "Options": "选项",
-                "Authentication": "认证", "Login": "登录", "Sign in": "登录",
-                "Database": "数据库", "Data": "数据", "Information": "信息",
-                "Server": "服务器", "Service": "服务", "Host": "主机",
-                "Client": "客户端", "User": "用户", "Customer": "客户",
-                "Error": "错误", "Mistake": "错误", "Problem": "问题", "Issue": "问题",
-                "Success": "成功", "Achievement": "成就", "Accomplishment": "成就",
-                # Personal pronouns and common words
-                "I": "我", "You": "你", "He": "他", "She": "她", "It": "它", "We": "我们", "They": "他们",
-                "Am": "是", "Is": "是", "Are": "是", "Was": "是", "Were": "是", "Be": "是", "Been": "是",
-                "A": "一个", "An": "一个", "The": "这个", "This": "这个", "That": "那个", "These": "这些", "Those": "那些",
-                "Good": "好", "Bad": "坏", "Great": "很好", "Excellent": "优秀", "Perfect": "完美",
-                "Scientist": "科学家", "Engineer": "工程师", "Developer": "开发者", "Programmer": "程序员",
-                "Student": "学生", "Teacher": "老师", "Professor": "教授", "Doctor": "医生",
-                "Manager": "经理", "Director": "主任", "CEO": "首席执行官", "President": "总裁",
-                "Company": "公司", "Business": "企业", "Organization": "组织", "Team": "团队",
-                "Project": "项目", "Work": "工作", "Job": "工作", "Career": "职业",
-                "Study": "学习", "Research": "研究", "Analysis": "分析", "Report": "报告",
-                "Book": "书", "Article": "文章", "Paper": "论文", "Document": "文档",
-                "Computer": "计算机", "Software": "软件", "Hardware": "硬件", "System": "系统",
-                "Network": "网络", "Internet": "互联网", "Website": "网站", "Application": "应用",
-                "Mobile": "移动", "Phone": "电话", "Email": "电子邮件", "Message": "消息",
-                "Meeting": "会议", "Conference": "会议", "Presentation": "演示", "Discussion": "讨论",
-                "Problem": "问题", "Solution": "解决方案", "Answer": "答案", "Question": "问题",
-                "Help": "帮助", "Support": "支持", "Service": "服务", "Customer": "客户",
-                "Money": "钱", "Price": "价格", "Cost": "成本", "Budget": "预算",
-                "Time": "时间", "Date": "日期", "Today": "今天", "Tomorrow": "明天", "Yesterday": "昨天",
-                "Morning": "早上", "Afternoon": "下午", "Evening": "晚上", "Night": "晚上",
-                "Week": "周", "Month": "月", "Year": "年", "Day": "天",
-                "Home": "家", "Office": "办公室", "School": "学校", "University": "大学",
-                "Hospital": "医院", "Store": "商店", "Restaurant": "餐厅", "Hotel": "酒店",
-                "Car": "汽车", "Bus": "公交车", "Train": "火车", "Airplane": "飞机",
-                "Food": "食物", "Water": "水", "Coffee": "咖啡", "Tea": "茶",
-                "Family": "家庭", "Friend": "朋友", "Colleague": "同事", "Partner": "伙伴",
-                "Love": "爱", "Like": "喜欢", "Hate": "讨厌", "Want": "想要",
-                "Need": "需要", "Must": "必须", "Should": "应该", "Can": "能", "Will": "会",
-                "Do": "做", "Make": "制作", "Create": "创建", "Build": "建造",
-                "See": "看", "Look": "看", "Watch": "观看", "Read": "读",
-                "Listen": "听", "Hear": "听到", "Speak": "说", "Talk": "说话",
-                "Write": "写", "Draw": "画", "Design": "设计", "Plan": "计划",
-                "Think": "想", "Know": "知道", "Understand": "理解", "Learn": "学习",
-                "Remember": "记住", "Forget": "忘记", "Find": "找到", "Search": "搜索",
-                "Buy": "买", "Sell": "卖", "Pay": "付", "Get": "得到",
-                "Give": "给", "Take": "拿", "Bring": "带来", "Send": "发送",
-                "Come": "来", "Go": "去", "Leave": "离开", "Arrive": "到达",
-                "Start": "开始", "Stop": "停止", "Continue": "继续", "Finish": "完成",
-                "Open": "打开", "Close": "关闭", "Save": "保存", "Delete": "删除",
-                "Copy": "复制", "Paste": "粘贴", "Cut": "剪切", "Print": "打印",
-                "Download": "下载", "Upload": "上传", "Share": "分享", "Link": "链接",
-                "New": "新", "Old": "旧", "Big": "大", "Small": "小",
-                "Fast": "快", "Slow": "慢", "Easy": "容易", "Hard": "困难",
-                "Important": "重要", "Special": "特别", "Different": "不同", "Same": "相同",
-                "Right": "正确", "Wrong": "错误", "True": "真", "False": "假",
-                "Yes": "是", "No": "不", "Maybe": "可能", "Please": "请",
-                "Thank you": "谢谢", "Sorry": "对不起", "Welcome": "欢迎", "Goodbye": "再见",
-                "File": "文件", "Folder": "文件夹", "Directory": "目录",
-                "Code": "代码", "Script": "脚本", "Program": "程序",
-                "Test": "测试", "Check": "检查", "Validate": "验证",
-                "Run": "运行", "Start": "开始", "Begin": "开始",
-                "Stop": "停止", "End": "结束", "Finish": "完成",
-                "Create": "创建", "Make": "制作", "Build": "构建",
-                "Delete": "删除", "Remove": "移除", "Destroy": "破坏",
-                "Update": "更新", "Modify": "修改", "Change": "改变",
-                "Save": "保存", "Store": "存储", "Keep": "保持",
-                "Load": "加载", "Import": "导入", "Bring": "带来",
-                "Export": "导出", "Send": "发送", "Transfer": "转移",
-                "Search": "搜索", "Find": "找到", "Look": "查看",
-                "Replace": "替换", "Substitute": "代替", "Exchange": "交换",
-                "Copy": "复制", "Duplicate": "复制", "Clone": "克隆",
-                "Paste": "粘贴", "Insert": "插入", "Add": "添加",
-                "Cut": "剪切", "Remove": "移除", "Delete": "删除",
-                "Undo": "撤销", "Redo": "重做", "Repeat": "重复",
-                "Cancel": "取消", "Abort": "中断", "Stop": "停止",
-                "Confirm": "确认", "Accept": "接受", "Agree": "同意",
-                "Reject": "拒绝", "Deny": "否认", "Refuse": "拒绝",
-                "Yes": "是", "No": "否", "Maybe": "可能", "Perhaps": "可能",
-                "Please": "请", "Thank you": "谢谢", "Thanks": "谢谢",
-                "Welcome": "欢迎", "Good": "好", "Bad": "坏",
-                "Big": "大", "Small": "小", "Large": "大",
-                "Fast": "快", "Slow": "慢", "Quick": "快",
-                "Easy": "容易", "Hard": "困难", "Simple": "简单",
-                "Complex": "复杂", "Advanced": "高级", "Basic": "基本",
-                "New": "新", "Old": "老", "Recent": "最近",
-                "First": "第一", "Last": "最后", "Next": "下一个",
-                "Previous": "上一个", "Before": "之前", "After": "之后",
-                "Now": "现在", "Today": "今天", "Tomorrow": "明天",
-                "Yesterday": "昨天", "Week": "周", "Month": "月",
-                "Year": "年", "Time": "时间", "Date": "日期",
-                "Name": "名称", "Title": "标题", "Description": "描述",
-                "Content": "内容", "Text": "文本", "Message": "消息",
-                "Note": "备注", "Comment": "评论", "Remark": "说明",
-                "Help": "帮助", "Support": "支持", "Assistance": "协助",
-                "Manual": "手册", "Tutorial": "教程", "Guide": "指南",
-                "Reference": "参考", "Documentation": "文档", "Docs": "文档",
-                "About": "关于", "Info": "信息", "Details": "详细",
-                "Settings": "设置", "Options": "选项", "Preferences": "偏好",
-                "Profile": "个人资料", "Account": "账户", "User": "用户",
-                "Password": "密码", "Username": "用户名", "Login": "登录",
-                "Logout": "登出", "Sign out": "登出", "Exit": "退出",
-                "Home": "主页", "Main": "主要", "Dashboard": "仪表板",
-                "Menu": "菜单", "Navigation": "导航", "Links": "链接",
-                "Button": "按钮", "Click": "点击", "Press": "按",
-                "Select": "选择", "Choose": "选择", "Pick": "选择",
-                "Input": "输入", "Field": "字段", "Form": "表单",
-                "Submit": "提交", "Send": "发送", "Upload": "上传",
-                "Download": "下载", "Get": "获得", "Receive": "接收",
-                "View": "查看", "Show": "显示", "Display": "显示",
-                "Hide": "隐藏", "Conceal": "隐藏", "Mask": "掩盖",
-                "Open": "打开", "Close": "关闭", "Shut": "关闭",
-                "Minimize": "最小化", "Maximize": "最大化", "Resize": "调整大小",
-                "Move": "移动", "Drag": "拖拽", "Drop": "放下",
-                "Resize": "调整大小", "Scale": "缩放", "Adjust": "调整",
-                "Zoom": "缩放", "Enlarge": "扩大", "Reduce": "缩小",
-                "Print": "打印", "Export": "导出", "Share": "分享",
-                "Email": "电子邮件", "Mail": "邮件", "Message": "消息",
-                "Contact": "联系", "Address": "地址", "Phone": "电话",
-                "Number": "数字", "Count": "计数", "Amount": "数量",
-                "Price": "价格", "Cost": "成本", "Value": "价值",
-                "Free": "免费", "Paid": "付费", "Premium": "高级",
-                "Public": "公共", "Private": "私人", "Secret": "秘密",
-                "Secure": "安全", "Safe": "安全", "Protected": "保护",
-                "Lock": "锁定", "Unlock": "解锁", "Key": "键",
-                "Access": "访问", "Permission": "权限", "Grant": "授予",
-                "Deny": "拒绝", "Allow": "允许", "Block": "阻止",
-                "Enable": "启用", "Disable": "禁用", "Activate": "激活",
-                "Deactivate": "停用", "Turn on": "打开", "Turn off": "关闭",
-                "Start": "开始", "Begin": "开始", "Launch": "启动",
-                "Stop": "停止", "End": "结束", "Finish": "完成",
-                "Pause": "暂停", "Resume": "恢复", "Continue": "继续",
-                "Restart": "重启", "Reset": "重置", "Refresh": "刷新",
-                "Reload": "重载", "Update": "更新", "Upgrade": "升级",
-                "Install": "安装", "Uninstall": "卸载", "Remove": "移除",
-                "Add": "添加", "Insert": "插入", "Include": "包括",
-                "Remove": "移除", "Delete": "删除", "Exclude": "排除",
-                "Create": "创建", "Make": "制作", "Generate": "生成",
-                "Build": "构建", "Compile": "编译", "Assemble": "组装",
-                "Test": "测试", "Check": "检查", "Validate": "验证",
-                "Debug": "调试", "Fix": "修复", "Repair": "修理",
-                "Error": "错误", "Bug": "虫", "Issue": "问题",
-                "Problem": "问题", "Trouble": "麻烦", "Difficulty": "困难",
-                "Solution": "解决方案", "Answer": "答案", "Result": "结果",
-                "Success": "成功", "Achievement": "成就", "Victory": "胜利",
-                "Failure": "失败", "Loss": "损失", "Defeat": "败北",
-                "Warning": "警告", "Alert": "警报", "Notice": "通知",
-                "Info": "信息", "Details": "详细", "Summary": "摘要",
-                "Report": "报告", "Log": "日志", "History": "历史",
-                "Record": "记录", "Entry": "条目", "Item": "项目",
-                "List": "列表", "Table": "表格", "Grid": "网格",
-                "Chart": "图表", "Graph": "图表", "Diagram": "图解",
-                "Image": "图片", "Picture": "图片", "Photo": "照片",
-                "Video": "视频", "Audio": "音频", "Sound": "声音",
-                "Music": "音乐", "Song": "歌曲", "Track": "轨道",
-                "File": "文件", "Document": "文档", "Data": "数据",
-                "Folder": "文件夹", "Directory": "目录", "Path": "路径",
-                "Link": "链接", "URL": "网址", "Address": "地址",
-                "Website": "网站", "Page": "页面", "Site": "站点",
-                "Web": "网络", "Internet": "互联网", "Network": "网络",
-                "Connection": "连接", "Connect": "连接", "Join": "加入",
-                "Disconnect": "断开", "Leave": "离开", "Quit": "退出",
-                "Online": "在线", "Offline": "离线", "Available": "可用",
-                "Busy": "忙", "Free": "免费", "Ready": "准备好",
-                "Loading": "加载中", "Processing": "处理中", "Working": "工作中",
-                "Complete": "完成", "Finished": "完成", "Done": "完成",
-                "Ready": "准备好", "Prepared": "准备好", "Set": "设置",
-                "Wait": "等待", "Hold": "持有", "Pause": "暂停",
-                "Continue": "继续", "Proceed": "继续", "Go": "去",
-                "Come": "来", "Arrive": "到达", "Reach": "到达",
-                "Leave": "离开", "Go away": "走开", "Depart": "出发",
-                "Enter": "进入", "Exit": "退出", "Access": "访问",
-                "Welcome": "欢迎", "Hello": "你好", "Goodbye": "再见",
-                "Thank you": "谢谢", "Please": "请", "Sorry": "对不起",
-                "Excuse me": "抱歉", "Pardon": "请原谅", "Forgive": "原谅",
-                "Understand": "理解", "Know": "知道", "Learn": "学习",
-                "Study": "学习", "Read": "阅读", "Write": "写",
-                "Speak": "说", "Talk": "说", "Listen": "听",
-                "Hear": "听到", "See": "看到", "Look": "看", "Watch": "观看",
-                "Touch": "触摸", "Feel": "感觉", "Smell": "闻", "Taste": "味道"
-            },
-            ("en", "ja"): {
-                "Hello": "こんにちは",
-                "World": "世界",
-                "Documentation": "ドキュメント",
-                "API": "API",
-                "Function": "関数",
-                "Class": "クラス",
-                "Method": "メソッド",
-                "Parameter": "パラメータ",
-                "Return": "戻る",
-                "Install": "インストール",
-                "Setup": "セットアップ",
-                "Usage": "使用方法",
-                "Example": "例",
-                "Installation": "インストール",
-                "Configuration": "設定",
-                "Authentication": "認証",
-                "Database": "データベース",
-                "Server": "サーバー",
-                "Client": "クライアント",
-                "Error": "エラー",
-                "Success": "成功"
-            }
-        }
-        
         lang_pair = (source_lang, target_lang)
-        if lang_pair in translations:
-            translated = content
-            
-            # First, try to translate common phrases (longer matches first)
-            phrases = sorted(translations[lang_pair].keys(), key=len, reverse=True)
-            for phrase in phrases:
-                if len(phrase.split()) > 1:  # Multi-word phrases
-                    import re
-                    pattern = r'\b' + re.escape(phrase) + r'\b'
-                    translated = re.sub(pattern, translations[lang_pair][phrase], translated, flags=re.IGNORECASE)
-            
-            # Then translate individual words (case-insensitive)
-            for eng, translated_word in translations[lang_pair].items():
-                if len(eng.split()) == 1:  # Single words only
-                    import re
-                    pattern = r'\b' + re.escape(eng) + r'\b'
-                    translated = re.sub(pattern, translated_word, translated, flags=re.IGNORECASE)
-            
-            # If still no translation found, try word-by-word translation
-            if translated == content:
-                words = content.split()
-                translated_words = []
-                for word in words:
-                    # Clean the word (remove punctuation)
-                    clean_word = re.sub(r'[^\w]', '', word.lower())
-                    if clean_word in translations[lang_pair]:
-                        translated_word = translations[lang_pair][clean_word]
-                        translated_words.append(translated_word)
-                    else:
-                        translated_words.append(word)
-                translated = ' '.join(translated_words)
-            
-            return translated
-        else:
+        table = self._translations.get(lang_pair)
+        if table is None:
             # For unsupported language pairs, return content with language indicator
-            return f"[{target_lang.upper()}] {content}"
+            prefix = self._fallback_prefix.get(target_lang)
+            if prefix is None:
+                prefix = f"[{target_lang.upper()}] "
+            return prefix + content
+        
+        translated, matches = self._dictionary_translate(content, lang_pair)
+        
+        # If still no translation found, try word-by-word translation
+        if not matches:
+            translated_words = []
+            # Bind the per-word callables once so the loop runs on local lookups
+            append = translated_words.append
+            table_get = table.get
+            punctuation_table = _PUNCTUATION_TABLE
+            for word in content.split():
+                # Clean the word (remove punctuation)
+                append(table_get(word.lower().translate(punctuation_table), word))
+            translated = ' '.join(translated_words)
+        
+        return translated
     
     async def _ai_powered_fallback(self, content: str, source_lang: str, target_lang: str) -> str:
         """AI-powered fallback using Hugging Face text generation for any sentence"""
         try:
             from core.config import settings
-            import httpx
             
             if not settings.huggingface_api_key:
-                return self._enhanced_fallback_translate(content, source_lang, target_lang)
+                return await self._offline_translate(content, source_lang, target_lang)
             
             headers = {"Authorization": f"Bearer {settings.huggingface_api_key}"}
             
@@ -994,60 +1264,67 @@ class TranslationManager:
                 model = "Helsinki-NLP/opus-mt-en-mul"
             else:
                 # For other language pairs, try to find a suitable model
-                model_mapping = {
-                    ("en", "zh"): "Helsinki-NLP/opus-mt-en-zh",
-                    ("en", "es"): "Helsinki-NLP/opus-mt-en-es",
-                    ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
-                    ("en", "de"): "Helsinki-NLP/opus-mt-en-de",
-                    ("en", "ja"): "Helsinki-NLP/opus-mt-en-jap",
-                    ("en", "ko"): "Helsinki-NLP/opus-mt-en-ko",
-                    ("zh", "en"): "Helsinki-NLP/opus-mt-zh-en",
-                    ("es", "en"): "Helsinki-NLP/opus-mt-es-en",
-                    ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
-                    ("de", "en"): "Helsinki-NLP/opus-mt-de-en",
-                    ("ja", "en"): "Helsinki-NLP/opus-mt-jap-en",
-                    ("ko", "en"): "Helsinki-NLP/opus-mt-ko-en"
-                }
-                model = model_mapping.get((source_lang, target_lang), "Helsinki-NLP/opus-mt-mul-en")
+                model = _HF_MODEL_MAP.get((source_lang, target_lang), "Helsinki-NLP/opus-mt-mul-en")
+            
+            # Sentences the offline dictionary fully covers are translated locally;
+            # the rest go to the model in their source form, batched in one request
+            segments, untranslated, overflow = await asyncio.to_thread(
+                self._split_untranslated_sentences, content, (source_lang, target_lang)
+            )
             
+            # Whatever no longer fits the model's budget takes the offline path,
+            # which keeps its language prefix for unsupported pairs
+            tail = ''
+            if overflow < len(segments):
+                tail = await self._offline_translate(''.join(segments[overflow:]), source_lang, target_lang)
+            
+            if not untranslated:
+                return ''.join(segments[:overflow]) + tail
+            
+            inputs = [segments[index] for index in untranslated]
             payload = {
-                "inputs": content[:500],
+                "inputs": inputs,
                 "parameters": {
-                    "max_length": len(content) + 100,
+                    "max_length": max(len(sentence) for sentence in inputs) + 100,
                     "do_sample": True,
                     "temperature": 0.7
                 }
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"https://api-inference.huggingface.co/models/{model}",
-                    json=payload,
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if isinstance(result, list) and len(result) > 0:
-                        translation = result[0].get('translation_text', '')
-                        if translation and translation != content:
-                            return translation
-                
-                # If the specific model fails, try a general translation approach
-                return await self._try_general_translation(content, source_lang, target_lang)
-                
+            response = await self.hf_client.post(
+                f"https://api-inference.huggingface.co/models/{model}",
+                json=payload,
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                if isinstance(result, list) and len(result) == len(inputs):
+                    translated_any = False
+                    for index, item in zip(untranslated, result):
+                        if isinstance(item, list) and item:
+                            item = item[0]
+                        translation = item.get('translation_text', '') if isinstance(item, dict) else ''
+                        if translation and translation != segments[index]:
+                            segments[index] = translation
+                            translated_any = True
+                    if translated_any:
+                        return ''.join(segments[:overflow]) + tail
+            
+            # If the specific model fails, try a general translation approach
+            return await self._try_general_translation(content, source_lang, target_lang)
+            
         except Exception as e:
             logger.error(f"AI-powered fallback error: {e}")
-            return self._enhanced_fallback_translate(content, source_lang, target_lang)
+            return await self._offline_translate(content, source_lang, target_lang)
     
     async def _try_general_translation(self, content: str, source_lang: str, target_lang: str) -> str:
         """Try general translation using text generation"""
         try:
             from core.config import settings
-            import httpx
             
             if not settings.huggingface_api_key:
-                return self._enhanced_fallback_translate(content, source_lang, target_lang)
+                return await self._offline_translate(content, source_lang, target_lang)
             
             headers = {"Authorization": f"Bearer {settings.huggingface_api_key}"}
             
@@ -1071,480 +1348,51 @@ class TranslationManager:
                 "EleutherAI/gpt-neo-125M"  # General purpose
             ]
             
-            for model in models:
-                try:
-                    async with httpx.AsyncClient(timeout=30.0) as client:
-                        response = await client.post(
-                            f"https://api-inference.huggingface.co/models/{model}",
-                            json=payload,
-                            headers=headers
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            if isinstance(result, list) and len(result) > 0:
-                                generated_text = result[0].get('generated_text', '')
-                                # Extract the translation part
-                                if 'Translation:' in generated_text:
-                                    translation = generated_text.split('Translation:')[-1].strip()
-                                    if translation and translation != content:
-                                        return translation
-                except:
-                    continue
+            # Query all models concurrently and take the first usable answer
+            pending = [
+                asyncio.create_task(self.hf_client.post(
+                    f"https://api-inference.huggingface.co/models/{model}",
+                    json=payload,
+                    headers=headers
+                ))
+                for model in models
+            ]
+            try:
+                for finished in asyncio.as_completed(pending, timeout=30.0):
+                    try:
+                        response = await finished
+                        if response.status_code != 200:
+                            continue
+                        result = response.json()
+                    except asyncio.TimeoutError:
+                        break
+                    except Exception:
+                        continue
+                    
+                    if isinstance(result, list) and len(result) > 0:
+                        generated_text = result[0].get('generated_text', '')
+                        # Extract the translation part
+                        if 'Translation:' in generated_text:
+                            translation = generated_text.split('Translation:')[-1].strip()
+                            if translation and translation != content:
+                                return translation
+            finally:
+                for request in pending:
+                    request.cancel()
+                # Wait for the cancelled requests to unwind so their connections
+                # go back to the pool and no "exception never retrieved" is logged
+                await asyncio.gather(*pending, return_exceptions=True)
             
-            return self._enhanced_fallback_translate(content, source_lang, target_lang)
+            return await self._offline_translate(content, source_lang, target_lang)
             
         except Exception as e:
             logger.error(f"General translation error: {e}")
-            return self._enhanced_fallback_translate(content, source_lang, target_lang)
+            return await self._offline_translate(content, source_lang, target_lang)
     
     def _fallback_translate(self, content: str, source_lang: str, target_lang: str) -> str:
         """Fallback translation when AI is not available"""
-        # Comprehensive fallback translations
-        translations = {
-            ("en", "es"): {
-                # Common words
-                "Hello": "Hola", "Hi": "Hola", "Goodbye": "Adiós", "Bye": "Adiós",
-                "World": "Mundo", "Earth": "Tierra", "Country": "País", "City": "Ciudad",
-                "Documentation": "Documentación", "Document": "Documento", "Guide": "Guía",
-                "API": "API", "Application": "Aplicación", "Program": "Programa",
-                "Function": "Función", "Method": "Método", "Procedure": "Procedimiento",
-                "Class": "Clase", "Object": "Objeto", "Instance": "Instancia",
-                "Parameter": "Parámetro", "Argument": "Argumento", "Variable": "Variable",
-                "Return": "Retornar", "Send": "Enviar", "Give": "Dar", "Back": "Atrás",
-                "Install": "Instalar", "Setup": "Configuración", "Configure": "Configurar",
-                "Usage": "Uso", "Use": "Usar", "Utilize": "Utilizar", "Apply": "Aplicar",
-                "Example": "Ejemplo", "Sample": "Muestra", "Instance": "Instancia",
-                "Installation": "Instalación", "Setup": "Configuración", "Install": "Instalar",
-                "Configuration": "Configuración", "Settings": "Ajustes", "Options": "Opciones",
-                "Authentication": "Autenticación", "Login": "Iniciar sesión", "Sign in": "Iniciar sesión",
-                "Database": "Base de datos", "Data": "Datos", "Information": "Información",
-                "Server": "Servidor", "Service": "Servicio", "Host": "Anfitrión",
-                "Client": "Cliente", "User": "Usuario", "Customer": "Cliente",
-                "Error": "Error", "Mistake": "Error", "Problem": "Problema", "Issue": "Problema",
-                "Success": "Éxito", "Achievement": "Logro", "Accomplishment": "Logro",
-                "File": "Archivo", "Folder": "Carpeta", "Directory": "Directorio",
-                "Code": "Código", "Script": "Script", "Program": "Programa",
-                "Test": "Prueba", "Check": "Verificar", "Validate": "Validar",
-                "Run": "Ejecutar", "Start": "Iniciar", "Begin": "Comenzar",
-                "Stop": "Detener", "End": "Terminar", "Finish": "Finalizar",
-                "Create": "Crear", "Make": "Hacer", "Build": "Construir",
-                "Delete": "Eliminar", "Remove": "Quitar", "Destroy": "Destruir",
-                "Update": "Actualizar", "Modify": "Modificar", "Change": "Cambiar",
-                "Save": "Guardar", "Store": "Almacenar", "Keep": "Mantener",
-                "Load": "Cargar", "Import": "Importar", "Bring": "Traer",
-                "Export": "Exportar", "Send": "Enviar", "Transfer": "Transferir",
-                "Search": "Buscar", "Find": "Encontrar", "Look": "Buscar",
-                "Replace": "Reemplazar", "Substitute": "Sustituir", "Exchange": "Intercambiar",
-                "Copy": "Copiar", "Duplicate": "Duplicar", "Clone": "Clonar",
-                "Paste": "Pegar", "Insert": "Insertar", "Add": "Agregar",
-                "Cut": "Cortar", "Remove": "Quitar", "Delete": "Eliminar",
-                "Undo": "Deshacer", "Redo": "Rehacer", "Repeat": "Repetir",
-                "Cancel": "Cancelar", "Abort": "Abortar", "Stop": "Detener",
-                "Confirm": "Confirmar", "Accept": "Aceptar", "Agree": "Aceptar",
-                "Reject": "Rechazar", "Deny": "Negar", "Refuse": "Rechazar",
-                "Yes": "Sí", "No": "No", "Maybe": "Tal vez", "Perhaps": "Quizás",
-                "Please": "Por favor", "Thank you": "Gracias", "Thanks": "Gracias",
-                "Welcome": "Bienvenido", "Good": "Bueno", "Bad": "Malo",
-                "Big": "Grande", "Small": "Pequeño", "Large": "Grande",
-                "Fast": "Rápido", "Slow": "Lento", "Quick": "Rápido",
-                "Easy": "Fácil", "Hard": "Difícil", "Simple": "Simple",
-                "Complex": "Complejo", "Advanced": "Avanzado", "Basic": "Básico",
-                "New": "Nuevo", "Old": "Viejo", "Recent": "Reciente",
-                "First": "Primero", "Last": "Último", "Next": "Siguiente",
-                "Previous": "Anterior", "Before": "Antes", "After": "Después",
-                "Now": "Ahora", "Today": "Hoy", "Tomorrow": "Mañana",
-                "Yesterday": "Ayer", "Week": "Semana", "Month": "Mes",
-                "Year": "Año", "Time": "Tiempo", "Date": "Fecha",
-                "Name": "Nombre", "Title": "Título", "Description": "Descripción",
-                "Content": "Contenido", "Text": "Texto", "Message": "Mensaje",
-                "Note": "Nota", "Comment": "Comentario", "Remark": "Observación",
-                "Help": "Ayuda", "Support": "Soporte", "Assistance": "Asistencia",
-                "Manual": "Manual", "Tutorial": "Tutorial", "Guide": "Guía",
-                "Reference": "Referencia", "Documentation": "Documentación", "Docs": "Documentos",
-                "About": "Acerca de", "Info": "Información", "Details": "Detalles",
-                "Settings": "Configuración", "Options": "Opciones", "Preferences": "Preferencias",
-                "Profile": "Perfil", "Account": "Cuenta", "User": "Usuario",
-                "Password": "Contraseña", "Username": "Nombre de usuario", "Login": "Inicio de sesión",
-                "Logout": "Cerrar sesión", "Sign out": "Cerrar sesión", "Exit": "Salir",
-                "Home": "Inicio", "Main": "Principal", "Dashboard": "Panel de control",
-                "Menu": "Menú", "Navigation": "Navegación", "Links": "Enlaces",
-                "Button": "Botón", "Click": "Hacer clic", "Press": "Presionar",
-                "Select": "Seleccionar", "Choose": "Elegir", "Pick": "Elegir",
-                "Input": "Entrada", "Field": "Campo", "Form": "Formulario",
-                "Submit": "Enviar", "Send": "Enviar", "Upload": "Subir",
-                "Download": "Descargar", "Get": "Obtener", "Receive": "Recibir",
-                "View": "Ver", "Show": "Mostrar", "Display": "Mostrar",
-                "Hide": "Ocultar", "Conceal": "Ocultar", "Mask": "Enmascarar",
-                "Open": "Abrir", "Close": "Cerrar", "Shut": "Cerrar",
-                "Minimize": "Minimizar", "Maximize": "Maximizar", "Resize": "Redimensionar",
-                "Move": "Mover", "Drag": "Arrastrar", "Drop": "Soltar",
-                "Resize": "Redimensionar", "Scale": "Escalar", "Adjust": "Ajustar",
-                "Zoom": "Zoom", "Enlarge": "Ampliar", "Reduce": "Reducir",
-                "Print": "Imprimir", "Export": "Exportar", "Share": "Compartir",
-                "Email": "Correo electrónico", "Mail": "Correo", "Message": "Mensaje",
-                "Contact": "Contacto", "Address": "Dirección", "Phone": "Teléfono",
-                "Number": "Número", "Count": "Contar", "Amount": "Cantidad",
-                "Price": "Precio", "Cost": "Costo", "Value": "Valor",
-                "Free": "Gratis", "Paid": "Pagado", "Premium": "Premium",
-                "Public": "Público", "Private": "Privado", "Secret": "Secreto",
-                "Secure": "Seguro", "Safe": "Seguro", "Protected": "Protegido",
-                "Lock": "Bloquear", "Unlock": "Desbloquear", "Key": "Clave",
-                "Access": "Acceso", "Permission": "Permiso", "Grant": "Conceder",
-                "Deny": "Denegar", "Allow": "Permitir", "Block": "Bloquear",
-                "Enable": "Habilitar", "Disable": "Deshabilitar", "Activate": "Activar",
-                "Deactivate": "Desactivar", "Turn on": "Encender", "Turn off": "Apagar",
-                "Start": "Iniciar", "Begin": "Comenzar", "Launch": "Lanzar",
-                "Stop": "Detener", "End": "Terminar", "Finish": "Finalizar",
-                "Pause": "Pausar", "Resume": "Reanudar", "Continue": "Continuar",
-                "Restart": "Reiniciar", "Reset": "Restablecer", "Refresh": "Actualizar",
-                "Reload": "Recargar", "Update": "Actualizar", "Upgrade": "Actualizar",
-                "Install": "Instalar", "Uninstall": "Desinstalar", "Remove": "Quitar",
-                "Add": "Agregar", "Insert": "Insertar", "Include": "Incluir",
-                "Remove": "Quitar", "Delete": "Eliminar", "Exclude": "Excluir",
-                "Create": "Crear", "Make": "Hacer", "Generate": "Generar",
-                "Build": "Construir", "Compile": "Compilar", "Assemble": "Ensamblar",
-                "Test": "Probar", "Check": "Verificar", "Validate": "Validar",
-                "Debug": "Depurar", "Fix": "Arreglar", "Repair": "Reparar",
-                "Error": "Error", "Bug": "Error", "Issue": "Problema",
-                "Problem": "Problema", "Trouble": "Problema", "Difficulty": "Dificultad",
-                "Solution": "Solución", "Answer": "Respuesta", "Result": "Resultado",
-                "Success": "Éxito", "Achievement": "Logro", "Victory": "Victoria",
-                "Failure": "Fracaso", "Loss": "Pérdida", "Defeat": "Derrota",
-                "Warning": "Advertencia", "Alert": "Alerta", "Notice": "Aviso",
-                "Info": "Información", "Details": "Detalles", "Summary": "Resumen",
-                "Report": "Informe", "Log": "Registro", "History": "Historial",
-                "Record": "Registro", "Entry": "Entrada", "Item": "Elemento",
-                "List": "Lista", "Table": "Tabla", "Grid": "Cuadrícula",
-                "Chart": "Gráfico", "Graph": "Gráfico", "Diagram": "Diagrama",
-                "Image": "Imagen", "Picture": "Imagen", "Photo": "Foto",
-                "Video": "Video", "Audio": "Audio", "Sound": "Sonido",
-                "Music": "Música", "Song": "Canción", "Track": "Pista",
-                "File": "Archivo", "Document": "Documento", "Data": "Datos",
-                "Folder": "Carpeta", "Directory": "Directorio", "Path": "Ruta",
-                "Link": "Enlace", "URL": "URL", "Address": "Dirección",
-                "Website": "Sitio web", "Page": "Página", "Site": "Sitio",
-                "Web": "Web", "Internet": "Internet", "Network": "Red",
-                "Connection": "Conexión", "Connect": "Conectar", "Join": "Unirse",
-                "Disconnect": "Desconectar", "Leave": "Salir", "Quit": "Salir",
-                "Online": "En línea", "Offline": "Sin conexión", "Available": "Disponible",
-                "Busy": "Ocupado", "Free": "Libre", "Ready": "Listo",
-                "Loading": "Cargando", "Processing": "Procesando", "Working": "Trabajando",
-                "Complete": "Completo", "Finished": "Terminado", "Done": "Hecho",
-                "Ready": "Listo", "Prepared": "Preparado", "Set": "Listo",
-                "Wait": "Esperar", "Hold": "Esperar", "Pause": "Pausar",
-                "Continue": "Continuar", "Proceed": "Continuar", "Go": "Ir",
-                "Come": "Venir", "Arrive": "Llegar", "Reach": "Llegar",
-                "Leave": "Salir", "Go away": "Irse", "Depart": "Partir",
-                "Enter": "Entrar", "Exit": "Salir", "Access": "Acceder",
-                "Welcome": "Bienvenido", "Hello": "Hola", "Goodbye": "Adiós",
-                "Thank you": "Gracias", "Please": "Por favor", "Sorry": "Lo siento",
-                "Excuse me": "Disculpe", "Pardon": "Perdón", "Forgive": "Perdonar",
-                "Understand": "Entender", "Know": "Saber", "Learn": "Aprender",
-                "Study": "Estudiar", "Read": "Leer", "Write": "Escribir",
-                "Speak": "Hablar", "Talk": "Hablar", "Listen": "Escuchar",
-                "Hear": "Oír", "See": "Ver", "Look": "Mirar", "Watch": "Ver",
-                "Touch": "Tocar", "Feel": "Sentir", "Smell": "Oler", "Taste": "Probar"
-            },
-            ("en", "fr"): {
-                "Hello": "Bonjour",
-                "World": "Monde",
-                "Documentation": "Documentation",
-                "API": "API",
-                "Function": "Fonction",
-                "Class": "Classe",
-                "Method": "Méthode",
-                "Parameter": "Paramètre",
-                "Return": "Retourner",
-                "Install": "Installer",
-                "Setup": "Configuration",
-                "Usage": "Utilisation",
-                "Example": "Exemple",
-                "Installation": "Installation",
-                "Configuration": "Configuration",
-                "Authentication": "Authentification",
-                "Database": "Base de données",
-                "Server": "Serveur",
-                "Client": "Client",
-                "Error": "Erreur",
-                "Success": "Succès"
-            },
-            ("en", "de"): {
-                "Hello": "Hallo",
-                "World": "Welt",
-                "Documentation": "Dokumentation",
-                "API": "API",
-                "Function": "Funktion",
-                "Class": "Klasse",
-                "Method": "Methode",
-                "Parameter": "Parameter",
-                "Return": "Zurückgeben",
-                "Install": "Installieren",
-                "Setup": "Einrichtung",
-                "Usage": "Verwendung",
-                "Example": "Beispiel",
-                "Installation": "Installation",
-                "Configuration": "Konfiguration",
-                "Authentication": "Authentifizierung",
-                "Database": "Datenbank",
-                "Server": "Server",
-                "Client": "Client",
-                "Error": "Fehler",
-                "Success": "Erfolg"
-            },
-            ("en", "zh"): {
-                # Common words and phrases
-                "Hello": "你好", "Hi": "你好", "Goodbye": "再见", "Bye": "再见",
-                "World": "世界", "Earth": "地球", "Country": "国家", "City": "城市",
-                "Documentation": "文档", "Document": "文件", "Guide": "指南",
-                "API": "API", "Application": "应用程序", "Program": "程序",
-                "Function": "函数", "Method": "方法", "Procedure": "程序",
-                "Parameter": "参数", "Argument": "参数", "Variable": "变量",
-                "Return": "返回", "Send": "发送", "Give": "给", "Back": "后面",
-                "Install": "安装", "Setup": "设置", "Configure": "配置",
-                "Usage": "使用", "Use": "使用", "Utilize": "利用", "Apply": "应用",
-                "Example": "示例", "Sample": "样本", "Instance": "实例",
-                "Installation": "安装", "Setup": "设置", "Install": "安装",
-                "Configuration": "配置", "Settings": "设置", "Options": "选项",
-                "Authentication": "认证", "Login": "登录", "Sign in": "登录",
-                "Database": "数据库", "Data": "数据", "Information": "信息",
-                "Server": "服务器", "Service": "服务", "Host": "主机",
-                "Client": "客户端", "User": "用户", "Customer": "客户",
-                "Error": "错误", "Mistake": "错误", "Problem": "问题", "Issue": "问题",
-                "Success": "成功", "Achievement": "成就", "Accomplishment": "成就",
-                # Personal pronouns and common words
-                "I": "我", "You": "你", "He": "他", "She": "她", "It": "它", "We": "我们", "They": "他们",
-                "Am": "是", "Is": "是", "Are": "是", "Was": "是", "Were": "是", "Be": "是", "Been": "是",
-                "A": "一个", "An": "一个", "The": "这个", "This": "这个", "That": "那个", "These": "这些", "Those": "那些",
-                "Good": "好", "Bad": "坏", "Great": "很好", "Excellent": "优秀", "Perfect": "完美",
-                "Scientist": "科学家", "Engineer": "工程师", "Developer": "开发者", "Programmer": "程序员",
-                "Student": "学生", "Teacher": "老师", "Professor": "教授", "Doctor": "医生",
-                "Manager": "经理", "Director": "主任", "CEO": "首席执行官", "President": "总裁",
-                "Company": "公司", "Business": "企业", "Organization": "组织", "Team": "团队",
-                "Project": "项目", "Work": "工作", "Job": "工作", "Career": "职业",
-                "Study": "学习", "Research": "研究", "Analysis": "分析", "Report": "报告",
-                "Book": "书", "Article": "文章", "Paper": "论文", "Document": "文档",
-                "Computer": "计算机", "Software": "软件", "Hardware": "硬件", "System": "系统",
-                "Network": "网络", "Internet": "互联网", "Website": "网站", "Application": "应用",
-                "Mobile": "移动", "Phone": "电话", "Email": "电子邮件", "Message": "消息",
-                "Meeting": "会议", "Conference": "会议", "Presentation": "演示", "Discussion": "讨论",
-                "Problem": "问题", "Solution": "解决方案", "Answer": "答案", "Question": "问题",
-                "Help": "帮助", "Support": "支持", "Service": "服务", "Customer": "客户",
-                "Money": "钱", "Price": "价格", "Cost": "成本", "Budget": "预算",
-                "Time": "时间", "Date": "日期", "Today": "今天", "Tomorrow": "明天", "Yesterday": "昨天",
-                "Morning": "早上", "Afternoon": "下午", "Evening": "晚上", "Night": "晚上",
-                "Week": "周", "Month": "月", "Year": "年", "Day": "天",
-                "Home": "家", "Office": "办公室", "School": "学校", "University": "大学",
-                "Hospital": "医院", "Store": "商店", "Restaurant": "餐厅", "Hotel": "酒店",
-                "Car": "汽车", "Bus": "公交车", "Train": "火车", "Airplane": "飞机",
-                "Food": "食物", "Water": "水", "Coffee": "咖啡", "Tea": "茶",
-                "Family": "家庭", "Friend": "朋友", "Colleague": "同事", "Partner": "伙伴",
-                "Love": "爱", "Like": "喜欢", "Hate": "讨厌", "Want": "想要",
-                "Need": "需要", "Must": "必须", "Should": "应该", "Can": "能", "Will": "会",
-                "Do": "做", "Make": "制作", "Create": "创建", "Build": "建造",
-                "See": "看", "Look": "看", "Watch": "观看", "Read": "读",
-                "Listen": "听", "Hear": "听到", "Speak": "说", "Talk": "说话",
-                "Write": "写", "Draw": "画", "Design": "设计", "Plan": "计划",
-                "Think": "想", "Know": "知道", "Understand": "理解", "Learn": "学习",
-                "Remember": "记住", "Forget": "忘记", "Find": "找到", "Search": "搜索",
-                "Buy": "买", "Sell": "卖", "Pay": "付", "Get": "得到",
-                "Give": "给", "Take": "拿", "Bring": "带来", "Send": "发送",
-                "Come": "来", "Go": "去", "Leave": "离开", "Arrive": "到达",
-                "Start": "开始", "Stop": "停止", "Continue": "继续", "Finish": "完成",
-                "Open": "打开", "Close": "关闭", "Save": "保存", "Delete": "删除",
-                "Copy": "复制", "Paste": "粘贴", "Cut": "剪切", "Print": "打印",
-                "Download": "下载", "Upload": "上传", "Share": "分享", "Link": "链接",
-                "New": "新", "Old": "旧", "Big": "大", "Small": "小",
-                "Fast": "快", "Slow": "慢", "Easy": "容易", "Hard": "困难",
-                "Important": "重要", "Special": "特别", "Different": "不同", "Same": "相同",
-                "Right": "正确", "Wrong": "错误", "True": "真", "False": "假",
-                "Yes": "是", "No": "不", "Maybe": "可能", "Please": "请",
-                "Thank you": "谢谢", "Sorry": "对不起", "Welcome": "欢迎", "Goodbye": "再见",
-                "File": "文件", "Folder": "文件夹", "Directory": "目录",
-                "Code": "代码", "Script": "脚本", "Program": "程序",
-                "Test": "测试", "Check": "检查", "Validate": "验证",
-                "Run": "运行", "Start": "开始", "Begin": "开始",
-                "Stop": "停止", "End": "结束", "Finish": "完成",
-                "Create": "创建", "Make": "制作", "Build": "构建",
-                "Delete": "删除", "Remove": "移除", "Destroy": "破坏",
-                "Update": "更新", "Modify": "修改", "Change": "改变",
-                "Save": "保存", "Store": "存储", "Keep": "保持",
-                "Load": "加载", "Import": "导入", "Bring": "带来",
-                "Export": "导出", "Send": "发送", "Transfer": "转移",
-                "Search": "搜索", "Find": "找到", "Look": "查看",
-                "Replace": "替换", "Substitute": "代替", "Exchange": "交换",
-                "Copy": "复制", "Duplicate": "复制", "Clone": "克隆",
-                "Paste": "粘贴", "Insert": "插入", "Add": "添加",
-                "Cut": "剪切", "Remove": "移除", "Delete": "删除",
-                "Undo": "撤销", "Redo": "重做", "Repeat": "重复",
-                "Cancel": "取消", "Abort": "中断", "Stop": "停止",
-                "Confirm": "确认", "Accept": "接受", "Agree": "同意",
-                "Reject": "拒绝", "Deny": "否认", "Refuse": "拒绝",
-                "Yes": "是", "No": "否", "Maybe": "可能", "Perhaps": "可能",
-                "Please": "请", "Thank you": "谢谢", "Thanks": "谢谢",
-                "Welcome": "欢迎", "Good": "好", "Bad": "坏",
-                "Big": "大", "Small": "小", "Large": "大",
-                "Fast": "快", "Slow": "慢", "Quick": "快",
-                "Easy": "容易", "Hard": "困难", "Simple": "简单",
-                "Complex": "复杂", "Advanced": "高级", "Basic": "基本",
-                "New": "新", "Old": "老", "Recent": "最近",
-                "First": "第一", "Last": "最后", "Next": "下一个",
-                "Previous": "上一个", "Before": "之前", "After": "之后",
-                "Now": "现在", "Today": "今天", "Tomorrow": "明天",
-                "Yesterday": "昨天", "Week": "周", "Month": "月",
-                "Year": "年", "Time": "时间", "Date": "日期",
-                "Name": "名称", "Title": "标题", "Description": "描述",
-                "Content": "内容", "Text": "文本", "Message": "消息",
-                "Note": "备注", "Comment": "评论", "Remark": "说明",
-                "Help": "帮助", "Support": "支持", "Assistance": "协助",
-                "Manual": "手册", "Tutorial": "教程", "Guide": "指南",
-                "Reference": "参考", "Documentation": "文档", "Docs": "文档",
-                "About": "关于", "Info": "信息", "Details": "详细",
-                "Settings": "设置", "Options": "选项", "Preferences": "偏好",
-                "Profile": "个人资料", "Account": "账户", "User": "用户",
-                "Password": "密码", "Username": "用户名", "Login": "登录",
-                "Logout": "登出", "Sign out": "登出", "Exit": "退出",
-                "Home": "主页", "Main": "主要", "Dashboard": "仪表板",
-                "Menu": "菜单", "Navigation": "导航", "Links": "链接",
-                "Button": "按钮", "Click": "点击", "Press": "按",
-                "Select": "选择", "Choose": "选择", "Pick": "选择",
-                "Input": "输入", "Field": "字段", "Form": "表单",
-                "Submit": "提交", "Send": "发送", "Upload": "上传",
-                "Download": "下载", "Get": "获得", "Receive": "接收",
-                "View": "查看", "Show": "显示", "Display": "显示",
-                "Hide": "隐藏", "Conceal": "隐藏", "Mask": "掩盖",
-                "Open": "打开", "Close": "关闭", "Shut": "关闭",
-                "Minimize": "最小化", "Maximize": "最大化", "Resize": "调整大小",
-                "Move": "移动", "Drag": "拖拽", "Drop": "放下",
-                "Resize": "调整大小", "Scale": "缩放", "Adjust": "调整",
-                "Zoom": "缩放", "Enlarge": "扩大", "Reduce": "缩小",
-                "Print": "打印", "Export": "导出", "Share": "分享",
-                "Email": "电子邮件", "Mail": "邮件", "Message": "消息",
-                "Contact": "联系", "Address": "地址", "Phone": "电话",
-                "Number": "数字", "Count": "计数", "Amount": "数量",
-                "Price": "价格", "Cost": "成本", "Value": "价值",
-                "Free": "免费", "Paid": "付费", "Premium": "高级",
-                "Public": "公共", "Private": "私人", "Secret": "秘密",
-                "Secure": "安全", "Safe": "安全", "Protected": "保护",
-                "Lock": "锁定", "Unlock": "解锁", "Key": "键",
-                "Access": "访问", "Permission": "权限", "Grant": "授予",
-                "Deny": "拒绝", "Allow": "允许", "Block": "阻止",
-                "Enable": "启用", "Disable": "禁用", "Activate": "激活",
-                "Deactivate": "停用", "Turn on": "打开", "Turn off": "关闭",
-                "Start": "开始", "Begin": "开始", "Launch": "启动",
-                "Stop": "停止", "End": "结束", "Finish": "完成",
-                "Pause": "暂停", "Resume": "恢复", "Continue": "继续",
-                "Restart": "重启", "Reset": "重置", "Refresh": "刷新",
-                "Reload": "重载", "Update": "更新", "Upgrade": "升级",
-                "Install": "安装", "Uninstall": "卸载", "Remove": "移除",
-                "Add": "添加", "Insert": "插入", "Include": "包括",
-                "Remove": "移除", "Delete": "删除", "Exclude": "排除",
-                "Create": "创建", "Make": "制作", "Generate": "生成",
-                "Build": "构建", "Compile": "编译", "Assemble": "组装",
-                "Test": "测试", "Check": "检查", "Validate": "验证",
-                "Debug": "调试", "Fix": "修复", "Repair": "修理",
-                "Error": "错误", "Bug": "虫", "Issue": "问题",
-                "Problem": "问题", "Trouble": "麻烦", "Difficulty": "困难",
-                "Solution": "解决方案", "Answer": "答案", "Result": "结果",
-                "Success": "成功", "Achievement": "成就", "Victory": "胜利",
-                "Failure": "失败", "Loss": "损失", "Defeat": "败北",
-                "Warning": "警告", "Alert": "警报", "Notice": "通知",
-                "Info": "信息", "Details": "详细", "Summary": "摘要",
-                "Report": "报告", "Log": "日志", "History": "历史",
-                "Record": "记录", "Entry": "条目", "Item": "项目",
-                "List": "列表", "Table": "表格", "Grid": "网格",
-                "Chart": "图表", "Graph": "图表", "Diagram": "图解",
-                "Image": "图片", "Picture": "图片", "Photo": "照片",
-                "Video": "视频", "Audio": "音频", "Sound": "声音",
-                "Music": "音乐", "Song": "歌曲", "Track": "轨道",
-                "File": "文件", "Document": "文档", "Data": "数据",
-                "Folder": "文件夹", "Directory": "目录", "Path": "路径",
-                "Link": "链接", "URL": "网址", "Address": "地址",
-                "Website": "网站", "Page": "页面", "Site": "站点",
-                "Web": "网络", "Internet": "互联网", "Network": "网络",
-                "Connection": "连接", "Connect": "连接", "Join": "加入",
-                "Disconnect": "断开", "Leave": "离开", "Quit": "退出",
-                "Online": "在线", "Offline": "离线", "Available": "可用",
-                "Busy": "忙", "Free": "免费", "Ready": "准备好",
-                "Loading": "加载中", "Processing": "处理中", "Working": "工作中",
-                "Complete": "完成", "Finished": "完成", "Done": "完成",
-                "Ready": "准备好", "Prepared": "准备好", "Set": "设置",
-                "Wait": "等待", "Hold": "持有", "Pause": "暂停",
-                "Continue": "继续", "Proceed": "继续", "Go": "去",
-                "Come": "来", "Arrive": "到达", "Reach": "到达",
-                "Leave": "离开", "Go away": "走开", "Depart": "出发",
-                "Enter": "进入", "Exit": "退出", "Access": "访问",
-                "Welcome": "欢迎", "Hello": "你好", "Goodbye": "再见",
-                "Thank you": "谢谢", "Please": "请", "Sorry": "对不起",
-                "Excuse me": "抱歉", "Pardon": "请原谅", "Forgive": "原谅",
-                "Understand": "理解", "Know": "知道", "Learn": "学习",
-                "Study": "学习", "Read": "阅读", "Write": "写",
-                "Speak": "说", "Talk": "说", "Listen": "听",
-                "Hear": "听到", "See": "看到", "Look": "看", "Watch": "观看",
-                "Touch": "触摸", "Feel": "感觉", "Smell": "闻", "Taste": "味道"
-            },
-            ("en", "ja"): {
-                "Hello": "こんにちは",
-                "World": "世界",
-                "Documentation": "ドキュメント",
-                "API": "API",
-                "Function": "関数",
-                "Class": "クラス",
-                "Method": "メソッド",
-                "Parameter": "パラメータ",
-                "Return": "戻る",
-                "Install": "インストール",
-                "Setup": "セットアップ",
-                "Usage": "使用方法",
-                "Example": "例",
-                "Installation": "インストール",
-                "Configuration": "設定",
-                "Authentication": "認証",
-                "Database": "データベース",
-                "Server": "サーバー",
-                "Client": "クライアント",
-                "Error": "エラー",
-                "Success": "成功"
-            }
-        }
-        
-        lang_pair = (source_lang, target_lang)
-        if lang_pair in translations:
-            translated = content
-            
-            # First, try to translate common phrases (longer matches first)
-            phrases = sorted(translations[lang_pair].keys(), key=len, reverse=True)
-            for phrase in phrases:
-                if len(phrase.split()) > 1:  # Multi-word phrases
-                    import re
-                    pattern = r'\b' + re.escape(phrase) + r'\b'
-                    translated = re.sub(pattern, translations[lang_pair][phrase], translated, flags=re.IGNORECASE)
-            
-            # Then translate individual words (case-insensitive)
-            for eng, translated_word in translations[lang_pair].items():
-                if len(eng.split()) == 1:  # Single words only
-                    import re
-                    pattern = r'\b' + re.escape(eng) + r'\b'
-                    translated = re.sub(pattern, translated_word, translated, flags=re.IGNORECASE)
-            
-            # If still no translation found, try word-by-word translation
-            if translated == content:
-                words = content.split()
-                translated_words = []
-                for word in words:
-                    # Clean the word (remove punctuation)
-                    clean_word = re.sub(r'[^\w]', '', word.lower())
-                    if clean_word in translations[lang_pair]:
-                        translated_word = translations[lang_pair][clean_word]
-                        translated_words.append(translated_word)
-                    else:
-                        translated_words.append(word)
-                translated = ' '.join(translated_words)
-            
-            return translated
-        else:
-            # For unsupported language pairs, return content with language indicator
-            return f"[{target_lang.upper()}] {content}"
+        # Shares the single-pass matcher instead of re-running one re.sub per table key
+        return self._enhanced_fallback_translate(content, source_lang, target_lang)
     
     async def detect_language(self, request: LanguageDetectionRequest) -> LanguageDetectionResponse:
         """Detect the language of content"""
@@ -1573,22 +1421,15 @@ class TranslationManager:
     
     def _simple_language_detection(self, content: str) -> str:
         """Simple language detection for demo purposes"""
-        content_lower = content.lower()
-        
-        # Chinese detection (check for Chinese characters)
-        chinese_chars = sum(1 for char in content if '\u4e00' <= char <= '\u9fff')
-        if chinese_chars > 0:
+        # Chinese detection (check for Chinese characters); the regex engine
+        # scans in C and stops at the first hit instead of looping per character
+        if _CJK_CHAR_RE.search(content):
             return "zh"
         
-        # Spanish indicators
-        spanish_words = ["el", "la", "de", "que", "y", "en", "un", "es", "se", "no", "te", "lo", "le", "da", "su", "por", "son", "con", "para", "al", "del", "los", "las", "una", "como", "más", "pero", "sus", "me", "hasta", "hay", "donde", "han", "quien", "están", "estado", "desde", "todo", "nos", "durante", "todos", "uno", "les", "ni", "contra", "otros", "ese", "eso", "ante", "ellos", "e", "esto", "mí", "antes", "algunos", "qué", "unos", "yo", "otro", "otras", "otra", "él", "tanto", "esa", "estos", "mucho", "quienes", "nada", "muchos", "cual", "poco", "ella", "estar", "estas", "algunas", "algo", "nosotros"]
-        
-        # French indicators
-        french_words = ["le", "la", "de", "et", "un", "à", "être", "et", "en", "avoir", "ne", "je", "son", "que", "se", "qui", "ce", "dans", "une", "ce", "il", "qui", "ce", "ne", "sur", "se", "ce", "pas", "ce", "plus", "pouvoir", "par", "je", "tout", "ce", "faire", "son", "mettre", "autre", "on", "mais", "nous", "comme", "mon", "leur", "si", "y", "bien", "devoir", "voir", "à", "ce", "deux", "même", "prendre", "aussi", "quel", "donner", "premier", "vouloir", "encore", "déjà", "grand", "mon", "bon", "peu", "sous", "même", "trop", "faire", "seul", "vouloir", "faire", "même", "aussi", "falloir", "autre", "jour", "même", "aussi", "falloir", "autre", "jour", "même", "aussi", "falloir", "autre", "jour"]
-        
-        # Count matches
-        spanish_count = sum(1 for word in spanish_words if word in content_lower)
-        french_count = sum(1 for word in french_words if word in content_lower)
+        # Tokenize once and count hashed lookups against the indicator word sets
+        tokens = _DETECTION_WORD_RE.findall(content.lower())
+        spanish_count = sum(1 for token in tokens if token in _SPANISH_WORDS)
+        french_count = sum(1 for token in tokens if token in _FRENCH_WORDS)
         
         if spanish_count > french_count and spanish_count > 3:
             return "es"
@@ -1707,15 +1548,16 @@ class TranslationManager:
 # Global instance
 translation_manager = TranslationManager()
 
+@router.on_event("shutdown")
+async def close_hf_client():
+    """Close the shared Hugging Face client with the app"""
+    await translation_manager.hf_client.aclose()
+
 @router.get("/languages")
 async def get_supported_languages():
     """Get list of supported languages"""
     try:
-        languages = list(translation_manager.supported_languages.values())
-        return {
-            "languages": [lang.dict() for lang in languages],
-            "total": len(languages)
-        }
+        return Response(content=translation_manager.languages_payload, media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting languages: {e}")
         raise HTTPException(status_code=500, detail="Failed to get languages")
@@ -1747,29 +1589,32 @@ async def localize_content(request: LocalizationRequest):
         logger.error(f"Localization error: {e}")
         raise HTTPException(status_code=500, detail="Localization failed")
 
+# Upper bound on how long /translation-memory statistics are reused
+_MEMORY_STATS_TTL = 30  # seconds
+
 @router.get("/translation-memory")
 async def get_translation_memory():
     """Get translation memory statistics"""
     try:
+        # Dashboards poll this endpoint; reuse the last result until the memory
+        # changes or the short TTL lapses
+        now = time.monotonic()
+        if translation_manager.memory_stats is not None and now < translation_manager.memory_stats_expires:
+            return translation_manager.memory_stats
+        
+        memories = translation_manager.translation_memory.values()
+        
+        # Count by language pairs, formatting each distinct pair only once
+        pair_counts = Counter((memory.source_language, memory.target_language) for memory in memories)
+        
         memory_stats = {
             "total_entries": len(translation_manager.translation_memory),
-            "languages": {},
+            "languages": {f"{source}-{target}": count for (source, target), count in pair_counts.items()},
             "most_used": []
         }
         
-        # Count by language pairs
-        for memory in translation_manager.translation_memory.values():
-            lang_pair = f"{memory.source_language}-{memory.target_language}"
-            if lang_pair not in memory_stats["languages"]:
-                memory_stats["languages"][lang_pair] = 0
-            memory_stats["languages"][lang_pair] += 1
-        
-        # Get most used translations
-        sorted_memory = sorted(
-            translation_manager.translation_memory.values(),
-            key=lambda x: x.usage_count,
-            reverse=True
-        )
+        # Get most used translations (a bounded heap instead of sorting every entry)
+        most_used = heapq.nlargest(10, memories, key=attrgetter('usage_count'))
         
         memory_stats["most_used"] = [
             {
@@ -1777,21 +1622,32 @@ async def get_translation_memory():
                 "usage_count": m.usage_count,
                 "languages": f"{m.source_language} → {m.target_language}"
             }
-            for m in sorted_memory[:10]
+            for m in most_used
         ]
         
+        translation_manager.memory_stats = memory_stats
+        translation_manager.memory_stats_expires = now + _MEMORY_STATS_TTL
         return memory_stats
         
     except Exception as e:
         logger.error(f"Error getting translation memory: {e}")
         raise HTTPException(status_code=500, detail="Failed to get translation memory")
 
+# Serialized /health payload keyed by the memory size, the only figure that changes
+_health_payload: Dict[int, bytes] = {}
+
 @router.get("/health")
 async def multilingual_health_check():
     """Check multilingual services health"""
-    return {
-        "status": "healthy",
-        "supported_languages": len(translation_manager.supported_languages),
-        "translation_memory_entries": len(translation_manager.translation_memory),
-        "features": ["translation", "localization", "language_detection"]
-    }
+    memory_entries = len(translation_manager.translation_memory)
+    payload = _health_payload.get(memory_entries)
+    if payload is None:
+        payload = orjson.dumps({
+            "status": "healthy",
+            "supported_languages": len(translation_manager.supported_languages),
+            "translation_memory_entries": memory_entries,
+            "features": ["translation", "localization", "language_detection"]
+        })
+        _health_payload.clear()
+        _health_payload[memory_entries] = payload
+    return Response(content=payload, media_type="application/json")
@@ -1,43 +1,44 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 import json
+import orjson
 import os
+import time
 from datetime import datetime
 import logging
 from core.mcp_client import mcp_client
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-class TutorialStep(BaseModel):
-    step_id: str
-    title: str
-    description: str
-    content: str
-    code_examples: List[Dict[str, Any]]
-    quiz_questions: List[Dict[str, Any]]
-    estimated_time: int  # minutes
+# Static tutorial catalog shipped next to this module
+TUTORIALS_PATH = os.path.join(os.path.dirname(__file__), "tutorials.json")
 
-class Tutorial(BaseModel):
-    tutorial_id: str
-    title: str
-    description: str
-    difficulty: str  # beginner, intermediate, advanced
-    steps: List[TutorialStep]
-    prerequisites: List[str]
-    total_estimated_time: int
-    tags: List[str]
+# Upper bound on in-memory progress rows; the least recently used rows are dropped first
+MAX_PROGRESS_ENTRIES = 100_000
 
-class UserProgress(BaseModel):
+@dataclass(slots=True)
+class UserProgress:
+    """In-memory progress record; never validated from client input, so no Pydantic model"""
     user_id: str
     tutorial_id: str
-    completed_steps: List[str]
     current_step: str
     start_date: datetime
     last_activity: datetime
-    quiz_scores: Dict[str, float]
+    completed_steps: List[str] = field(default_factory=list)
+    completed_set: Set[str] = field(default_factory=set)
+    quiz_scores: Dict[str, float] = field(default_factory=dict)
+    # Derived fields, kept current by update_progress so reads need no recomputation
+    completed_count: int = 0
+    progress_percentage: float = 0.0
+    next_step: str = ""
+    next_step_index: int = 0  # lowest step position not yet completed
+    estimated_completion: int = 0  # minutes
 
 class ProgressResponse(BaseModel):
     tutorial_id: str
@@ -67,164 +68,115 @@ class TutorialManager:
     
     def __init__(self):
         self.tutorials = self._load_default_tutorials()
-        self.user_progress = {}
-    
-    def _load_default_tutorials(self) -> Dict[str, Tutorial]:
-        """Load default tutorial content"""
-        return {
-            "getting-started": Tutorial(
-                tutorial_id="getting-started",
-                title="Getting Started with IFastDocs",
-                description="Learn the basics of using IFastDocs for documentation",
-                difficulty="beginner",
-                steps=[
-                    TutorialStep(
-                        step_id="intro",
-                        title="Introduction to IFastDocs",
-                        description="Understand what IFastDocs is and how it can help you",
-                        content="IFastDocs is an AI-powered documentation assistant that helps you create, maintain, and consume technical documentation more effectively.",
-                        code_examples=[],
-                        quiz_questions=[
-                            {
-                                "question": "What is the main purpose of IFastDocs?",
-                                "options": [
-                                    "To replace all documentation",
-                                    "To assist with documentation creation and maintenance",
-                                    "To only generate code",
-                                    "To manage databases"
-                                ],
-                                "correct_answer": 1
-                            }
-                        ],
-                        estimated_time=5
-                    ),
-                    TutorialStep(
-                        step_id="first-doc",
-                        title="Create Your First Document",
-                        description="Learn how to create documentation from code",
-                        content="Use the code parsing feature to automatically generate documentation from your source code.",
-                        code_examples=[
-                            {
-                                "language": "python",
-                                "code": "def hello_world():\n    \"\"\"Simple greeting function\"\"\"\n    return \"Hello, World!\"",
-                                "description": "Python function with docstring"
-                            }
-                        ],
-                        quiz_questions=[
-                            {
-                                "question": "Which feature helps generate docs from code?",
-                                "options": [
-                                    "AI summarization",
-                                    "Code parsing",
-                                    "Drift detection",
-                                    "Multilingual support"
-                                ],
-                                "correct_answer": 1
-                            }
-                        ],
-                        estimated_time=10
-                    ),
-                    TutorialStep(
-                        step_id="ai-features",
-                        title="Using AI Features",
-                        description="Explore AI-powered documentation features",
-                        content="IFastDocs uses AI to help summarize content, answer questions, and generate documentation.",
-                        code_examples=[],
-                        quiz_questions=[
-                            {
-                                "question": "What AI feature helps with long documents?",
-                                "options": [
-                                    "Code parsing",
-                                    "Summarization",
-                                    "Drift detection",
-                                    "File upload"
-                                ],
-                                "correct_answer": 1
-                            }
-                        ],
-                        estimated_time=8
-                    )
-                ],
-                prerequisites=[],
-                total_estimated_time=23,
-                tags=["basics", "introduction", "ai"]
-            ),
-            "advanced-features": Tutorial(
-                tutorial_id="advanced-features",
-                title="Advanced IFastDocs Features",
-                description="Master advanced documentation features",
-                difficulty="intermediate",
-                steps=[
-                    TutorialStep(
-                        step_id="drift-detection",
-                        title="Documentation Drift Detection",
-                        description="Learn how to detect when docs become outdated",
-                        content="Use drift detection to automatically identify when documentation needs updates based on code changes.",
-                        code_examples=[],
-                        quiz_questions=[],
-                        estimated_time=15
-                    ),
-                    TutorialStep(
-                        step_id="maintenance",
-                        title="Automated Maintenance",
-                        description="Set up automated documentation maintenance",
-                        content="Configure webhooks and automated processes to keep documentation up-to-date.",
-                        code_examples=[],
-                        quiz_questions=[],
-                        estimated_time=20
-                    )
-                ],
-                prerequisites=["getting-started"],
-                total_estimated_time=35,
-                tags=["advanced", "maintenance", "automation"]
-            )
+        # Tutorial lists are precomputed (overall and per difficulty) since the catalog is static
+        self._all_tutorials = list(self.tutorials.values())
+        self._tutorials_by_difficulty: Dict[str, List[Dict[str, Any]]] = {}
+        for tutorial in self._all_tutorials:
+            self._tutorials_by_difficulty.setdefault(tutorial["difficulty"], []).append(tutorial)
+        # Each tutorial is serialized once so the detail endpoint can send the bytes as-is
+        self.tutorial_bytes = {tid: orjson.dumps(t) for tid, t in self.tutorials.items()}
+        self.estimated_time_by_id = {tid: t["total_estimated_time"] for tid, t in self.tutorials.items()}
+        # Valid step ids per tutorial, for O(1) validation of completed steps
+        self.step_id_sets = {
+            tid: frozenset(step["step_id"] for step in t["steps"]) for tid, t in self.tutorials.items()
         }
+        # Step ids in tutorial order and their positions, used to track the next step
+        self.step_order = {tid: [step["step_id"] for step in t["steps"]] for tid, t in self.tutorials.items()}
+        self.step_index = {tid: {sid: i for i, sid in enumerate(order)} for tid, order in self.step_order.items()}
+        self.user_progress: "OrderedDict[Tuple[str, str], UserProgress]" = OrderedDict()
+        # Progress rows per user, kept up to date on write (and eviction) for the health check
+        self.users: Counter = Counter()
+        # Serialized /health payload, dropped whenever the set of users can change
+        self.health_bytes: Optional[bytes] = None
+    
+    def _load_default_tutorials(self) -> Dict[str, Dict[str, Any]]:
+        """Load default tutorial content as plain dicts (the catalog is static and never validated)"""
+        # Tutorial content lives in a JSON data file rather than Python literals,
+        # so it can grow without adding to module compile and import time
+        with open(TUTORIALS_PATH, "rb") as f:
+            return orjson.loads(f.read())
     
-    def get_tutorial(self, tutorial_id: str) -> Optional[Tutorial]:
+    def get_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific tutorial"""
         return self.tutorials.get(tutorial_id)
     
-    def get_all_tutorials(self, difficulty: Optional[str] = None) -> List[Tutorial]:
+    def get_all_tutorials(self, difficulty: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all tutorials, optionally filtered by difficulty"""
         if difficulty:
-            return [t for t in self.tutorials.values() if t.difficulty == difficulty]
-        return list(self.tutorials.values())
+            return self._tutorials_by_difficulty.get(difficulty, [])
+        return self._all_tutorials
     
     def get_user_progress(self, user_id: str, tutorial_id: str) -> Optional[UserProgress]:
         """Get user progress for a specific tutorial"""
-        key = f"{user_id}_{tutorial_id}"
-        return self.user_progress.get(key)
+        key = (user_id, tutorial_id)
+        progress = self.user_progress.get(key)
+        if progress is not None:
+            self.user_progress.move_to_end(key)
+        return progress
     
     def update_progress(self, user_id: str, tutorial_id: str, step_id: str, quiz_score: Optional[float] = None):
         """Update user progress for a tutorial"""
-        key = f"{user_id}_{tutorial_id}"
+        key = (user_id, tutorial_id)
+        # One clock read per update, shared by every timestamp it sets
+        now = datetime.now()
         
-        if key not in self.user_progress:
-            self.user_progress[key] = UserProgress(
+        progress = self.user_progress.get(key)
+        if progress is None:
+            progress = self.user_progress[key] = UserProgress(
                 user_id=user_id,
                 tutorial_id=tutorial_id,
-                completed_steps=[],
                 current_step=step_id,
-                start_date=datetime.now(),
-                last_activity=datetime.now(),
-                quiz_scores={}
+                start_date=now,
+                last_activity=now
             )
+            self.users[user_id] += 1
+            self.health_bytes = None
+            if len(self.user_progress) > MAX_PROGRESS_ENTRIES:
+                self._evict_oldest_progress()
+        else:
+            self.user_progress.move_to_end(key)
         
-        progress = self.user_progress[key]
-        if step_id not in progress.completed_steps:
+        if step_id not in progress.completed_set:
+            progress.completed_set.add(step_id)
             progress.completed_steps.append(step_id)
         
         if quiz_score is not None:
             progress.quiz_scores[step_id] = quiz_score
         
-        progress.last_activity = datetime.now()
+        progress.last_activity = now
         progress.current_step = step_id
+        
+        # Recompute the derived progress fields on write
+        order = self.step_order.get(tutorial_id, [])
+        total_steps = len(order)
+        progress.completed_count = len(progress.completed_steps)
+        progress.progress_percentage = (progress.completed_count / total_steps) * 100 if total_steps > 0 else 0.0
+        
+        # Completed steps only ever grow, so the next step only moves when it is the
+        # step just completed, and then skips past any now-contiguous completed run
+        index = progress.next_step_index
+        if self.step_index.get(tutorial_id, {}).get(step_id) == index:
+            completed = progress.completed_set
+            while index < total_steps and order[index] in completed:
+                index += 1
+            progress.next_step_index = index
+        progress.next_step = order[index] if index < total_steps else ""
+        progress.estimated_completion = (total_steps - progress.completed_count) * 10  # Assume 10 min per step
+
+    def _evict_oldest_progress(self):
+        """Drop the least recently used progress row"""
+        (user_id, _), _ = self.user_progress.popitem(last=False)
+        self.users[user_id] -= 1
+        if not self.users[user_id]:
+            del self.users[user_id]
+            self.health_bytes = None
 
 class InteractiveGuideManager:
     """Manage interactive guides and walkthroughs"""
     
     def __init__(self):
         self.guides = self._load_default_guides()
+        self.guide_dicts = {gid: guide.dict() for gid, guide in self.guides.items()}
     
     def _load_default_guides(self) -> Dict[str, InteractiveGuide]:
         """Load default interactive guides"""
@@ -309,15 +261,22 @@ class InteractiveGuideManager:
 tutorial_manager = TutorialManager()
 guide_manager = InteractiveGuideManager()
 
+# Recommendations only depend on the skill level and the set of interests, so
+# identical profiles are answered from a small TTL cache
+_RECOMMENDATION_CACHE_TTL = 600  # seconds
+_RECOMMENDATION_CACHE_SIZE = 1024
+_recommendation_cache: Dict[Tuple[str, frozenset], Tuple[float, Dict[str, Any]]] = {}
+
 @router.get("/tutorials")
 async def get_tutorials(difficulty: Optional[str] = None):
     """Get available tutorials"""
     try:
         tutorials = tutorial_manager.get_all_tutorials(difficulty)
-        return {
-            "tutorials": [t.dict() for t in tutorials],
+        # Catalog entries are plain JSON-ready dicts, so orjson can write them directly
+        return ORJSONResponse({
+            "tutorials": tutorials,
             "total": len(tutorials)
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting tutorials: {e}")
         raise HTTPException(status_code=500, detail="Failed to get tutorials")
@@ -326,11 +285,11 @@ async def get_tutorials(difficulty: Optional[str] = None):
 async def get_tutorial(tutorial_id: str):
     """Get a specific tutorial"""
     try:
-        tutorial = tutorial_manager.get_tutorial(tutorial_id)
-        if not tutorial:
+        payload = tutorial_manager.tutorial_bytes.get(tutorial_id)
+        if payload is None:
             raise HTTPException(status_code=404, detail="Tutorial not found")
         
-        return tutorial.dict()
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting tutorial {tutorial_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to get tutorial")
@@ -351,36 +310,21 @@ async def get_tutorial_progress(tutorial_id: str, user_id: str):
                 tutorial_id=tutorial_id,
                 progress_percentage=0.0,
                 completed_steps=0,
-                total_steps=len(tutorial.steps),
-                current_step=tutorial.steps[0].step_id if tutorial.steps else "",
-                next_step=tutorial.steps[0].step_id if tutorial.steps else "",
-                estimated_completion=tutorial.total_estimated_time
+                total_steps=len(tutorial["steps"]),
+                current_step=tutorial["steps"][0]["step_id"] if tutorial["steps"] else "",
+                next_step=tutorial["steps"][0]["step_id"] if tutorial["steps"] else "",
+                estimated_completion=tutorial["total_estimated_time"]
             )
         
-        # Calculate progress
-        completed_count = len(progress.completed_steps)
-        total_steps = len(tutorial.steps)
-        progress_percentage = (completed_count / total_steps) * 100 if total_steps > 0 else 0
-        
-        # Find next step
-        next_step = ""
-        for step in tutorial.steps:
-            if step.step_id not in progress.completed_steps:
-                next_step = step.step_id
-                break
-        
-        # Estimate completion time
-        remaining_steps = total_steps - completed_count
-        estimated_completion = remaining_steps * 10  # Assume 10 min per step
-        
+        # Progress figures are maintained by update_progress
         return ProgressResponse(
             tutorial_id=tutorial_id,
-            progress_percentage=progress_percentage,
-            completed_steps=completed_count,
-            total_steps=total_steps,
+            progress_percentage=progress.progress_percentage,
+            completed_steps=progress.completed_count,
+            total_steps=len(tutorial["steps"]),
             current_step=progress.current_step,
-            next_step=next_step,
-            estimated_completion=estimated_completion
+            next_step=progress.next_step,
+            estimated_completion=progress.estimated_completion
         )
         
     except Exception as e:
@@ -396,8 +340,7 @@ async def complete_tutorial_step(tutorial_id: str, user_id: str, step_id: str, q
             raise HTTPException(status_code=404, detail="Tutorial not found")
         
         # Validate step exists
-        step_exists = any(step.step_id == step_id for step in tutorial.steps)
-        if not step_exists:
+        if step_id not in tutorial_manager.step_id_sets[tutorial_id]:
             raise HTTPException(status_code=400, detail="Invalid step ID")
         
         # Update progress
@@ -415,7 +358,7 @@ async def get_interactive_guides():
     try:
         guides = guide_manager.get_all_guides()
         return {
-            "guides": [g.dict() for g in guides],
+            "guides": [guide_manager.guide_dicts[g.guide_id] for g in guides],
             "total": len(guides)
         }
     except Exception as e:
@@ -430,51 +373,67 @@ async def get_interactive_guide(guide_id: str):
         if not guide:
             raise HTTPException(status_code=404, detail="Guide not found")
         
-        return guide.dict()
+        return guide_manager.guide_dicts[guide_id]
     except Exception as e:
         logger.error(f"Error getting guide {guide_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to get guide")
 
 @router.post("/recommendations")
-async def get_onboarding_recommendations(request: OnboardingRecommendation):
+async def get_onboarding_recommendations(request: OnboardingRecommendation, background_tasks: BackgroundTasks):
     """Get personalized onboarding recommendations"""
     try:
-        # Use MCP to get context-aware recommendations
-        mcp_context = await mcp_client.get_context(
+        cache_key = (request.skill_level, frozenset(request.interests))
+        now = time.monotonic()
+        cached = _recommendation_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _RECOMMENDATION_CACHE_TTL:
+            return cached[1]
+        
+        # The MCP context does not shape the response, so the request is sent after
+        # the response instead of adding its round trip to the critical path
+        background_tasks.add_task(
+            mcp_client.get_context,
             f"User skill level: {request.skill_level}, interests: {', '.join(request.interests)}",
             "onboarding_recommendation"
         )
         
         # Generate recommendations based on skill level and interests
-        recommendations = []
+        # (a dict keeps insertion order while dropping repeated ids)
+        recommended = {}
         if request.skill_level == "beginner":
-            recommendations.extend(["getting-started", "quick-start"])
+            recommended.update(dict.fromkeys(["getting-started", "quick-start"]))
         elif request.skill_level == "intermediate":
-            recommendations.extend(["advanced-features", "api-documentation"])
+            recommended.update(dict.fromkeys(["advanced-features", "api-documentation"]))
         
         # Add guides based on interests
         if "api" in request.interests:
-            recommendations.append("api-documentation")
+            recommended["api-documentation"] = None
         if "automation" in request.interests:
-            recommendations.append("advanced-features")
+            recommended["advanced-features"] = None
+        recommendations = list(recommended)
         
         # Create learning path
         learning_path = []
-        if "getting-started" in recommendations:
+        if "getting-started" in recommended:
             learning_path.append("getting-started")
-        if "advanced-features" in recommendations:
+        if "advanced-features" in recommended:
             learning_path.append("advanced-features")
         
-        return {
+        result = {
             "recommended_tutorials": recommendations,
             "learning_path": learning_path,
             "estimated_total_time": sum(
-                tutorial_manager.get_tutorial(tid).total_estimated_time 
-                for tid in recommendations 
-                if tutorial_manager.get_tutorial(tid)
+                tutorial_manager.estimated_time_by_id.get(tid, 0) for tid in recommendations
             )
         }
         
+        # Evict the oldest entry when full; re-inserting moves a refreshed key to the end
+        _recommendation_cache.pop(cache_key, None)
+        if len(_recommendation_cache) >= _RECOMMENDATION_CACHE_SIZE:
+            _recommendation_cache.pop(next(iter(_recommendation_cache)))
+        _recommendation_cache[cache_key] = (now, result)
+        
+        return result
+        
     except Exception as e:
         logger.error(f"Error getting recommendations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get recommendations")
@@ -482,9 +441,12 @@ async def get_onboarding_recommendations(request: OnboardingRecommendation):
 @router.get("/health")
 async def onboarding_health_check():
     """Check onboarding services health"""
-    return {
-        "status": "healthy",
-        "tutorials_available": len(tutorial_manager.tutorials),
-        "guides_available": len(guide_manager.guides),
-        "total_users": len(set(progress.split('_')[0] for progress in tutorial_manager.user_progress.keys()))
-    }
+    payload = tutorial_manager.health_bytes
+    if payload is None:
+        payload = tutorial_manager.health_bytes = orjson.dumps({
+            "status": "healthy",
+            "tutorials_available": len(tutorial_manager.tutorials),
+            "guides_available": len(guide_manager.guides),
+            "total_users": len(tutorial_manager.users)
+        })
+    return Response(content=payload, media_type="application/json")
@@ -1,16 +1,135 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import ast
+import asyncio
+import codecs
+import hashlib
 import re
 import yaml
 import json
-from pathlib import Path
+import orjson
+import os
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
+from core.config import settings
+
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml falls back to the pure-Python loader
+    from yaml import SafeLoader as _YamlSafeLoader
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Parsed Python results keyed by a BLAKE2b digest of the source, so re-submitted
+# files skip ast.parse and the analyzer pass without the cache holding the source
+_PARSE_CACHE_SIZE = 2048
+_parse_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_parse_cache_stats = {"hits": 0, "misses": 0}
+
+# Worker processes for parsing repository files off the event loop; the pool is
+# created on first use, and again after a worker dies or the app shuts down
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+# Extracted Swagger specs keyed by (format, BLAKE2b digest of the content)
+_SWAGGER_CACHE_SIZE = 512
+_swagger_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# Repository file listings keyed by (owner, repo, head commit SHA); a new push
+# changes the SHA, so entries never need invalidating
+_REPO_FILES_CACHE_SIZE = 256
+_repo_files_cache: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+# File extensions counted by code analysis, and directories skipped when walking a repository
+_CODE_EXTS = frozenset({'.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb'})
+_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.pytest_cache'})
+
+# Uploaded files are read and decoded 64 KiB at a time
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Operations picked up from Swagger path items
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+
+# Import, def and class lines for the regex-based parser, matched in one pass over
+# the whole source; [^\S\n] is whitespace that stays on the same line, and import
+# lines are captured up to their last non-space character
+_STRUCTURE_RE = re.compile(
+    r'^[^\S\n]*(?:(?P<imp>(?:import |from )[^\n]*\S)|def[^\S\n]+(?P<fn>\w+)|class[^\S\n]+(?P<cls>\w+))',
+    re.MULTILINE
+)
+
+def _parse_digest(code: str) -> bytes:
+    return hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+def _ext(name: str) -> str:
+    """Lower-cased extension of a file name, same as Path(name).suffix.lower()"""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1 and i > name.rfind('/') + 1:
+        return name[i:].lower()
+    return ''
+
+def _parse_cache_get(digest: bytes) -> Optional[Dict[str, Any]]:
+    result = _parse_cache.get(digest)
+    if result is not None:
+        _parse_cache.move_to_end(digest)
+        _parse_cache_stats["hits"] += 1
+    else:
+        _parse_cache_stats["misses"] += 1
+    return result
+
+def _parse_cache_put(digest: bytes, result: Dict[str, Any]):
+    _parse_cache[digest] = result
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check a request's If-None-Match header against an ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in if_none_match
+
+def _parse_etag(request: "ParseRequest") -> str:
+    """Strong ETag for a parse-code request; the response depends only on language and code"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(request.language.encode("utf-8", "surrogatepass"))
+    digest.update(b"\0")
+    digest.update(request.code_content.encode("utf-8", "surrogatepass"))
+    return f'"{digest.hexdigest()}"'
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Parse worker pool, created on first use"""
+    global _parse_pool
+    if _parse_pool is None:
+        # Workers come from a fork server (or are spawned where there is none),
+        # so they never inherit the server's threads and locks
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(start_method)
+        )
+    return _parse_pool
+
+def _discard_parse_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next parse starts a fresh one"""
+    global _parse_pool
+    if _parse_pool is pool:
+        _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+@router.on_event("shutdown")
+def shutdown_parse_pool():
+    """Stop the parse worker processes with the app"""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
 
 class ParseRequest(BaseModel):
     code_content: str
@@ -54,77 +173,137 @@ class PythonParser:
     
     @staticmethod
     def parse_python(code: str) -> Dict[str, Any]:
+        digest = _parse_digest(code)
+        result = _parse_cache_get(digest)
+        if result is None:
+            result = PythonParser._analyze(code)
+            _parse_cache_put(digest, result)
+        # Callers get their own top-level dict so the cached entry stays intact
+        return dict(result)
+    
+    @staticmethod
+    async def parse_python_in_pool(code: str) -> Dict[str, Any]:
+        """Like parse_python, but runs the AST pass in the parse worker pool"""
+        digest = _parse_digest(code)
+        result = _parse_cache_get(digest)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            pool = _get_parse_pool()
+            try:
+                result = await loop.run_in_executor(pool, PythonParser._analyze, code)
+            except (BrokenProcessPool, RuntimeError) as e:
+                # A worker died or the pool was shut down; replace the pool and
+                # parse this file in process instead of dropping it
+                logger.warning(f"Parse worker pool unavailable, parsing in process: {e}")
+                _discard_parse_pool(pool)
+                result = PythonParser._analyze(code)
+            _parse_cache_put(digest, result)
+        return dict(result)
+    
+    @staticmethod
+    def _analyze(code: str) -> Dict[str, Any]:
         try:
             tree = ast.parse(code)
-            analyzer = PythonAnalyzer()
-            analyzer.visit(tree)
-            return analyzer.get_results()
+            return analyze_python_tree(tree)
         except Exception as e:
             logger.error(f"Python parsing error: {e}")
             return {"error": str(e)}
 
-class PythonAnalyzer(ast.NodeVisitor):
-    """AST visitor for Python code analysis"""
+def analyze_python_tree(tree: ast.AST) -> Dict[str, Any]:
+    """Collect functions, classes, imports and complexity from a Python AST"""
+    functions = []
+    classes = []
+    imports = []
+    n_documented = 0
     
-    def __init__(self):
-        self.functions = []
-        self.classes = []
-        self.imports = []
-        self.complexity = 0
+    # Explicit pre-order walk (same order as ast.NodeVisitor) with exact type
+    # checks instead of per-node visit_* method dispatch
+    function_def, class_def = ast.FunctionDef, ast.ClassDef
+    import_node, import_from = ast.Import, ast.ImportFrom
+    get_docstring = ast.get_docstring
+    iter_child_nodes = ast.iter_child_nodes
+    stack = [tree]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        t = type(node)
+        if t is function_def:
+            docstring = get_docstring(node)
+            if docstring:
+                n_documented += 1
+            functions.append({
+                "name": node.name,
+                "args": [arg.arg for arg in node.args.args],
+                "decorators": [d.id for d in node.decorator_list if hasattr(d, 'id')],
+                "docstring": docstring,
+                "line_number": node.lineno
+            })
+        elif t is class_def:
+            classes.append({
+                "name": node.name,
+                "bases": [base.id for base in node.bases if hasattr(base, 'id')],
+                "methods": [],
+                "docstring": get_docstring(node),
+                "line_number": node.lineno
+            })
+        elif t is import_node:
+            imports.extend(alias.name for alias in node.names)
+        elif t is import_from:
+            module = node.module or ""
+            imports.extend(f"{module}.{alias.name}" for alias in node.names)
         
-    def visit_FunctionDef(self, node):
-        func_info = {
-            "name": node.name,
-            "args": [arg.arg for arg in node.args.args],
-            "decorators": [d.id for d in node.decorator_list if hasattr(d, 'id')],
-            "docstring": ast.get_docstring(node),
-            "line_number": node.lineno
-        }
-        self.functions.append(func_info)
-        self.complexity += 1
-        self.generic_visit(node)
-    
-    def visit_ClassDef(self, node):
-        class_info = {
-            "name": node.name,
-            "bases": [base.id for base in node.bases if hasattr(base, 'id')],
-            "methods": [],
-            "docstring": ast.get_docstring(node),
-            "line_number": node.lineno
-        }
-        self.classes.append(class_info)
-        self.complexity += 2
-        self.generic_visit(node)
-    
-    def visit_Import(self, node):
-        for alias in node.names:
-            self.imports.append(alias.name)
-        self.generic_visit(node)
+        children = list(iter_child_nodes(node))
+        children.reverse()
+        extend(children)
     
-    def visit_ImportFrom(self, node):
-        module = node.module or ""
-        for alias in node.names:
-            self.imports.append(f"{module}.{alias.name}")
-        self.generic_visit(node)
-    
-    def get_results(self) -> Dict[str, Any]:
-        return {
-            "functions": self.functions,
-            "classes": self.classes,
-            "imports": self.imports,
-            "complexity_score": self.complexity
-        }
+    # Complexity weights: 1 per function, 2 per class, reduced once from the counts
+    return {
+        "functions": functions,
+        "classes": classes,
+        "imports": imports,
+        "complexity_score": len(functions) + 2 * len(classes),
+        "n_documented": n_documented
+    }
 
 class SwaggerParser:
     """Parse Swagger/OpenAPI specifications"""
     
     @staticmethod
     def parse_swagger(content: str, format: str) -> Dict[str, Any]:
+        is_yaml = format.lower() == "yaml"
+        key = (is_yaml, hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+        result = _swagger_cache.get(key)
+        if result is not None:
+            _swagger_cache.move_to_end(key)
+            return dict(result)
+        
+        # The on-disk cache survives restarts and is shared between workers
+        cache_name = f"{'yaml' if is_yaml else 'json'}-{key[1].hex()}.json"
+        result = _read_swagger_disk_cache(cache_name)
+        if result is None:
+            result = SwaggerParser._extract(content, is_yaml)
+            # Failures are not cached so each one is still logged
+            if "error" in result:
+                return result
+            _write_swagger_disk_cache(cache_name, result)
+        
+        _swagger_cache[key] = result
+        if len(_swagger_cache) > _SWAGGER_CACHE_SIZE:
+            _swagger_cache.popitem(last=False)
+        return dict(result)
+    
+    @staticmethod
+    def _extract(content: str, is_yaml: bool) -> Dict[str, Any]:
         try:
-            if format.lower() == "yaml":
-                spec = yaml.safe_load(content)
+            if is_yaml:
+                spec = yaml.load(content, Loader=_YamlSafeLoader)
             else:
-                spec = json.loads(content)
+                try:
+                    spec = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # orjson is strict (no NaN/Infinity, 64-bit integers only);
+                    # keep accepting what the stdlib parser allows
+                    spec = json.loads(content)
             
             endpoints = []
             models = []
@@ -133,10 +312,11 @@ class SwaggerParser:
             if "paths" in spec:
                 for path, methods in spec["paths"].items():
                     for method, details in methods.items():
-                        if method.upper() in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
+                        method = method.upper()
+                        if method in _HTTP_METHODS:
                             endpoint = {
                                 "path": path,
-                                "method": method.upper(),
+                                "method": method,
                                 "summary": details.get("summary", ""),
                                 "description": details.get("description", ""),
                                 "parameters": details.get("parameters", []),
@@ -167,10 +347,82 @@ class SwaggerParser:
             logger.error(f"Swagger parsing error: {e}")
             return {"error": str(e)}
 
+def _read_swagger_disk_cache(name: str) -> Optional[Dict[str, Any]]:
+    """Load an extracted spec from the on-disk Swagger cache, if present"""
+    path = os.path.join(settings.swagger_cache_dir, name)
+    try:
+        with open(path, "rb") as f:
+            result = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Swagger cache entry {name}: {e}")
+        return None
+    # Reads bump the mtime, which eviction orders by; atime is unreliable on
+    # relatime/noatime mounts
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+def _write_swagger_disk_cache(name: str, result: Dict[str, Any]):
+    """Atomically store an extracted spec, then evict the least recently used entries"""
+    path = os.path.join(settings.swagger_cache_dir, name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(settings.swagger_cache_dir, mode=0o700, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write Swagger cache entry {name}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    try:
+        _evict_swagger_disk_cache()
+    except Exception as e:
+        logger.warning(f"Could not evict Swagger cache entries: {e}")
+
+def _evict_swagger_disk_cache():
+    """Trim the on-disk Swagger cache back to its limit, oldest mtime first"""
+    # Only evict once the directory is a tenth over its limit, then trim back to
+    # the limit, so most writes skip the stat pass
+    max_files = settings.swagger_cache_max_files
+    entries = [entry for entry in os.scandir(settings.swagger_cache_dir) if entry.name.endswith(".json")]
+    if len(entries) <= max_files + max_files // 10:
+        return
+    
+    # Entries another process evicts meanwhile are simply skipped
+    dated = []
+    for entry in entries:
+        try:
+            dated.append((entry.stat().st_mtime, entry.path))
+        except FileNotFoundError:
+            continue
+    dated.sort()
+    for _, entry_path in dated[:len(dated) - max_files]:
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            continue
+
 @router.post("/parse-code", response_model=ParseResponse)
-async def parse_code(request: ParseRequest):
+async def parse_code(request: ParseRequest, http_request: Request = None, response: Response = None):
     """Parse code and extract structure information"""
     try:
+        # Clients re-sending a snippet they already parsed get an empty 304;
+        # internal callers such as upload_file pass no HTTP request
+        if http_request is not None:
+            etag = _parse_etag(request)
+            if _etag_matches(http_request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+        
         if request.language.lower() == "python":
             parser = PythonParser()
             result = parser.parse_python(request.code_content)
@@ -180,11 +432,12 @@ async def parse_code(request: ParseRequest):
             
             # Generate suggestions
             suggestions = []
+            n_functions = len(result["functions"])
             if result["complexity_score"] > 10:
                 suggestions.append("Consider breaking down complex functions into smaller ones")
-            if len(result["functions"]) > 20:
+            if n_functions > 20:
                 suggestions.append("Consider organizing code into modules")
-            if not any(func["docstring"] for func in result["functions"]):
+            if result["n_documented"] == 0:
                 suggestions.append("Add docstrings to functions for better documentation")
             
             return ParseResponse(
@@ -198,33 +451,36 @@ async def parse_code(request: ParseRequest):
             )
         else:
             # Basic parsing for other languages
-            lines = request.code_content.split('\n')
+            code = request.code_content
             functions = []
             classes = []
             imports = []
             
-            # Simple regex-based parsing
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line.startswith('import ') or line.startswith('from '):
-                    imports.append(line)
-                elif re.match(r'^def\s+\w+', line):
-                    func_name = re.search(r'def\s+(\w+)', line).group(1)
+            # Simple regex-based parsing; line numbers are tracked by counting
+            # newlines between matches instead of splitting the source into lines
+            line_number = 1
+            last_pos = 0
+            for match in _STRUCTURE_RE.finditer(code):
+                start = match.start()
+                line_number += code.count('\n', last_pos, start)
+                last_pos = start
+                if match.group('imp'):
+                    imports.append(match.group('imp'))
+                elif match.group('fn'):
                     functions.append({
-                        "name": func_name,
+                        "name": match.group('fn'),
                         "args": [],
                         "decorators": [],
                         "docstring": "",
-                        "line_number": i + 1
+                        "line_number": line_number
                     })
-                elif re.match(r'^class\s+\w+', line):
-                    class_name = re.search(r'class\s+(\w+)', line).group(1)
+                else:
                     classes.append({
-                        "name": class_name,
+                        "name": match.group('cls'),
                         "bases": [],
                         "methods": [],
                         "docstring": "",
-                        "line_number": i + 1
+                        "line_number": line_number
                     })
             
             complexity = len(functions) + len(classes) * 2
@@ -262,11 +518,12 @@ async def parse_swagger(request: SwaggerParseRequest):
             "## Endpoints"
         ]
         
+        # One line per list entry so the final join is the only concatenation
+        append = doc_sections.append
         for endpoint in result["endpoints"]:
-            doc_sections.append(
-                f"### {endpoint['method']} {endpoint['path']}\n"
-                f"{endpoint.get('summary', 'No description')}\n"
-            )
+            append(f"### {endpoint['method']} {endpoint['path']}")
+            append(endpoint.get('summary', 'No description'))
+            append("")
         
         if result["models"]:
             doc_sections.extend([
@@ -274,17 +531,20 @@ async def parse_swagger(request: SwaggerParseRequest):
                 "## Data Models"
             ])
             for model in result["models"]:
-                doc_sections.append(f"### {model['name']}\nType: {model['type']}")
+                append(f"### {model['name']}")
+                append(f"Type: {model['type']}")
         
         documentation = "\n".join(doc_sections)
         
-        return SwaggerParseResponse(
+        # The model is already validated on construction; returning the response
+        # directly skips FastAPI re-validating and re-encoding it
+        return ORJSONResponse(SwaggerParseResponse(
             endpoints=result["endpoints"],
             models=result["models"],
             base_url=result.get("base_url", ""),
             version=result.get("version", ""),
             documentation=documentation
-        )
+        ).dict())
         
     except Exception as e:
         logger.error(f"Swagger parsing error: {e}")
@@ -298,7 +558,7 @@ async def upload_file(file: UploadFile = File(...)):
             raise HTTPException(status_code=400, detail="No file provided")
         
         # Determine language from file extension
-        ext = Path(file.filename).suffix.lower()
+        ext = _ext(file.filename)
         language_map = {
             ".py": "python",
             ".js": "javascript",
@@ -314,9 +574,14 @@ async def upload_file(file: UploadFile = File(...)):
         
         language = language_map.get(ext, "unknown")
         
-        # Read file content
-        content = await file.read()
-        code_content = content.decode("utf-8")
+        # Read and decode the file in chunks so the raw bytes and the decoded
+        # text are never both held in full
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        parts = []
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        code_content = "".join(parts)
         
         # Parse the code
         parse_request = ParseRequest(
@@ -365,7 +630,7 @@ async def analyze_code(request: CodeAnalysisRequest):
                         elif item.get('type') == 'dir' and depth < max_depth:
                             # Skip certain directories to avoid too many API calls
                             dir_name = item.get('name', '')
-                            if dir_name not in ['.git', 'node_modules', '__pycache__', '.pytest_cache']:
+                            if dir_name not in _SKIP_DIRS:
                                 try:
                                     subfiles = await get_all_files(item.get('path', ''), depth + 1, max_depth)
                                     files.extend(subfiles)
@@ -374,7 +639,19 @@ async def analyze_code(request: CodeAnalysisRequest):
                     
                     return files
                 
-                all_files = await get_all_files()
+                # Unchanged repositories reuse the previous walk; if the SHA can't
+                # be fetched the tree is always walked live
+                head_sha = await github_client.get_head_sha(owner, repo)
+                cache_key = (owner, repo, head_sha)
+                all_files = _repo_files_cache.get(cache_key) if head_sha else None
+                if all_files is not None:
+                    _repo_files_cache.move_to_end(cache_key)
+                else:
+                    all_files = await get_all_files()
+                    if head_sha:
+                        _repo_files_cache[cache_key] = all_files
+                        if len(_repo_files_cache) > _REPO_FILES_CACHE_SIZE:
+                            _repo_files_cache.popitem(last=False)
                 logger.info(f"Found {len(all_files)} total files in repository")
                 
                 analyzed_files = []
@@ -382,36 +659,57 @@ async def analyze_code(request: CodeAnalysisRequest):
                 documented_functions = 0
                 total_functions = 0
                 
+                # Fetch and parse Python files concurrently, capped so large repos
+                # don't open more than 16 GitHub requests at once
+                semaphore = asyncio.Semaphore(16)
+                
+                async def fetch_and_parse(item):
+                    """Fetch a single file from GitHub and parse it"""
+                    async with semaphore:
+                        file_content = await github_client.get_file_content(owner, repo, item.get('path', ''))
+                    return await PythonParser.parse_python_in_pool(file_content) if file_content else None
+                
+                python_files = []
                 for item in all_files:
                     filename = item.get('name', '')
-                    ext = Path(filename).suffix.lower()
+                    ext = _ext(filename)
                     
                     # Count files by language
-                    if ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb']:
+                    if ext in _CODE_EXTS:
                         total_files += 1
                         language = ext[1:] if ext else 'unknown'
                         languages[language] = languages.get(language, 0) + 1
                         
                         # Analyze Python files for complexity
                         if ext == '.py':
-                            file_content = await github_client.get_file_content(owner, repo, item.get('path', ''))
-                            if file_content:
-                                try:
-                                    parser = PythonParser()
-                                    result = parser.parse_python(file_content)
-                                    if 'error' not in result:
-                                        file_complexity = result.get('complexity_score', 0)
-                                        total_complexity += file_complexity
-                                        total_functions += len(result.get('functions', []))
-                                        documented_functions += len([f for f in result.get('functions', []) if f.get('docstring')])
-                                        analyzed_files.append({
-                                            'name': filename,
-                                            'complexity': file_complexity,
-                                            'functions': len(result.get('functions', [])),
-                                            'documented': len([f for f in result.get('functions', []) if f.get('docstring')])
-                                        })
-                                except Exception as e:
-                                    logger.warning(f"Error analyzing {filename}: {e}")
+                            python_files.append(item)
+                
+                results = await asyncio.gather(
+                    *(fetch_and_parse(item) for item in python_files),
+                    return_exceptions=True
+                )
+                
+                for item, result in zip(python_files, results):
+                    filename = item.get('name', '')
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error analyzing {filename}: {result}")
+                        continue
+                    if result is None or 'error' in result:
+                        continue
+                    
+                    file_complexity = result.get('complexity_score', 0)
+                    funcs = result.get('functions', [])
+                    n_funcs = len(funcs)
+                    n_doc = result.get('n_documented', 0)
+                    total_complexity += file_complexity
+                    total_functions += n_funcs
+                    documented_functions += n_doc
+                    analyzed_files.append({
+                        'name': filename,
+                        'complexity': file_complexity,
+                        'functions': n_funcs,
+                        'documented': n_doc
+                    })
                 
                 # Calculate metrics
                 if analyzed_files:
@@ -443,8 +741,8 @@ async def analyze_code(request: CodeAnalysisRequest):
             # Analyze provided files
             for file_path in request.files:
                 try:
-                    ext = Path(file_path).suffix.lower()
-                    if ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb']:
+                    ext = _ext(file_path)
+                    if ext in _CODE_EXTS:
                         total_files += 1
                         language = ext[1:] if ext else 'unknown'
                         languages[language] = languages.get(language, 0) + 1
@@ -463,32 +761,50 @@ async def analyze_code(request: CodeAnalysisRequest):
         if not recommendations:
             recommendations.append("Code analysis completed successfully")
         
-        return CodeAnalysisResponse(
+        return ORJSONResponse(CodeAnalysisResponse(
             total_files=total_files,
             languages=languages,
             complexity_summary=complexity_summary,
             documentation_coverage=documentation_coverage,
             recommendations=recommendations
-        )
+        ).dict())
         
     except Exception as e:
         logger.error(f"Code analysis error: {e}")
         raise HTTPException(status_code=500, detail="Code analysis failed")
 
-@router.get("/supported-languages")
-async def get_supported_languages():
-    """Get list of supported programming languages"""
+@router.get("/parse-cache")
+async def get_parse_cache_stats():
+    """Get Python parse cache statistics"""
     return {
-        "languages": [
-            {"name": "Python", "extensions": [".py"], "parser": "AST"},
-            {"name": "JavaScript", "extensions": [".js"], "parser": "Regex"},
-            {"name": "TypeScript", "extensions": [".ts"], "parser": "Regex"},
-            {"name": "Java", "extensions": [".java"], "parser": "Regex"},
-            {"name": "C++", "extensions": [".cpp", ".cc", ".cxx"], "parser": "Regex"},
-            {"name": "C", "extensions": [".c"], "parser": "Regex"},
-            {"name": "Go", "extensions": [".go"], "parser": "Regex"},
-            {"name": "Rust", "extensions": [".rs"], "parser": "Regex"},
-            {"name": "PHP", "extensions": [".php"], "parser": "Regex"},
-            {"name": "Ruby", "extensions": [".rb"], "parser": "Regex"}
-        ]
+        "size": len(_parse_cache),
+        "max_size": _PARSE_CACHE_SIZE,
+        "hits": _parse_cache_stats["hits"],
+        "misses": _parse_cache_stats["misses"]
     }
+
+# The language list never changes at runtime, so it is serialized once
+SUPPORTED_LANGUAGES = {
+    "languages": [
+        {"name": "Python", "extensions": [".py"], "parser": "AST"},
+        {"name": "JavaScript", "extensions": [".js"], "parser": "Regex"},
+        {"name": "TypeScript", "extensions": [".ts"], "parser": "Regex"},
+        {"name": "Java", "extensions": [".java"], "parser": "Regex"},
+        {"name": "C++", "extensions": [".cpp", ".cc", ".cxx"], "parser": "Regex"},
+        {"name": "C", "extensions": [".c"], "parser": "Regex"},
+        {"name": "Go", "extensions": [".go"], "parser": "Regex"},
+        {"name": "Rust", "extensions": [".rs"], "parser": "Regex"},
+        {"name": "PHP", "extensions": [".php"], "parser": "Regex"},
+        {"name": "Ruby", "extensions": [".rb"], "parser": "Regex"}
+    ]
+}
+_LANGUAGES_BODY = orjson.dumps(SUPPORTED_LANGUAGES)
+_LANGUAGES_ETAG = f'"{hashlib.blake2b(_LANGUAGES_BODY).hexdigest()[:16]}"'
+
+@router.get("/supported-languages")
+async def get_supported_languages(request: Request):
+    """Get list of supported programming languages"""
+    headers = {"ETag": _LANGUAGES_ETAG}
+    if _etag_matches(request, _LANGUAGES_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_LANGUAGES_BODY, media_type="application/json", headers=headers)
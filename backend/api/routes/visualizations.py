@@ -1,15 +1,253 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 import re
 import logging
 import json
+import hashlib
+from collections import OrderedDict
+from itertools import islice
 from datetime import datetime
 import ast
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Python flow diagram structure, matched in a single pass; m.lastgroup names
+# the kind of construct each match is
+_PY_FLOW_RE = re.compile(
+    r'(?P<func>def\s+(?P<func_name>\w+)\s*\((?P<func_params>[^)]*)\))'
+    r'|(?P<cls>class\s+(?P<cls_name>\w+)(?:\s*\((?P<cls_bases>[^)]*)\))?)'
+    r'|(?P<imp>from\s+(?P<imp_from>\w+)\s+import|import\s+(?P<imp_name>\w+))'
+    r'|\b(?P<ctrl>if|elif|else|for|while|try|except|finally|with|async|await)\b'
+    r'|(?P<ep>@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*["\'](?P<ep_path>[^"\']+)["\'])'
+    r'|(?<!\w)(?P<var>\w+)\s*='
+)
+
+# JavaScript flow diagram structure, matched in a single pass
+_JS_FLOW_RE = re.compile(
+    r'(?P<imp>(?:import|export)\s+(?:.*?from\s+)?[\'"](?P<imp_src>[^\'"]+)[\'"])'
+    r'|(?P<async>async\s+function\s+(?P<async_name>\w+))'
+    r'|(?P<func>function\s+(?P<func_name>\w+)|(?<!\w)(?P<func_assign>\w+)\s*[:=]\s*function)'
+    r'|(?<!\w)(?P<arrow>(?P<arrow_name>\w+)\s*[:=]\s*\([^)]*\)\s*=>)'
+    r'|(?P<cls>class\s+(?P<cls_name>\w+))'
+)
+_JS_FUNC_RE = re.compile(r'function\s+(\w+)|(?<!\w)(\w+)\s*[:=]\s*function|(?<!\w)(\w+)\s*[:=]\s*\([^)]*\)\s*=>')
+_JS_CALL_RE = re.compile(r'(?<!\w)(\w+)\s*\(')
+
+# Python API call graph patterns (FastAPI, Flask, Django)
+# FastAPI/Flask decorators and Django path() calls in one pattern; `method` is
+# unset for path() and "route" for @route, both of which are labelled GET
+_PY_API_ENDPOINT_RE = re.compile(
+    r'(?:@(?:app|router)\.(?P<method>get|post|put|delete|patch|route)|path)'
+    r'\s*\(\s*[\'"](?P<path>[^\'"]+)[\'"]'
+)
+# External service calls, function definitions and database calls, matched in a
+# single pass; each named group is one of the original patterns
+_PY_API_SCAN_RE = re.compile(
+    r'requests\.(?:get|post|put|delete)\s*\(\s*[\'"](?P<requests>[^\'"]+)[\'"]'
+    r'|httpx\.(?:get|post|put|delete)\s*\(\s*[\'"](?P<httpx>[^\'"]+)[\'"]'
+    r'|urllib\.request\.urlopen\s*\(\s*[\'"](?P<urllib>[^\'"]+)[\'"]'
+    r'|def\s+(?P<func>\w+)'
+    r'|(?P<db_read>\.(?:query|filter|get|all|first|count)\s*\()'
+    r'|(?P<db_write>\.(?:save|update|delete|insert)\s*\()'
+)
+
+# JavaScript API call graph patterns (Express, Axios)
+_JS_API_ENDPOINT_RES = tuple(re.compile(p) for p in (
+    r'\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    r'router\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
+))
+_JS_API_EXTERNAL_RES = tuple(re.compile(p) for p in (
+    r'fetch\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    r'axios\.(?:get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]',
+))
+
+# Generic API call graph patterns
+_GENERIC_API_RES = tuple(re.compile(p) for p in (
+    r'[\'"]([^\'"]*api[^\'"]*)[\'"]',
+    r'[\'"]([^\'"]*endpoint[^\'"]*)[\'"]',
+    r'[\'"]([^\'"]*url[^\'"]*)[\'"]',
+))
+_GENERIC_FUNC_RE = re.compile(r'(?:function|def)\s+(\w+)')
+
+# Generic flow diagram keywords, matched anywhere in a line without regard to
+# ASCII case, and the structural keywords a line can start with
+_GENERIC_KEYWORD_RE = re.compile(r'function|def|class|if|for|while|try|catch|switch|case', re.IGNORECASE | re.ASCII)
+_GENERIC_STRUCTURE_RE = re.compile(r'\s*(?ai:if|for|while|try|switch)')
+
+# Changelog patterns: versions, dates, and sentences by change type and by
+# feature area
+_VERSION_RE = re.compile(r'v?(\d+\.\d+\.\d+)')
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+# Change types in one pattern; each group is named after its type, and
+# [^.!\n]* is the same as the lazy .*? up to the first . or ! on the line
+_CHANGE_TYPE_RE = re.compile(
+    r'(?P<Added>(?:add|new|feature|implement)[^.!\n]*[.!])'
+    r'|(?P<Changed>(?:change|update|modify|improve)[^.!\n]*[.!])'
+    r'|(?P<Fixed>(?:fix|bug|issue|resolve)[^.!\n]*[.!])'
+    r'|(?P<Removed>(?:remove|delete|deprecate)[^.!\n]*[.!])',
+    re.IGNORECASE
+)
+# Feature areas in one pattern, with the heading each group is listed under
+_FEATURE_RE = re.compile(
+    r'(?P<ui>(?:ui|ux|interface|design|layout)[^.!\n]*[.!])'
+    r'|(?P<perf>(?:performance|speed|optimize|fast)[^.!\n]*[.!])'
+    r'|(?P<sec>(?:security|auth|encrypt|secure)[^.!\n]*[.!])'
+    r'|(?P<bug>(?:bug|fix|issue|error)[^.!\n]*[.!])'
+    r'|(?P<new>(?:feature|new|add|implement)[^.!\n]*[.!])',
+    re.IGNORECASE
+)
+_FEATURE_AREAS = {
+    "ui": "UI/UX",
+    "perf": "Performance",
+    "sec": "Security",
+    "bug": "Bug Fixes",
+    "new": "New Features",
+}
+
+# Longest code (in characters) a diagram is built from; anything past it is ignored
+_MAX_CODE_CHARS = 256 * 1024
+
+# Generated diagrams keyed by (kind, BLAKE2b digest of the code, options)
+_DIAGRAM_CACHE_SIZE = 512
+_diagram_cache: "OrderedDict[tuple, BaseModel]" = OrderedDict()
+
+def _diagram_key(kind: str, code: str, *options: str) -> tuple:
+    digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return (kind, digest) + options
+
+def _diagram_cache_get(key: tuple) -> Optional[BaseModel]:
+    result = _diagram_cache.get(key)
+    if result is None:
+        return None
+    _diagram_cache.move_to_end(key)
+    # Callers fill in document fields, so they get their own copy
+    return result.model_copy()
+
+def _diagram_cache_put(key: tuple, result: BaseModel):
+    _diagram_cache[key] = result.model_copy()
+    if len(_diagram_cache) > _DIAGRAM_CACHE_SIZE:
+        _diagram_cache.popitem(last=False)
+
+# Sequence-diagram messages for one function call
+_SEQUENCE_STEPS = (
+    "    User->>API: {func_name}()\n"
+    "    API->>Service: Process {func_name}\n"
+    "    Service->>DB: Query data\n"
+    "    DB-->>Service: Return data\n"
+    "    Service-->>API: Processed result\n"
+    "    API-->>User: Response\n"
+)
+
+# Makes paths and URLs usable as mermaid node ids
+_NODE_ID_TABLE = str.maketrans("/", "_")
+
+def _id_nodes(prefix: str, names: List[str]) -> Dict[str, str]:
+    """Mermaid nodes for names, keyed by node id so repeated names appear once"""
+    nodes = {}
+    for name in names:
+        node_id = f"{prefix}_{name.translate(_NODE_ID_TABLE)}"
+        nodes[node_id] = f"{node_id}({name})"
+    return nodes
+
+# Saved-document store, imported on first use to avoid a circular import
+_doc_manager = None
+
+def _get_doc_manager():
+    global _doc_manager
+    if _doc_manager is None:
+        from api.routes.docs import doc_manager
+        _doc_manager = doc_manager
+    return _doc_manager
+
+_ENDPOINT_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
+def _python_flow_structure(tree: ast.AST) -> tuple:
+    """Collect functions, classes, control keywords, imports, variables and endpoints from a Python AST
+
+    Only as many imports, variables and endpoints are kept as the flow diagram draws.
+    """
+    functions = []
+    classes = []
+    controls = []
+    imports = []
+    variables = []
+    endpoints = []
+    elif_nodes = set()
+    
+    # Pre-order walk so definitions come out in source order; control keywords
+    # are collected with their positions and sorted at the end
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if isinstance(node, ast.AsyncFunctionDef):
+                controls.append((node.lineno, node.col_offset, "async"))
+            functions.append((node.name, ast.unparse(node.args)))
+            for decorator in node.decorator_list:
+                if (isinstance(decorator, ast.Call) and decorator.args
+                        and isinstance(decorator.func, ast.Attribute)
+                        and decorator.func.attr in _ENDPOINT_METHODS
+                        and isinstance(decorator.func.value, ast.Name)
+                        and decorator.func.value.id in ("app", "router")
+                        and isinstance(decorator.args[0], ast.Constant)
+                        and isinstance(decorator.args[0].value, str)
+                        and len(endpoints) < 6):
+                    endpoints.append(decorator.args[0].value)
+        elif isinstance(node, ast.ClassDef):
+            bases = [ast.unparse(base) for base in node.bases + node.keywords]
+            classes.append((node.name, ", ".join(bases)))
+        elif isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names[:5 - len(imports)])
+        elif isinstance(node, ast.ImportFrom):
+            if len(imports) < 5:
+                imports.append("." * node.level + (node.module or ""))
+        elif isinstance(node, ast.If):
+            controls.append((node.lineno, node.col_offset, "elif" if id(node) in elif_nodes else "if"))
+            orelse = node.orelse
+            # An elif is an If alone in the else branch, starting at the same column
+            if len(orelse) == 1 and isinstance(orelse[0], ast.If) and orelse[0].col_offset == node.col_offset:
+                elif_nodes.add(id(orelse[0]))
+            elif orelse:
+                controls.append((orelse[0].lineno, -1, "else"))
+        elif isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+            if isinstance(node, ast.AsyncFor):
+                controls.append((node.lineno, node.col_offset, "async"))
+            controls.append((node.lineno, node.col_offset, "while" if isinstance(node, ast.While) else "for"))
+            if node.orelse:
+                controls.append((node.orelse[0].lineno, -1, "else"))
+        elif isinstance(node, (ast.Try, ast.TryStar)):
+            controls.append((node.lineno, node.col_offset, "try"))
+            controls.extend((handler.lineno, handler.col_offset, "except") for handler in node.handlers)
+            if node.orelse:
+                controls.append((node.orelse[0].lineno, -1, "else"))
+            if node.finalbody:
+                controls.append((node.finalbody[0].lineno, -1, "finally"))
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            if isinstance(node, ast.AsyncWith):
+                controls.append((node.lineno, node.col_offset, "async"))
+            controls.append((node.lineno, node.col_offset, "with"))
+        elif isinstance(node, ast.Await):
+            controls.append((node.lineno, node.col_offset, "await"))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and len(variables) < 5:
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for element in target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target]:
+                    if isinstance(element, ast.Name):
+                        variables.append(element.id)
+                    elif isinstance(element, ast.Attribute):
+                        variables.append(element.attr)
+            del variables[5:]
+        
+        children = list(ast.iter_child_nodes(node))
+        children.reverse()
+        stack.extend(children)
+    
+    controls.sort()
+    return functions, classes, [keyword for _, _, keyword in controls[:8]], imports, variables, endpoints
 
 class FlowDiagramRequest(BaseModel):
     code: str
@@ -68,9 +306,7 @@ class VisualizationGenerator:
             # Get document content if document_id is provided
             if document_id:
                 try:
-                    # Import here to avoid circular imports
-                    from api.routes.docs import doc_manager
-                    document = doc_manager.get_document(document_id)
+                    document = _get_doc_manager().get_document(document_id)
                     if document:
                         # Use document content instead of provided code
                         code = document.content
@@ -81,12 +317,20 @@ class VisualizationGenerator:
                 except Exception as e:
                     logger.error(f"Error fetching document: {e}")
             
-            if language == "python":
-                result = self._generate_python_flow(code, diagram_type)
-            elif language == "javascript":
-                result = self._generate_javascript_flow(code, diagram_type)
-            else:
-                result = self._generate_generic_flow(code, diagram_type)
+            if len(code) > _MAX_CODE_CHARS:
+                logger.warning(f"Truncating {len(code)} characters of code to {_MAX_CODE_CHARS} for flow diagram")
+                code = code[:_MAX_CODE_CHARS]
+            
+            cache_key = _diagram_key("flow", code, language, diagram_type)
+            result = _diagram_cache_get(cache_key)
+            if result is None:
+                if language == "python":
+                    result = self._generate_python_flow(code, diagram_type)
+                elif language == "javascript":
+                    result = self._generate_javascript_flow(code, diagram_type)
+                else:
+                    result = self._generate_generic_flow(code, diagram_type)
+                _diagram_cache_put(cache_key, result)
             
             # Add document information to response
             result.document_used = document_id
@@ -102,31 +346,48 @@ class VisualizationGenerator:
     def _generate_python_flow(self, code: str, diagram_type: str) -> FlowDiagramResponse:
         """Generate comprehensive Python flow diagram with visual styling"""
         try:
-            # Extract function definitions with parameters
-            function_pattern = r'def\s+(\w+)\s*\(([^)]*)\)'
-            functions = re.findall(function_pattern, code)
-            
-            # Extract class definitions with inheritance
-            class_pattern = r'class\s+(\w+)(?:\s*\(([^)]*)\))?'
-            classes = re.findall(class_pattern, code)
-            
-            # Extract control flow keywords with context
-            control_pattern = r'\b(if|elif|else|for|while|try|except|finally|with|async|await)\b'
-            controls = re.findall(control_pattern, code)
-            
-            # Extract imports
-            import_pattern = r'(?:from\s+(\w+)\s+import|import\s+(\w+))'
-            imports = re.findall(import_pattern, code)
-            
-            # Extract variable assignments
-            var_pattern = r'(\w+)\s*='
-            variables = re.findall(var_pattern, code)
-            
-            # Extract API endpoints (for FastAPI/Flask)
-            endpoint_pattern = r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'
-            endpoints = re.findall(endpoint_pattern, code)
-            
-            nodes = []
+            # Extract functions (with parameters), classes (with inheritance),
+            # control flow keywords, imports, variable assignments and API
+            # endpoints (for FastAPI/Flask) from the syntax tree
+            # Deeply nested input can exhaust the recursion limit or memory while
+            # the tree is built or unparsed; it takes the regex path as well
+            try:
+                structure = _python_flow_structure(ast.parse(code))
+            except (SyntaxError, ValueError, RecursionError, MemoryError):
+                structure = None
+            if structure is not None:
+                functions, classes, controls, imports, variables, endpoints = structure
+            else:
+                # Code that doesn't parse is scanned for the same constructs
+                # in one regex pass; buckets stop growing once they hold as
+                # many entries as the diagram draws
+                functions = []
+                classes = []
+                controls = []
+                imports = []
+                variables = []
+                endpoints = []
+                for match in _PY_FLOW_RE.finditer(code):
+                    kind = match.lastgroup
+                    if kind == "var":
+                        if len(variables) < 5:
+                            variables.append(match.group("var"))
+                    elif kind == "ctrl":
+                        if len(controls) < 8:
+                            controls.append(match.group("ctrl"))
+                    elif kind == "func":
+                        functions.append((match.group("func_name"), match.group("func_params")))
+                    elif kind == "cls":
+                        classes.append((match.group("cls_name"), match.group("cls_bases") or ""))
+                    elif kind == "imp":
+                        if len(imports) < 5:
+                            imports.append(match.group("imp_from") or match.group("imp_name"))
+                    elif len(endpoints) < 6:
+                        endpoints.append(match.group("ep_path"))
+            
+            # Nodes keyed by id, so a name seen twice (e.g. methods of different
+            # classes) is emitted once with its last label
+            nodes = {}
             edges = []
             analysis = {
                 "functions": [],
@@ -143,15 +404,25 @@ class VisualizationGenerator:
 graph TD
 """
                 
+                # Analysis lists come straight from the extracted structure;
+                # the loops below only build mermaid nodes
+                param_lists = [[p.strip() for p in params.split(',') if p.strip()] for _, params in functions]
+                analysis = {
+                    "functions": [{"name": func[0], "params": param_list} for func, param_list in zip(functions, param_lists)],
+                    "classes": [{"name": class_name, "inheritance": inheritance} for class_name, inheritance in classes],
+                    "control_structures": controls[:8],
+                    "imports": [module for module in imports[:5] if module],
+                    "variables": [var for var in variables[:5] if var not in ['self', 'cls']],
+                    "endpoints": endpoints[:6]
+                }
+                
                 # Add functions with visual styling
-                for func_name, params in functions:
-                    param_list = [p.strip() for p in params.split(',') if p.strip()]
+                for (func_name, _), param_list in zip(functions, param_lists):
                     node_label = f"{func_name}({', '.join(param_list[:3])}{'...' if len(param_list) > 3 else ''})"
                     # Sanitize node ID and label for Mermaid
                     safe_node_id = f"func_{func_name}".replace('(', '').replace(')', '').replace('-', '_').replace(' ', '_')
                     safe_label = node_label.replace('(', '[').replace(')', ']')
-                    nodes.append(f'{safe_node_id}["{safe_label}"]')
-                    analysis["functions"].append({"name": func_name, "params": param_list})
+                    nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Add classes with visual styling
                 for class_name, inheritance in classes:
@@ -162,34 +433,29 @@ graph TD
                     # Sanitize node ID and label for Mermaid
                     safe_node_id = f"class_{class_name}".replace('(', '').replace(')', '').replace('-', '_').replace(' ', '_')
                     safe_label = node_label.replace('(', '[').replace(')', ']')
-                    nodes.append(f'{safe_node_id}["{safe_label}"]')
-                    analysis["classes"].append({"name": class_name, "inheritance": inheritance})
+                    nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Add control structures with visual styling
                 for i, control in enumerate(controls[:8]):  # Limit to 8 controls
                     # Sanitize node ID and label for Mermaid
                     safe_node_id = f"control_{i}"
                     safe_label = control.replace('(', '[').replace(')', ']').replace('"', "'")
-                    nodes.append(f'{safe_node_id}["{safe_label}"]')
-                    analysis["control_structures"].append(control)
+                    nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Add imports with visual styling
-                for i, imp in enumerate(imports[:5]):  # Limit to 5 imports
-                    module = imp[0] if imp[0] else imp[1]
+                for i, module in enumerate(imports[:5]):  # Limit to 5 imports
                     if module:
                         # Sanitize node ID and label for Mermaid
                         safe_node_id = f"import_{i}"
                         safe_label = module.replace('(', '[').replace(')', ']').replace('"', "'")
-                        nodes.append(f'{safe_node_id}["{safe_label}"]')
-                        analysis["imports"].append(module)
+                        nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Add API endpoints with visual styling
                 for i, endpoint in enumerate(endpoints[:6]):  # Limit to 6 endpoints
                     # Sanitize node ID and label for Mermaid
                     safe_node_id = f"endpoint_{i}"
                     safe_label = endpoint.replace('(', '[').replace(')', ']').replace('"', "'")
-                    nodes.append(f'{safe_node_id}["{safe_label}"]')
-                    analysis["endpoints"].append(endpoint)
+                    nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Add key variables with visual styling
                 for i, var in enumerate(variables[:5]):  # Limit to 5 variables
@@ -197,16 +463,14 @@ graph TD
                         # Sanitize node ID and label for Mermaid
                         safe_node_id = f"var_{i}"
                         safe_label = var.replace('(', '[').replace(')', ']').replace('"', "'")
-                        nodes.append(f'{safe_node_id}["{safe_label}"]')
-                        analysis["variables"].append(var)
+                        nodes[safe_node_id] = f'{safe_node_id}["{safe_label}"]'
                 
                 # Create logical flow connections
                 # Connect functions to their imports
                 for i, func in enumerate(functions[:3]):
                     func_name = func[0]
                     func_id = f"func_{func_name}".replace('(', '').replace(')', '').replace('-', '_').replace(' ', '_')
-                    for j, imp in enumerate(imports[:3]):
-                        module = imp[0] if imp[0] else imp[1]
+                    for j, module in enumerate(imports[:3]):
                         if module:
                             import_id = f"import_{j}"
                             edges.append(f'{func_id} --> {import_id}')
@@ -228,7 +492,7 @@ graph TD
                 
                 # Add all nodes and edges to mermaid code
                 if nodes:
-                    mermaid_code += "\n".join(nodes) + "\n"
+                    mermaid_code += "\n".join(nodes.values()) + "\n"
                 if edges:
                     mermaid_code += "\n".join(edges)
                 
@@ -261,18 +525,12 @@ sequenceDiagram
 """
                 
                 # Add function calls as sequence
-                for i, func in enumerate(functions[:6]):
-                    func_name = func[0]
-                    mermaid_code += f"    User->>API: {func_name}()\n"
-                    mermaid_code += f"    API->>Service: Process {func_name}\n"
-                    mermaid_code += f"    Service->>DB: Query data\n"
-                    mermaid_code += f"    DB-->>Service: Return data\n"
-                    mermaid_code += f"    Service-->>API: Processed result\n"
-                    mermaid_code += f"    API-->>User: Response\n"
+                mermaid_code += "".join(_SEQUENCE_STEPS.format(func_name=func[0]) for func in functions[:6])
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return FlowDiagramResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=len(nodes),
                 edges=len(edges),
                 complexity="High" if len(nodes) > 10 else "Medium" if len(nodes) > 5 else "Simple",
@@ -285,71 +543,72 @@ sequenceDiagram
     def _generate_javascript_flow(self, code: str, diagram_type: str) -> FlowDiagramResponse:
         """Generate comprehensive JavaScript flow diagram"""
         try:
-            # Extract function definitions
-            function_pattern = r'function\s+(\w+)|(\w+)\s*[:=]\s*function|(\w+)\s*[:=]\s*\([^)]*\)\s*=>'
-            functions = re.findall(function_pattern, code)
-            
-            # Extract class definitions
-            class_pattern = r'class\s+(\w+)'
-            classes = re.findall(class_pattern, code)
-            
-            # Extract async functions
-            async_pattern = r'async\s+function\s+(\w+)'
-            async_funcs = re.findall(async_pattern, code)
-            
-            # Extract arrow functions
-            arrow_pattern = r'(\w+)\s*[:=]\s*\([^)]*\)\s*=>'
-            arrows = re.findall(arrow_pattern, code)
-            
-            # Extract imports/exports
-            import_pattern = r'(?:import|export)\s+(?:.*?from\s+)?[\'"]([^\'"]+)[\'"]'
-            imports = re.findall(import_pattern, code)
-            
-            nodes = []
+            # Extract functions, classes, async functions, arrow functions and
+            # imports/exports in one pass; async and arrow functions are also
+            # listed as functions
+            functions = []
+            classes = []
+            async_funcs = []
+            arrows = []
+            imports = []
+            for match in _JS_FLOW_RE.finditer(code):
+                kind = match.lastgroup
+                if kind == "func":
+                    functions.append((match.group("func_name") or "", match.group("func_assign") or "", ""))
+                elif kind == "arrow":
+                    name = match.group("arrow_name")
+                    functions.append(("", "", name))
+                    arrows.append(name)
+                elif kind == "async":
+                    name = match.group("async_name")
+                    functions.append((name, "", ""))
+                    async_funcs.append(name)
+                elif kind == "cls":
+                    classes.append(match.group("cls_name"))
+                else:
+                    imports.append(match.group("imp_src"))
+            
+            # Nodes keyed by id; repeated names are emitted once
+            nodes = {}
             edges = []
+            function_names = [next(name for name in func if name) for func in functions]
             analysis = {
-                "functions": [],
-                "classes": [],
-                "async_functions": [],
-                "arrow_functions": [],
-                "imports": []
+                "functions": function_names,
+                "classes": classes,
+                "async_functions": async_funcs,
+                "arrow_functions": arrows,
+                "imports": imports
             }
             
-            # Add functions
-            for func in functions:
-                func_name = next(name for name in func if name)
-                nodes.append(f'func_{func_name}({func_name})')
-                analysis["functions"].append(func_name)
+            # Add functions; arrow functions are drawn once, as arrow nodes
+            for func, func_name in zip(functions, function_names):
+                if not func[2]:
+                    nodes[f'func_{func_name}'] = f'func_{func_name}({func_name})'
              
             # Add classes
             for cls in classes:
-                nodes.append(f'class_{cls}({cls})')
-                analysis["classes"].append(cls)
+                nodes[f'class_{cls}'] = f'class_{cls}({cls})'
             
             # Add async functions
             for async_func in async_funcs:
-                nodes.append(f'async_{async_func}({async_func} async)')
-                analysis["async_functions"].append(async_func)
+                nodes[f'async_{async_func}'] = f'async_{async_func}({async_func} async)'
             
             # Add arrow functions
             for arrow in arrows:
-                nodes.append(f'arrow_{arrow}({arrow} arrow)')
-                analysis["arrow_functions"].append(arrow)
+                nodes[f'arrow_{arrow}'] = f'arrow_{arrow}({arrow} arrow)'
             
             # Add imports
-            for imp in imports:
-                nodes.append(f'import_{imp.replace("/", "_")}({imp})')
-                analysis["imports"].append(imp)
+            nodes.update(_id_nodes("import", imports))
             
             # Look for function calls and create edges
-            call_pattern = r'(\w+)\s*\('
-            calls = re.findall(call_pattern, code)
+            calls = _JS_CALL_RE.findall(code)
+            func_names = {func[0] for func in functions if func[0]}
             
             for call in calls:
-                if call in [func[0] for func in functions if func[0]]:
+                if call in func_names:
                     edges.append(f'func_{call} --> func_{call}')
             
-            nodes_str = "\n".join(nodes)
+            nodes_str = "\n".join(nodes.values())
             edges_str = "\n".join(edges)
             mermaid_code = f"""
 graph TD
@@ -357,9 +616,10 @@ graph TD
     {edges_str}
 """
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return FlowDiagramResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=len(nodes),
                 edges=len(edges),
                 complexity="High" if len(nodes) > 10 else "Medium" if len(nodes) > 5 else "Simple",
@@ -380,15 +640,19 @@ graph TD
             }
             
             for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                if any(keyword in line_lower for keyword in ['function', 'def', 'class', 'if', 'for', 'while', 'try', 'catch', 'switch', 'case']):
-                    node_label = f"{line.strip()[:30]}..."
-                    nodes.append(f'node_{i}({node_label})')
-                    analysis["keywords"].append(line.strip())
+                if not _GENERIC_KEYWORD_RE.search(line):
+                    continue
+                stripped = line.strip()
+                node_label = f"{stripped[:30]}..."
+                nodes.append(f'node_{i}({node_label})')
+                analysis["keywords"].append(stripped)
                 
                 # Look for structural patterns
-                if line_lower.startswith(('if', 'for', 'while', 'try', 'switch')):
-                    analysis["structures"].append(line.strip())
+                if _GENERIC_STRUCTURE_RE.match(line):
+                    analysis["structures"].append(stripped)
+                
+                if len(nodes) >= 40:  # Limit to 40 nodes
+                    break
             
             nodes_str = "\n".join(nodes)
             mermaid_code = f"""
@@ -396,9 +660,10 @@ graph TD
     {nodes_str}
 """
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return FlowDiagramResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=len(nodes),
                 edges=0,
                 complexity="Medium" if len(nodes) > 5 else "Simple",
@@ -414,20 +679,28 @@ graph TD
             # Get document content if document_id is provided
             if document_id:
                 try:
-                    from api.routes.docs import doc_manager
-                    document = doc_manager.get_document(document_id)
+                    document = _get_doc_manager().get_document(document_id)
                     if document:
                         code = document.content
                         document_title = document.title
                 except Exception as e:
                     logger.error(f"Error fetching document: {e}")
             
-            if language == "python":
-                return self._generate_python_api_graph(code)
-            elif language == "javascript":
-                return self._generate_javascript_api_graph(code)
-            else:
-                return self._generate_generic_api_graph(code)
+            if len(code) > _MAX_CODE_CHARS:
+                logger.warning(f"Truncating {len(code)} characters of code to {_MAX_CODE_CHARS} for API call graph")
+                code = code[:_MAX_CODE_CHARS]
+            
+            cache_key = _diagram_key("api", code, language)
+            result = _diagram_cache_get(cache_key)
+            if result is None:
+                if language == "python":
+                    result = self._generate_python_api_graph(code)
+                elif language == "javascript":
+                    result = self._generate_javascript_api_graph(code)
+                else:
+                    result = self._generate_generic_api_graph(code)
+                _diagram_cache_put(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error generating API call graph: {e}")
             return self._generate_fallback_api_graph()
@@ -436,68 +709,43 @@ graph TD
         """Generate Python API call graph with visual styling"""
         try:
             # Extract API endpoints (FastAPI, Flask, Django patterns)
-            endpoint_patterns = [
-                r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'@(?:app|router)\.route\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'path\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-                r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*,',
-                r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)\s*async',
-                r'@(?:app|router)\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)\s*def',
-            ]
-            
             api_endpoints = []
-            for pattern in endpoint_patterns:
-                matches = re.findall(pattern, code)
-                api_endpoints.extend(matches)
-            
-            # Extract HTTP methods from endpoints
-            method_pattern = r'@(?:app|router)\.(get|post|put|delete|patch)'
-            methods = re.findall(method_pattern, code)
-            
-            # Extract external service calls
-            external_patterns = [
-                r'requests\.(?:get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'httpx\.(?:get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'urllib\.request\.urlopen\s*\(\s*[\'"]([^\'"]+)[\'"]',
-            ]
-            
-            external_services = []
-            for pattern in external_patterns:
-                matches = re.findall(pattern, code)
-                external_services.extend(matches)
-            
-            # Extract internal function calls
-            function_pattern = r'def\s+(\w+)'
-            internal_functions = re.findall(function_pattern, code)
-            
-            # Extract database calls
-            db_patterns = [
-                r'\.(?:query|filter|get|all|first|count)\s*\(',
-                r'\.(?:save|update|delete|insert)\s*\(',
-            ]
-            
-            db_calls = []
-            for pattern in db_patterns:
-                matches = re.findall(pattern, code)
-                db_calls.extend(matches)
+            methods = []
+            # Extract endpoints and their HTTP methods in one pass
+            for match in _PY_API_ENDPOINT_RE.finditer(code):
+                method = match.group("method")
+                api_endpoints.append(match.group("path"))
+                methods.append(method if method and method != "route" else "GET")
+            
+            # Extract external service calls, internal functions and database
+            # calls in one pass, bucketed by pattern so each list keeps the
+            # original pattern-by-pattern order
+            buckets = {name: [] for name in _PY_API_SCAN_RE.groupindex}
+            for match in _PY_API_SCAN_RE.finditer(code):
+                kind = match.lastgroup
+                # Only the first 5 database calls are drawn
+                if kind.startswith("db_") and len(buckets[kind]) >= 5:
+                    continue
+                buckets[kind].append(match.group(kind))
+            external_services = buckets["requests"] + buckets["httpx"] + buckets["urllib"]
+            internal_functions = buckets["func"]
+            db_calls = buckets["db_read"] + buckets["db_write"]
             
             # Create visual API graph with proper styling
-            mermaid_code = """
+            parts = ["""
 graph TD
-"""
+"""]
             
             # Add API endpoints with visual styling
-            for i, endpoint in enumerate(api_endpoints[:8]):  # Limit to 8 endpoints
-                method = methods[i] if i < len(methods) else "GET"
+            for i, (endpoint, method) in enumerate(zip(api_endpoints[:8], methods)):  # Limit to 8 endpoints
                 # Sanitize node ID and label for Mermaid
                 safe_node_id = f"endpoint_{i}"
                 safe_label = f"{method.upper()} {endpoint}".replace('(', '[').replace(')', ']').replace('"', "'")
-                mermaid_code += f'    {safe_node_id}["{safe_label}"]\n'
+                parts.append(f'    {safe_node_id}["{safe_label}"]\n')
             
             # If no API endpoints found, create a generic API structure
             if not api_endpoints:
-                mermaid_code += """
+                parts.append("""
     %% Generic API Structure
     client[Client Request]
     router[API Router]
@@ -516,60 +764,60 @@ graph TD
     database --> business
     business --> response
     response --> client
-"""
+""")
             
             # Add external services with visual styling
             for i, service in enumerate(external_services[:5]):  # Limit to 5 services
                 # Sanitize node ID and label for Mermaid
                 safe_node_id = f"service_{i}"
                 safe_label = service.replace('(', '[').replace(')', ']').replace('"', "'")
-                mermaid_code += f'    {safe_node_id}["{safe_label}"]\n'
+                parts.append(f'    {safe_node_id}["{safe_label}"]\n')
             
             # Add internal functions with visual styling
             for i, func in enumerate(internal_functions[:8]):  # Limit to 8 functions
                 # Sanitize node ID and label for Mermaid
                 safe_node_id = f"func_{i}"
                 safe_label = f"{func}[]".replace('(', '[').replace(')', ']').replace('"', "'")
-                mermaid_code += f'    {safe_node_id}["{safe_label}"]\n'
+                parts.append(f'    {safe_node_id}["{safe_label}"]\n')
             
             # Add database operations with visual styling
             for i, db_op in enumerate(db_calls[:5]):  # Limit to 5 DB ops
                 # Sanitize node ID and label for Mermaid
                 safe_node_id = f"db_{i}"
                 safe_label = db_op.replace('(', '[').replace(')', ']').replace('"', "'")
-                mermaid_code += f'    {safe_node_id}["{safe_label}"]\n'
+                parts.append(f'    {safe_node_id}["{safe_label}"]\n')
             
             # Create logical API flow connections
-            mermaid_code += "\n    %% Connections\n"
-            
-            # Connect endpoints to functions
-            for i, endpoint in enumerate(api_endpoints[:3]):
-                endpoint_id = f"endpoint_{i}"
-                func_id = f"func_{i}"
-                if i < len(internal_functions):
-                    mermaid_code += f'    {endpoint_id} --> {func_id}\n'
-            
-            # Connect functions to services
-            for i, func in enumerate(internal_functions[:3]):
+            parts.append("\n    %% Connections\n")
+            
+            # Connect the first three functions to their endpoint, service and
+            # database nodes in one loop; the three kinds of edge are still
+            # emitted as separate groups
+            endpoint_edges = []
+            service_edges = []
+            db_edges = []
+            for i in range(min(3, len(internal_functions))):
                 func_id = f"func_{i}"
-                service_id = f"service_{i}"
+                if i < len(api_endpoints):
+                    endpoint_edges.append(f'    endpoint_{i} --> {func_id}\n')
                 if i < len(external_services):
-                    mermaid_code += f'    {func_id} --> {service_id}\n'
-            
-            # Connect functions to database
-            for i, func in enumerate(internal_functions[:3]):
-                func_id = f"func_{i}"
-                db_id = f"db_{i}"
+                    service_edges.append(f'    {func_id} --> service_{i}\n')
                 if i < len(db_calls):
-                    mermaid_code += f'    {func_id} --> {db_id}\n'
+                    db_edges.append(f'    {func_id} --> db_{i}\n')
+            parts.extend(endpoint_edges)
+            parts.extend(service_edges)
+            parts.extend(db_edges)
+            
+            mermaid_code = "".join(parts)
             
             # Calculate total nodes and edges
             total_nodes = len(api_endpoints[:8]) + len(external_services[:5]) + len(internal_functions[:8]) + len(db_calls[:5])
             total_edges = min(3, len(api_endpoints)) + min(3, len(internal_functions)) + min(3, len(internal_functions))
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return APICallGraphResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=total_nodes,
                 edges=total_edges,
                 api_endpoints=api_endpoints,
@@ -586,53 +834,37 @@ graph TD
         """Generate JavaScript API call graph"""
         try:
             # Extract API endpoints (Express, Axios patterns)
-            endpoint_patterns = [
-                r'\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'router\.(?:get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-            ]
-            
             api_endpoints = []
-            for pattern in endpoint_patterns:
-                matches = re.findall(pattern, code)
-                api_endpoints.extend(matches)
+            for pattern in _JS_API_ENDPOINT_RES:
+                api_endpoints.extend(pattern.findall(code))
             
             # Extract external service calls
-            external_patterns = [
-                r'fetch\s*\(\s*[\'"]([^\'"]+)[\'"]',
-                r'axios\.(?:get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-            ]
-            
             external_services = []
-            for pattern in external_patterns:
-                matches = re.findall(pattern, code)
-                external_services.extend(matches)
+            for pattern in _JS_API_EXTERNAL_RES:
+                external_services.extend(pattern.findall(code))
             
             # Extract function definitions
-            function_pattern = r'function\s+(\w+)|(\w+)\s*[:=]\s*function|(\w+)\s*[:=]\s*\([^)]*\)\s*=>'
-            functions = re.findall(function_pattern, code)
+            functions = _JS_FUNC_RE.findall(code)
             internal_functions = [next(name for name in func if name) for func in functions]
             
-            # Initialize nodes and edges lists
-            nodes = []
+            # Nodes keyed by id per subgraph; endpoints matched by both
+            # patterns and repeated names are emitted once
+            endpoint_nodes = _id_nodes("endpoint", api_endpoints)
+            service_nodes = _id_nodes("service", external_services)
+            function_nodes = _id_nodes("func", internal_functions[:10])
+            nodes = [*endpoint_nodes.values(), *service_nodes.values(), *function_nodes.values()]
             edges = []
             
-            # Add nodes
-            for endpoint in api_endpoints:
-                nodes.append(f'endpoint_{endpoint.replace("/", "_")}({endpoint})')
-            for service in external_services:
-                nodes.append(f'service_{service.replace("/", "_")}({service})')
-            for func in internal_functions[:10]:
-                nodes.append(f'func_{func}({func})')
-            
-            # Create edges
-            for endpoint in api_endpoints:
-                for func in internal_functions:
-                    if func in code:
-                        edges.append(f'endpoint_{endpoint.replace("/", "_")} --> func_{func}')
+            # Create edges; the substring check only depends on the function,
+            # so it is done once per function rather than once per endpoint
+            funcs_in_code = list(dict.fromkeys(func for func in internal_functions if func in code))
+            for endpoint_id in endpoint_nodes:
+                for func in funcs_in_code:
+                    edges.append(f'{endpoint_id} --> func_{func}')
             
-            endpoints_str = "\n".join([f'    endpoint_{ep.replace("/", "_")}({ep})' for ep in api_endpoints])
-            services_str = "\n".join([f'    service_{es.replace("/", "_")}({es})' for es in external_services])
-            functions_str = "\n".join([f'    func_{func}({func})' for func in internal_functions[:10]])
+            endpoints_str = "\n".join([f'    {node}' for node in endpoint_nodes.values()])
+            services_str = "\n".join([f'    {node}' for node in service_nodes.values()])
+            functions_str = "\n".join([f'    {node}' for node in function_nodes.values()])
             edges_str = "\n".join([f'    {edge}' for edge in edges])
             mermaid_code = f"""
 graph TD
@@ -648,9 +880,10 @@ graph TD
 {edges_str}
 """
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return APICallGraphResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=len(nodes),
                 edges=len(edges),
                 api_endpoints=api_endpoints,
@@ -667,29 +900,21 @@ graph TD
         """Generate generic API call graph"""
         try:
             # Look for common API patterns
-            api_patterns = [
-                r'[\'"]([^\'"]*api[^\'"]*)[\'"]',
-                r'[\'"]([^\'"]*endpoint[^\'"]*)[\'"]',
-                r'[\'"]([^\'"]*url[^\'"]*)[\'"]',
-            ]
-            
             api_endpoints = []
-            for pattern in api_patterns:
-                matches = re.findall(pattern, code)
-                api_endpoints.extend(matches)
+            for pattern in _GENERIC_API_RES:
+                api_endpoints.extend(pattern.findall(code))
             
             # Look for function definitions
-            function_pattern = r'(?:function|def)\s+(\w+)'
-            internal_functions = re.findall(function_pattern, code)
+            internal_functions = _GENERIC_FUNC_RE.findall(code)
             
-            nodes = []
-            for endpoint in api_endpoints:
-                nodes.append(f'endpoint_{endpoint.replace("/", "_")}({endpoint})')
-            for func in internal_functions[:10]:
-                nodes.append(f'func_{func}({func})')
+            # Nodes keyed by id; strings matched by more than one pattern are
+            # emitted once
+            endpoint_nodes = _id_nodes("endpoint", api_endpoints)
+            function_nodes = _id_nodes("func", internal_functions[:10])
+            nodes = [*endpoint_nodes.values(), *function_nodes.values()]
             
-            endpoints_str = "\n".join([f'    endpoint_{ep.replace("/", "_")}({ep})' for ep in api_endpoints])
-            functions_str = "\n".join([f'    func_{func}({func})' for func in internal_functions[:10]])
+            endpoints_str = "\n".join([f'    {node}' for node in endpoint_nodes.values()])
+            functions_str = "\n".join([f'    {node}' for node in function_nodes.values()])
             mermaid_code = f"""
 graph TD
     subgraph "API Endpoints"
@@ -700,9 +925,10 @@ graph TD
     end
 """
             
+            mermaid_code = self._render_mermaid(mermaid_code)
             return APICallGraphResponse(
-                diagram=self._render_mermaid(mermaid_code),
-                mermaid_code=mermaid_code.strip(),
+                diagram=mermaid_code,
+                mermaid_code=mermaid_code,
                 nodes=len(nodes),
                 edges=0,
                 api_endpoints=api_endpoints,
@@ -732,9 +958,10 @@ graph TD
     C --> B
 """
         
+        mermaid_code = self._render_mermaid(mermaid_code)
         return APICallGraphResponse(
-            diagram=self._render_mermaid(mermaid_code),
-            mermaid_code=mermaid_code.strip(),
+            diagram=mermaid_code,
+            mermaid_code=mermaid_code,
             nodes=3,
             edges=2,
             api_endpoints=["/api/endpoint"],
@@ -750,8 +977,7 @@ graph TD
             # Get document content if document_id is provided
             if document_id:
                 try:
-                    from api.routes.docs import doc_manager
-                    document = doc_manager.get_document(document_id)
+                    document = _get_doc_manager().get_document(document_id)
                     if document:
                         content = document.content
                         document_title = document.title
@@ -771,25 +997,24 @@ graph TD
     def _generate_semantic_changelog(self, content: str, document_id: Optional[str] = None, document_title: Optional[str] = None) -> ChangelogResponse:
         """Generate semantic changelog"""
         try:
-            # Extract version patterns
-            version_pattern = r'v?(\d+\.\d+\.\d+)'
-            versions = re.findall(version_pattern, content)
-            
-            # Extract change types
-            change_patterns = {
-                "Added": r'(?:add|new|feature|implement).*?[.!]',
-                "Changed": r'(?:change|update|modify|improve).*?[.!]',
-                "Fixed": r'(?:fix|bug|issue|resolve).*?[.!]',
-                "Removed": r'(?:remove|delete|deprecate).*?[.!]',
-            }
-            
-            changes = {}
-            for change_type, pattern in change_patterns.items():
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                changes[change_type] = matches[:5]  # Limit to 5 per type
+            # Extract version patterns; only the first 5 are used
+            versions = [match.group(1) for match in islice(_VERSION_RE.finditer(content), 5)]
+            
+            # Extract change types in one pass, stopping once every type has
+            # its 5 entries
+            changes = {change_type: [] for change_type in _CHANGE_TYPE_RE.groupindex}
+            open_types = len(changes)
+            for match in _CHANGE_TYPE_RE.finditer(content):
+                matches = changes[match.lastgroup]
+                if len(matches) < 5:  # Limit to 5 per type
+                    matches.append(match.group())
+                    if len(matches) == 5:
+                        open_types -= 1
+                        if not open_types:
+                            break
             
             version_history = []
-            for i, version in enumerate(versions[:5]):  # Limit to 5 versions
+            for i, version in enumerate(versions):  # Limit to 5 versions
                 version_history.append({
                     "version": f"v{version}",
                     "date": datetime.now().strftime("%Y-%m-%d"),
@@ -858,20 +1083,20 @@ graph TD
     def _generate_chronological_changelog(self, content: str, document_id: Optional[str] = None, document_title: Optional[str] = None) -> ChangelogResponse:
         """Generate chronological changelog"""
         try:
-            # Extract date patterns
-            date_pattern = r'(\d{4}-\d{2}-\d{2})'
-            dates = re.findall(date_pattern, content)
-            
-            # Extract changes by date
+            # Extract dates and the lines they appear on in one pass; a line
+            # is listed once under each distinct date it mentions, and only
+            # the first 5 dates are kept for the version history
+            dates = []
             changes_by_date = {}
-            lines = content.split('\n')
-            
-            for line in lines:
-                for date in dates:
-                    if date in line:
-                        if date not in changes_by_date:
-                            changes_by_date[date] = []
-                        changes_by_date[date].append(line.strip())
+            for line in content.split('\n'):
+                line_dates = _DATE_RE.findall(line)
+                if not line_dates:
+                    continue
+                if len(dates) < 5:
+                    dates.extend(line_dates)
+                change = line.strip()
+                for date in dict.fromkeys(line_dates):
+                    changes_by_date.setdefault(date, []).append(change)
             
             version_history = []
             for date in sorted(dates[:5], reverse=True):  # Last 5 dates
@@ -916,19 +1141,18 @@ graph TD
     def _generate_feature_changelog(self, content: str, document_id: Optional[str] = None, document_title: Optional[str] = None) -> ChangelogResponse:
         """Generate feature-based changelog"""
         try:
-            # Extract feature patterns
-            feature_patterns = {
-                "UI/UX": r'(?:ui|ux|interface|design|layout).*?[.!]',
-                "Performance": r'(?:performance|speed|optimize|fast).*?[.!]',
-                "Security": r'(?:security|auth|encrypt|secure).*?[.!]',
-                "Bug Fixes": r'(?:bug|fix|issue|error).*?[.!]',
-                "New Features": r'(?:feature|new|add|implement).*?[.!]',
-            }
-            
-            features = {}
-            for feature_type, pattern in feature_patterns.items():
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                features[feature_type] = matches[:5]
+            # Extract feature patterns in one pass, stopping once every area
+            # has its 5 entries
+            features = {feature_type: [] for feature_type in _FEATURE_AREAS.values()}
+            open_areas = len(features)
+            for match in _FEATURE_RE.finditer(content):
+                matches = features[_FEATURE_AREAS[match.lastgroup]]
+                if len(matches) < 5:
+                    matches.append(match.group())
+                    if len(matches) == 5:
+                        open_areas -= 1
+                        if not open_areas:
+                            break
             
             version_history = [{
                 "version": "v1.0.0",
@@ -1002,9 +1226,10 @@ graph TD
     style C fill:#e8f5e8
 """
         
+        mermaid_code = self._render_mermaid(mermaid_code)
         return FlowDiagramResponse(
-            diagram=self._render_mermaid(mermaid_code),
-            mermaid_code=mermaid_code.strip(),
+            diagram=mermaid_code,
+            mermaid_code=mermaid_code,
             nodes=3,
             edges=2,
             complexity="Simple",
@@ -1029,7 +1254,7 @@ async def generate_flow_diagram(request: FlowDiagramRequest):
             request.document_id,
             request.document_title
         )
-        return result
+        return ORJSONResponse(result.dict())
     except Exception as e:
         logger.error(f"Error generating flow diagram: {e}")
         raise HTTPException(status_code=500, detail="Flow diagram generation failed")
@@ -1044,7 +1269,7 @@ async def generate_api_call_graph(request: APICallGraphRequest):
             request.document_id,
             request.document_title
         )
-        return result
+        return ORJSONResponse(result.dict())
     except Exception as e:
         logger.error(f"Error generating API call graph: {e}")
         raise HTTPException(status_code=500, detail="API call graph generation failed")
@@ -1059,7 +1284,7 @@ async def generate_changelog(request: ChangelogRequest):
             request.document_id,
             request.document_title
         )
-        return result
+        return ORJSONResponse(result.dict())
     except Exception as e:
         logger.error(f"Error generating changelog: {e}")
         raise HTTPException(status_code=500, detail="Changelog generation failed")
@@ -31,6 +31,8 @@ class Settings(BaseSettings):
     # File Storage
     upload_dir: str = "uploads"
     max_file_size: int = 10 * 1024 * 1024  # 10MB
+    swagger_cache_dir: str = "swagger_cache"  # created owner-only (0o700) on first write
+    swagger_cache_max_files: int = 1000
     
     # GitHub Integration
     github_token: Optional[str] = None
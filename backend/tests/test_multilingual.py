@@ -0,0 +1,25 @@
+import ast
+from pathlib import Path
+
+MULTILINGUAL_SOURCE = Path(__file__).resolve().parent.parent / "api" / "routes" / "multilingual.py"
+
+
+def test_fallback_translation_tables_have_no_duplicate_keys():
+    """A dict literal silently keeps the last of any repeated key, so the check reads the source"""
+    module = ast.parse(MULTILINGUAL_SOURCE.read_text(encoding="utf-8"))
+    tables = next(
+        node.value for node in module.body
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name)
+        and node.target.id == "_RAW_FALLBACK_TRANSLATIONS"
+    )
+    
+    duplicates = []
+    for lang_pair, table in zip(tables.keys, tables.values):
+        keys = [key.value for key in table.keys]
+        seen = set()
+        for key in keys:
+            if key in seen:
+                duplicates.append(f"{ast.literal_eval(lang_pair)} {key!r}")
+            seen.add(key)
+    
+    assert not duplicates, f"Duplicate fallback translation keys: {', '.join(duplicates)}"